@@ -7,7 +7,8 @@ from faslr.analysis import AnalysisTab
 
 from faslr.connection import (
     get_startup_db_path,
-    populate_project_tree
+    populate_project_tree,
+    upgrade_db
 )
 
 from faslr.constants import (
@@ -24,16 +25,14 @@ from faslr.project import (
     ProjectTreeView
 )
 
+from faslr.project_model import ProjectTreeModel
+
 from faslr.style.main import (
     MAIN_WINDOW_HEIGHT,
     MAIN_WINDOW_WIDTH,
     MAIN_WINDOW_TITLE
 )
 
-from PyQt6.QtGui import (
-    QStandardItemModel
-)
-
 from PyQt6.QtCore import (
     QEvent,
     Qt,
@@ -53,6 +52,7 @@ from PyQt6.QtWidgets import (
 
 from shutil import copyfile
 
+from faslr.utilities import LoadingTab
 from faslr.utilities.sample import load_sample
 
 # Get OS information from the user.
@@ -115,10 +115,7 @@ class MainWindow(QMainWindow):
         self.project_pane = ProjectTreeView(parent=self)
         self.project_pane.setHeaderHidden(False)
 
-        self.project_model = QStandardItemModel()
-        self.project_model.setHorizontalHeaderLabels(["Project", "Project_UUID"])
-
-        self.project_root = self.project_model.invisibleRootItem()
+        self.project_model = ProjectTreeModel()
 
         self.project_pane.setModel(self.project_model)
 
@@ -191,6 +188,8 @@ class MainWindow(QMainWindow):
 
         # if a startup db is indicated, connect to it and populate the project tree with its contents
         if startup_db != "None":
+            upgrade_db(db_path=startup_db)
+
             populate_project_tree(
                 db_filename=startup_db,
                 main_window=self
@@ -201,8 +200,13 @@ class MainWindow(QMainWindow):
             index: int
     ) -> None:
         """
-        Deletes an open tab from the analysis pane.
+        Deletes an open tab from the analysis pane. Tabs that are still loading stop their background work.
         """
+        widget = self.analysis_pane.widget(index)
+
+        if isinstance(widget, LoadingTab):
+            widget.cancel()
+
         self.analysis_pane.removeTab(index)
 
     def closeEvent(
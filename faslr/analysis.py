@@ -332,18 +332,16 @@ class MackValuationModel(FAbstractTableModel):
             total=False
         ).z_critical
 
-        self._data = corr.to_frame(
+        frame = corr.to_frame(
             origin_as_datetime=False
         )
 
-        self._data = self._data.rename(index={min(self._data.index): 'Status'})
+        self.set_frame(data=frame.rename(index={min(frame.index): 'Status'}))
 
     def recalculate(self):
 
         self.calculate()
 
-        self.layoutChanged.emit() # noqa
-
 
 class MackValuationView(FTableView):
     def __init__(self):
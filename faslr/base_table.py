@@ -3,11 +3,14 @@ import io
 
 import pandas as pd
 
+from contextlib import contextmanager
+
 from faslr.grid_header import GridTableHeaderView
 
 from PyQt6.QtCore import (
     QAbstractTableModel,
     QEvent,
+    QModelIndex,
     Qt
 )
 
@@ -20,8 +23,17 @@ from PyQt6.QtWidgets import (
     QTableView
 )
 
+from typing import Iterator
+
 
 class FAbstractTableModel(QAbstractTableModel):
+    """
+    Table model of the DataFrame held in _data.
+
+    Subclasses tell their views about changes with the helpers below, i.e., dataChanged over just the cells that
+    changed, and begin/end calls around inserted or removed rows and columns, rather than with layoutChanged, so
+    that the views repaint only what changed and keep their selections and persistent indexes.
+    """
     def __init__(self):
         super().__init__()
 
@@ -45,6 +57,155 @@ class FAbstractTableModel(QAbstractTableModel):
 
         return self._data.shape[1]
 
+    def emit_data_changed(
+            self,
+            top: int = 0,
+            left: int = 0,
+            bottom: int = None,
+            right: int = None,
+            roles: list = None
+    ) -> None:
+        """
+        Notifies the views that the cells from (top, left) to (bottom, right) have changed, by default all cells. If
+        roles are given, only the data of those roles is read again.
+        """
+
+        if bottom is None:
+            bottom = self.rowCount() - 1
+
+        if right is None:
+            right = self.columnCount() - 1
+
+        if bottom < top or right < left:
+            return
+
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(top, left),
+            self.index(bottom, right),
+            roles or []
+        )
+
+    def emit_headers_changed(
+            self,
+            orientation: Qt.Orientation,
+            first: int = 0,
+            last: int = None
+    ) -> None:
+
+        if last is None:
+            if orientation == Qt.Orientation.Horizontal:
+                last = self.columnCount() - 1
+            else:
+                last = self.rowCount() - 1
+
+        if last < first:
+            return
+
+        # noinspection PyUnresolvedReferences
+        self.headerDataChanged.emit(
+            orientation,
+            first,
+            last
+        )
+
+    @contextmanager
+    def inserting_rows(
+            self,
+            first: int,
+            last: int
+    ) -> Iterator[None]:
+        """
+        Wraps the insertion of rows first to last, inclusive, which should be made to _data inside the with block.
+        """
+
+        self.beginInsertRows(QModelIndex(), first, last)
+        try:
+            yield
+        finally:
+            self.endInsertRows()
+
+    @contextmanager
+    def removing_rows(
+            self,
+            first: int,
+            last: int
+    ) -> Iterator[None]:
+
+        self.beginRemoveRows(QModelIndex(), first, last)
+        try:
+            yield
+        finally:
+            self.endRemoveRows()
+
+    @contextmanager
+    def inserting_columns(
+            self,
+            first: int,
+            last: int
+    ) -> Iterator[None]:
+
+        self.beginInsertColumns(QModelIndex(), first, last)
+        try:
+            yield
+        finally:
+            self.endInsertColumns()
+
+    @contextmanager
+    def removing_columns(
+            self,
+            first: int,
+            last: int
+    ) -> Iterator[None]:
+
+        self.beginRemoveColumns(QModelIndex(), first, last)
+        try:
+            yield
+        finally:
+            self.endRemoveColumns()
+
+    def set_frame(
+            self,
+            data: pd.DataFrame
+    ) -> None:
+        """
+        Replaces _data. A frame of the same shape is signaled as a change to every cell and header, otherwise the
+        model is reset.
+        """
+
+        if self._data is not None and self._data.shape == data.shape:
+            self._data = data
+
+            self.emit_data_changed()
+            self.emit_headers_changed(orientation=Qt.Orientation.Horizontal)
+            self.emit_headers_changed(orientation=Qt.Orientation.Vertical)
+        else:
+            self.beginResetModel()
+            self._data = data
+            self.endResetModel()
+
+    def reorder_columns(
+            self,
+            columns: list
+    ) -> None:
+        """
+        Rearranges the columns of _data into the given order, signaling a change to the columns that moved.
+        """
+
+        previous = list(self._data.columns)
+
+        self._data = self._data[columns]
+
+        moved = [i for i, (before, after) in enumerate(zip(previous, columns)) if before != after]
+
+        if moved:
+            self.emit_data_changed(left=moved[0], right=moved[-1])
+            self.emit_headers_changed(
+                orientation=Qt.Orientation.Horizontal,
+                first=moved[0],
+                last=moved[-1]
+            )
+
 
 class FTableView(QTableView):
     def __init__(self):
@@ -0,0 +1,93 @@
+# Times how long it takes to calculate a list of LDF averages, comparing one chainladder Development fit per
+# average with ldf_averages(), which calculates every average in one pass. Pass the number of origin periods of the
+# monthly triangle as the first argument, e.g.,
+# python -m faslr.benchmarks.ldf_average_benchmark 240
+
+import sys
+import time
+import warnings
+
+import chainladder as cl
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.aggregation import month_dates
+
+from faslr.utilities.ldf import (
+    ldf_averages,
+    link_arrays,
+    n_periods_mask,
+    window_starts
+)
+
+N_ORIGINS = 120
+
+# Averages supported by chainladder, and the numbers of periods to average over.
+AVERAGES = ['volume', 'simple', 'regression']
+N_PERIODS = [-1, 3, 5, 10, 20, 40]
+
+
+def make_triangle(
+        n_origins: int
+) -> cl.Triangle:
+    """
+    Monthly triangle with n_origins origin and development periods.
+    """
+
+    rng = np.random.default_rng(0)
+
+    origin, development = np.triu_indices(n_origins)
+    origin_keys = 2000 * 12 + origin
+
+    frame = pd.DataFrame({
+        'Origin': month_dates(origin_keys),
+        'Valuation': month_dates(2000 * 12 + development, end=True),
+        'Paid Loss': rng.gamma(2, 500, origin.size)
+    })
+
+    return cl.Triangle(
+        data=frame,
+        origin='Origin',
+        development='Valuation',
+        columns=['Paid Loss'],
+        cumulative=False
+    ).incr_to_cum()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_ORIGINS
+
+    warnings.simplefilter('ignore')
+
+    triangle = make_triangle(n_origins=n)
+    n_averages = len(AVERAGES) * len(N_PERIODS)
+
+    start = time.perf_counter()
+
+    for average in AVERAGES:
+        for n_periods in N_PERIODS:
+            cl.Development(
+                n_periods=n_periods,
+                average=average
+            ).fit(triangle)
+
+    slow = time.perf_counter() - start
+
+    start = time.perf_counter()
+
+    x, y = link_arrays(triangle=triangle)
+
+    ldf_averages(
+        x=x,
+        y=y,
+        included=np.ones(x.shape, dtype=bool),
+        windows=[
+            (average, window_starts(mask=n_periods_mask(triangle=triangle, n_periods=n_periods)))
+            for average in AVERAGES for n_periods in N_PERIODS
+        ]
+    )
+
+    fast = time.perf_counter() - start
+
+    print("{:>8} {:>10} {:>18} {:>18}".format("origins", "averages", "Development (s)", "ldf_averages (s)"))
+    print("{:>8} {:>10} {:>18.3f} {:>18.3f}".format(n, n_averages, slow, fast))
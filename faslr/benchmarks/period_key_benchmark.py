@@ -0,0 +1,92 @@
+# Times how long it takes to build a triangle from rows with integer period keys, comparing the Triangle
+# constructor, which parses the keys as dates row by row, with build_triangle(), which sums the rows into cells on
+# integer month keys first. Pass the number of rows as the first argument, e.g.,
+# python -m faslr.benchmarks.period_key_benchmark 5000000
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from chainladder import Triangle
+
+from faslr.utilities.aggregation import build_triangle
+
+N_ROWS = 1000000
+
+# Number of digits of the keys, i.e., years, YYYYQ quarters or YYYYMM months, and the number of periods per year.
+KEY_TYPES = {
+    'YYYY': 1,
+    'YYYYQ': 4,
+    'YYYYMM': 12
+}
+
+
+def make_rows(
+        n: int,
+        periods_per_year: int
+) -> pd.DataFrame:
+    """
+    Claim-level rows over ten accident years, each with a paid and reported amount.
+    """
+
+    rng = np.random.default_rng(0)
+
+    origin = rng.integers(0, 10 * periods_per_year, n)
+    development = np.minimum(origin + rng.integers(0, 10 * periods_per_year, n), 10 * periods_per_year - 1)
+
+    def keys(periods: np.ndarray) -> np.ndarray:
+        years = 2010 + periods // periods_per_year
+
+        if periods_per_year == 1:
+            return years
+        elif periods_per_year == 4:
+            return years * 10 + periods % 4 + 1
+        else:
+            return years * 100 + periods % 12 + 1
+
+    return pd.DataFrame({
+        'Accident Period': keys(periods=origin),
+        'Calendar Period': keys(periods=development),
+        'Paid Loss': rng.gamma(2, 500, n),
+        'Reported Loss': rng.gamma(2, 800, n)
+    })
+
+
+def time_build(
+        build,
+        data: pd.DataFrame
+) -> (float, Triangle):
+
+    start = time.perf_counter()
+
+    triangle = build(
+        data=data,
+        origin='Accident Period',
+        development='Calendar Period',
+        columns=['Paid Loss', 'Reported Loss'],
+        cumulative=False
+    )
+
+    return time.perf_counter() - start, triangle
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_ROWS
+
+    print("{:>8} {:>12} {:>18} {:>18}".format("keys", "rows", "Triangle (s)", "build_triangle (s)"))
+
+    for key_type, periods_per_year in KEY_TYPES.items():
+        data = make_rows(
+            n=n,
+            periods_per_year=periods_per_year
+        )
+
+        fast, _ = time_build(build=build_triangle, data=data)
+
+        # The Triangle constructor reads YYYYQ keys as months, so it only builds the same triangle for the other
+        # key types.
+        slow, _ = time_build(build=Triangle, data=data)
+
+        print("{:>8} {:>12,} {:>18.2f} {:>18.2f}".format(key_type, n, slow, fast))
@@ -0,0 +1,210 @@
+# Times how long it takes to load the project tree as the number of projects in the database grows. Compares the
+# original approach, which builds every node up front with one query per country and per state, with
+# ProjectTreeModel, which only reads the countries at startup and fetches the rest as nodes are expanded.
+
+import os
+import sys
+import tempfile
+import time
+import sqlalchemy as sa
+
+from faslr import schema
+from faslr.connection import (
+    connect_db,
+    dispose_engine
+)
+from faslr.project_item import ProjectItem
+from faslr.project_model import ProjectTreeModel
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    LocationTable,
+    ProjectTable,
+    StateTable
+)
+
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtGui import (
+    QColor,
+    QStandardItem,
+    QStandardItemModel
+)
+from PyQt6.QtWidgets import QApplication
+
+N_COUNTRIES = 5
+LOBS_PER_STATE = 4
+STATE_COUNTS = [10, 100, 500, 2000]
+
+
+def make_db(
+        db_path: str,
+        n_states: int
+) -> None:
+
+    engine = sa.create_engine('sqlite:///' + db_path)
+    schema.Base.metadata.create_all(engine)
+
+    locations = []
+    projects = []
+    countries = []
+    states = []
+    lobs = []
+
+    for country_id in range(1, N_COUNTRIES + 1):
+        locations.append({'location_id': country_id, 'hierarchy': 'country'})
+        projects.append({'project_id': 'country-%d' % country_id})
+        countries.append({
+            'country_id': country_id,
+            'country_name': 'Country %d' % country_id,
+            'location_id': country_id,
+            'project_id': 'country-%d' % country_id
+        })
+
+    for state_id in range(1, n_states + 1):
+        location_id = N_COUNTRIES + state_id
+        locations.append({'location_id': location_id, 'hierarchy': 'state'})
+        projects.append({'project_id': 'state-%d' % state_id})
+        states.append({
+            'state_id': state_id,
+            'state_name': 'State %d' % state_id,
+            'country_id': state_id % N_COUNTRIES + 1,
+            'location_id': location_id,
+            'project_id': 'state-%d' % state_id
+        })
+
+        for i in range(LOBS_PER_STATE):
+            lob_uuid = 'lob-%d-%d' % (state_id, i)
+            projects.append({'project_id': lob_uuid})
+            lobs.append({
+                'lob_type': 'LOB %d' % i,
+                'location_id': location_id,
+                'project_id': lob_uuid
+            })
+
+    with engine.begin() as connection:
+        for table, rows in [
+            (LocationTable, locations),
+            (ProjectTable, projects),
+            (CountryTable, countries),
+            (StateTable, states),
+            (LOBTable, lobs)
+        ]:
+            connection.execute(sa.insert(table.__table__), rows)
+
+    engine.dispose()
+
+
+def load_per_node(
+        session,
+        root: QStandardItem
+) -> None:
+    """
+    The original tree population, one query per country and per state.
+    """
+
+    countries = session.query(
+        CountryTable.country_id,
+        CountryTable.country_name,
+        CountryTable.project_id
+    ).all()
+
+    for country_id, country, country_uuid in countries:
+
+        country_item = ProjectItem(text=country, set_bold=True)
+
+        states = session.query(
+            StateTable.state_id,
+            StateTable.state_name,
+            StateTable.project_id
+        ).filter(StateTable.country_id == country_id)
+
+        for state_id, state, state_uuid in states:
+
+            state_item = ProjectItem(state)
+
+            lobs = session.query(
+                LOBTable.lob_type, LOBTable.project_id
+            ).join(LocationTable).join(StateTable).filter(StateTable.state_id == state_id)
+
+            for lob, lob_uuid in lobs:
+                state_item.appendRow([ProjectItem(lob, text_color=QColor(0, 77, 122)), QStandardItem(lob_uuid)])
+
+            country_item.appendRow([state_item, QStandardItem(state_uuid)])
+
+        root.appendRow([country_item, QStandardItem(country_uuid)])
+
+
+def time_eager(
+        db_path: str
+) -> float:
+
+    model = QStandardItemModel()
+    session, connection = connect_db(db_path=db_path)
+
+    start = time.perf_counter()
+    load_per_node(session=session, root=model.invisibleRootItem())
+    elapsed = time.perf_counter() - start
+
+    session.close()
+    connection.close()
+
+    return elapsed
+
+
+def expand_all(
+        model: ProjectTreeModel,
+        parent: QModelIndex = QModelIndex()
+) -> None:
+
+    if model.canFetchMore(parent):
+        model.fetchMore(parent)
+
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        if model.hasChildren(index):
+            expand_all(model=model, parent=index)
+
+
+def time_lazy(
+        db_path: str
+) -> (float, float):
+    """
+    Returns the time taken to show the top level of the tree, and to expand every node afterwards.
+    """
+
+    model = ProjectTreeModel()
+
+    start = time.perf_counter()
+    model.set_database(db_path=db_path)
+    model.fetchMore(QModelIndex())
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expand_all(model=model)
+    expansion = time.perf_counter() - start
+
+    return startup, expansion
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+
+    print("{:>8} {:>10} {:>14} {:>14} {:>16}".format(
+        "states", "projects", "eager (s)", "lazy top (s)", "lazy expand (s)"
+    ))
+
+    with tempfile.TemporaryDirectory() as directory:
+        for n_states in STATE_COUNTS:
+            path = os.path.join(directory, 'tree_%d.db' % n_states)
+            make_db(db_path=path, n_states=n_states)
+
+            eager = time_eager(db_path=path)
+            startup, expansion = time_lazy(db_path=path)
+
+            n_projects = N_COUNTRIES + n_states * (1 + LOBS_PER_STATE)
+
+            print("{:>8} {:>10} {:>14.4f} {:>14.4f} {:>16.4f}".format(
+                n_states, n_projects, eager, startup, expansion
+            ))
+
+            dispose_engine(db_path=path)
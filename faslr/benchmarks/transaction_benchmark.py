@@ -0,0 +1,73 @@
+# Times how long it takes to build a paid loss triangle from claim transactions, comparing a pandas groupby on
+# datetimes with aggregate_transactions(), which bins integer month keys with np.bincount. Pass the number of
+# transactions as the first argument, e.g., python -m faslr.benchmarks.transaction_benchmark 50000000
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.aggregation import aggregate_transactions
+
+N_TRANSACTIONS = 5000000
+ORIGIN_GRAIN = 'Annual'
+DEVELOPMENT_GRAIN = 'Quarterly'
+
+
+def make_transactions(
+        n: int
+) -> pd.DataFrame:
+
+    rng = np.random.default_rng(0)
+
+    loss = np.datetime64('2010-01-01') + rng.integers(0, 365 * 10, n).astype('timedelta64[D]')
+    report = loss + rng.integers(0, 365, n).astype('timedelta64[D]')
+    payment = report + rng.integers(0, 365 * 5, n).astype('timedelta64[D]')
+
+    return pd.DataFrame({
+        'claim_id': rng.integers(0, n // 5, n),
+        'loss_date': loss,
+        'report_date': report,
+        'payment_date': payment,
+        'paid': rng.gamma(2, 500, n)
+    })
+
+
+def groupby_triangle(
+        df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Straightforward pandas approach: period the dates, compute ages and group on them.
+    """
+
+    origin = df['loss_date'].dt.to_period('Y')
+    payment = df['payment_date'].dt.to_period('Q')
+    age = (payment - origin.dt.asfreq('Q', how='start')).apply(lambda offset: offset.n)
+
+    return df.groupby([origin, age])['paid'].sum().unstack().cumsum(axis=1)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N_TRANSACTIONS
+
+    data = make_transactions(n=n)
+
+    start = time.perf_counter()
+    aggregate_transactions(
+        loss_date=data['loss_date'],
+        transaction_date=data['payment_date'],
+        paid=data['paid'],
+        claim_id=data['claim_id'],
+        report_date=data['report_date'],
+        origin_grain=ORIGIN_GRAIN,
+        development_grain=DEVELOPMENT_GRAIN
+    )
+    bincount = time.perf_counter() - start
+
+    start = time.perf_counter()
+    groupby_triangle(df=data)
+    groupby = time.perf_counter() - start
+
+    print("{:>14} {:>14} {:>14}".format("transactions", "groupby (s)", "bincount (s)"))
+    print("{:>14,} {:>14.2f} {:>14.2f}".format(n, groupby, bincount))
@@ -2,30 +2,22 @@ from __future__ import annotations
 import configparser
 import logging
 import os
+import threading
 import faslr.schema as schema
+import faslr.utilities # noqa
 import sqlalchemy as sa
 
 from faslr.constants import (
     CONFIG_PATH,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
     QT_FILEPATH_OPTION
 )
 
-from faslr.schema import (
-    CountryTable,
-    LOBTable,
-    LocationTable,
-    StateTable,
-)
-
-from faslr.project_item import ProjectItem
-
 from PyQt6.QtCore import QEvent
 
-from PyQt6.QtGui import (
-    QColor,
-    QStandardItem
-)
-
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -37,15 +29,21 @@ from PyQt6.QtWidgets import (
 
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import Engine
-from sqlalchemy import event
 from sqlalchemy.orm.session import Session
 from sqlalchemy.engine.base import Connection
+from sqlalchemy.exc import IntegrityError
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from faslr.__main__ import MainWindow
     from faslr.menu import MainMenuBar
 
+# Engines and session factories are cached per database path, so that every part of the application that talks to
+# the same database shares a single connection pool.
+_engines = {}
+_session_factories = {}
+_registry_lock = threading.Lock()
+
 
 class ConnectionDialog(QDialog):
     """
@@ -106,13 +104,6 @@ class ConnectionDialog(QDialog):
         Creates a new backend database.
         """
 
-        # Enforce foreign key constraints for sqlite db
-        @event.listens_for(Engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            cursor = dbapi_connection.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
-
         filename = QFileDialog.getSaveFileName(
             parent=self,
             caption='SaveFile',
@@ -124,21 +115,19 @@ class ConnectionDialog(QDialog):
         db_filename = filename[0]
 
         if os.path.isfile(db_filename):
+            # Pooled connections to the old file must not outlive it.
+            dispose_engine(db_path=db_filename)
             os.remove(db_filename)
 
         if not db_filename == "":
-            engine = sa.create_engine(
-                'sqlite:///' + filename[0],
-                echo=True
-            )
+            engine = get_engine(db_path=db_filename)
 
             schema.Base.metadata.create_all(engine)
-            connection = engine.connect()
-            connection.close()
 
             self.close()
 
         if db_filename != "":
+            menu_bar.parent.project_model.set_database(db_path=db_filename)
             menu_bar.parent.connection_established = True
             menu_bar.toggle_project_actions()
 
@@ -160,6 +149,8 @@ class ConnectionDialog(QDialog):
 
         if not db_filename == "":
 
+            upgrade_db(db_path=db_filename)
+
             populate_project_tree(
                 db_filename=db_filename,
                 main_window=main_window
@@ -193,112 +184,142 @@ def populate_project_tree(
         main_window: MainWindow
 ) -> None:
     """
-    Upon connection to an existing database, populates the project tree in the left-hand pane of the
-    main window based on what projects have been saved to the database.
+    Upon connection to an existing database, points the project tree in the left-hand pane of the main window at
+    it. Projects are read from the database as the user expands the tree.
     """
 
-    # Open up the connection to the database
-    session, connection = connect_db(db_path=db_filename)
+    main_window.project_model.set_database(db_path=db_filename)
+
+    main_window.connection_established = True
+    main_window.db = db_filename
+    main_window.menu_bar.toggle_project_actions()
 
-    # Query all the countries
-    countries = session.query(
-        CountryTable.country_id,
-        CountryTable.country_name,
-        CountryTable.project_id
-    ).all()
 
-    # Append each row one at a time, brute force method. For each country, add state rows, and
-    # for each state, add LOB rows.
+class FaslrConnection:
+    """
+    Holds a session and a connection to a database, both drawn from the shared engine for that database. Use it as
+    a context manager, or call close() when done, so that the connections are returned to the pool.
+    """
+    def __init__(
+            self,
+            db_path: str
+    ):
 
-    for country_id, country, country_uuid in countries:
+        self.engine = get_engine(db_path=db_path)
 
-        country_item = ProjectItem(
-            text=country,
-            set_bold=True
-        )
+        self.session = get_session_factory(db_path=db_path)()
+        self.connection = self.engine.connect()
 
-        country_row = [
-            country_item,
-            QStandardItem(country_uuid)
-        ]
-
-        states = session.query(
-            StateTable.state_id,
-            StateTable.state_name,
-            StateTable.project_id
-        ).filter(
-            StateTable.country_id == country_id
-        )
+    def close(self) -> None:
 
-        for state_id, state, state_uuid in states:
+        self.session.close()
+        self.connection.close()
 
-            state_item = ProjectItem(
-                state,
-            )
+    def __enter__(self) -> FaslrConnection:
 
-            state_row = [state_item, QStandardItem(state_uuid)]
+        return self
 
-            lobs = session.query(
-                LOBTable.lob_type, LOBTable.project_id
-            ).join(
-                LocationTable
-            ).join(
-                StateTable
-            ).filter(
-                StateTable.state_id == state_id
-            )
+    def __exit__(
+            self,
+            exc_type,
+            exc_val,
+            exc_tb
+    ) -> None:
 
-            for lob, lob_uuid in lobs:
-                lob_item = ProjectItem(
-                    lob,
-                    text_color=QColor(0, 77, 122)
-                )
+        self.close()
 
-                lob_row = [lob_item, QStandardItem(lob_uuid)]
 
-                state_item.appendRow(lob_row)
+def get_engine(db_path: str) -> Engine:
+    """
+    Returns the engine for a database, creating it on first use. Each database gets one engine, and hence one
+    connection pool, for the lifetime of the application.
+    """
+    with _registry_lock:
+        engine = _engines.get(db_path)
 
-            country_item.appendRow(state_row)
+        if engine is None:
+            engine = sa.create_engine(
+                'sqlite:///' + db_path,
+                echo=DB_ECHO,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT,
+                # Pooled connections may be checked out by worker threads.
+                connect_args={'check_same_thread': False}
+            )
 
-        main_window.project_root.appendRow(country_row)
+            _engines[db_path] = engine
+            _session_factories[db_path] = sessionmaker(bind=engine)
 
-    main_window.project_pane.expandAll()
+    return engine
 
-    connection.close()
 
-    main_window.connection_established = True
-    main_window.db = db_filename
-    main_window.menu_bar.toggle_project_actions()
+def get_session_factory(db_path: str) -> sessionmaker:
+    """
+    Returns the session factory bound to the shared engine of a database.
+    """
+    get_engine(db_path=db_path)
 
+    return _session_factories[db_path]
 
-class FaslrConnection:
-    def __init__(
-            self,
-            db_path: str
-    ):
 
-        self.engine = sa.create_engine(
-            'sqlite:///' + db_path,
-            echo=True
-        )
+def dispose_engine(db_path: str) -> None:
+    """
+    Closes the pooled connections to a database and removes its engine from the registry.
+    """
+    with _registry_lock:
+        engine = _engines.pop(db_path, None)
+        _session_factories.pop(db_path, None)
 
-        self.session = sessionmaker(bind=self.engine)()
-        self.connection = self.engine.connect()
+    if engine is not None:
+        engine.dispose()
+
+
+def dispose_engines() -> None:
+    """
+    Disposes the engines of all databases, e.g., after the SQLite performance profile changes, so that their pragmas
+    are applied again to the connections opened afterwards.
+    """
+    with _registry_lock:
+        db_paths = list(_engines.keys())
+
+    for db_path in db_paths:
+        dispose_engine(db_path=db_path)
 
 
 def connect_db(db_path: str) -> (Session, Connection):
     """
-    Connects the db. Shortens amount of code required to do so.
+    Connects the db. Shortens amount of code required to do so. The caller is responsible for closing both the
+    session and the connection.
     """
-    engine = sa.create_engine(
-        'sqlite:///' + db_path,
-        echo=True
-    )
-    session = sessionmaker(bind=engine)()
-    connection = engine.connect()
+    session = get_session_factory(db_path=db_path)()
+    connection = get_engine(db_path=db_path).connect()
     return session, connection
 
 
+def upgrade_db(db_path: str) -> None:
+    """
+    Brings a database created by an earlier version of FASLR up to date with the current schema. Missing
+    tables are created, and any indexes that the existing tables lack are added to them.
+    """
+    engine = get_engine(db_path=db_path)
+
+    # create_all() skips tables that already exist, along with their indexes.
+    schema.Base.metadata.create_all(engine)
+
+    for table in schema.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with engine.begin() as connection:
+                    index.create(
+                        bind=connection,
+                        checkfirst=True
+                    )
+            except IntegrityError:
+                # A unique index cannot be built over data that already contains duplicates.
+                logging.warning("Could not create index %s, table %s has duplicate rows." % (index.name, table.name))
+
+
 def get_startup_db_path():
     """
     Extracts the db path when the user opts to connect to one automatically upon startup.
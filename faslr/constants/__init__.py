@@ -4,7 +4,26 @@ from faslr.constants.analysis import (
 )
 
 
+from faslr.constants.database import (
+    BULK_INSERT_BATCH_SIZE,
+    CELL_KEY_COLUMNS,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DEFAULT_SQLITE_PROFILE,
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FILE_EXTENSIONS,
+    IMPORT_PREVIEW_ROWS,
+    PROJECT_VIEW_COLUMNS,
+    PROJECT_VIEW_PAGE_SIZE,
+    SNAPSHOT_FORMAT_VERSION,
+    SQLITE_PROFILES,
+    VIEW_DATA_COLUMNS
+)
+
 from faslr.constants.development import (
+    HEATMAP_CACHE_SIZE,
     LDF_AVERAGES,
     TEMP_LDF_LIST
 )
@@ -33,7 +52,8 @@ from faslr.constants.general import (
     OCTICONS_PATH,
     QT_FILEPATH_OPTION,
     ROOT_PATH,
-    TEMPLATES_PATH
+    TEMPLATES_PATH,
+    TRIANGLE_CACHE_PATH
 )
 
 from faslr.constants.role import (
@@ -53,8 +73,14 @@ from faslr.constants.role import (
 
 from faslr.constants.triangle import (
     DEVELOPMENT_FIELDS,
+    GRAIN_CODES,
+    GRAIN_MONTHS,
     GRAINS,
     LOSS_FIELDS,
+    MODEL_CACHE_SIZE,
     ORIGIN_FIELDS,
-    TIME_FIELDS
+    PERIOD_KEY_GRAINS,
+    TIME_FIELDS,
+    TRIANGLE_CACHE_DISK_BYTES,
+    TRIANGLE_CACHE_SIZE
 )
@@ -0,0 +1,88 @@
+# Number of rows sent to the database per executemany call during bulk imports.
+BULK_INSERT_BATCH_SIZE = 50000
+
+# Number of rows read from an imported file at a time. Memory use of an import depends on this and on the number
+# of distinct triangle cells in the file, not on the size of the file.
+IMPORT_CHUNK_SIZE = 100000
+
+# Number of rows of an imported file shown in the import wizard.
+IMPORT_PREVIEW_ROWS = 5
+
+# File extensions accepted by the import wizard, by format. Parquet and Feather files are read with pyarrow, which is
+# optional, so they are only offered when it is installed.
+IMPORT_FILE_EXTENSIONS = {
+    'CSV': ['.csv'],
+    'Parquet': ['.parquet', '.pq'],
+    'Feather': ['.feather', '.arrow']
+}
+
+# Columns of the project_view_data table that can be populated from imported data.
+VIEW_DATA_COLUMNS = [
+    'accident_year',
+    'calendar_year',
+    'paid_loss',
+    'reported_loss',
+    'case_outstanding'
+]
+
+# Columns of the project_view_data table that identify a triangle cell within a view.
+CELL_KEY_COLUMNS = [
+    'accident_year',
+    'calendar_year'
+]
+
+# Columns of the project_view table listed in the data pane of a project, in display order. The pane can be
+# sorted on any of them.
+PROJECT_VIEW_COLUMNS = [
+    'view_id',
+    'name',
+    'description',
+    'created',
+    'modified'
+]
+
+# Number of views read from the database each time the data pane is scrolled to the bottom of its list.
+PROJECT_VIEW_PAGE_SIZE = 200
+
+# Layout version of the npz blobs in the project_view_snapshot table. Snapshots of another version are rebuilt from
+# the view's rows when the view is opened.
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Engine settings shared by every connection to a FASLR database. Set DB_ECHO to True to log each SQL statement.
+DB_ECHO = False
+
+DB_POOL_SIZE = 5
+
+DB_MAX_OVERFLOW = 10
+
+# Seconds to wait for a pooled connection before giving up.
+DB_POOL_TIMEOUT = 30
+
+# Named SQLite performance profiles. The active profile is chosen in the DATABASE section of faslr.ini, and its
+# pragmas are applied to every new connection. Individual pragmas can be overridden by keys of the same name in
+# that section.
+SQLITE_PROFILES = {
+    'Performance': {
+        # Readers do not block a writer (and vice versa) under write-ahead logging.
+        'journal_mode': 'WAL',
+        # Safe under WAL, only the last transactions may be lost on power failure.
+        'synchronous': 'NORMAL',
+        # Read up to 256 MiB of the database file through memory-mapped pages.
+        'mmap_size': 268435456,
+        # Negative values are in KiB, i.e., a 64 MiB page cache.
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+        # Milliseconds to wait on a locked database before raising an error.
+        'busy_timeout': 5000
+    },
+    'Standard': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'mmap_size': 0,
+        'cache_size': -2000,
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000
+    }
+}
+
+DEFAULT_SQLITE_PROFILE = 'Performance'
@@ -1,20 +1,30 @@
 import pandas as pd
 
 LDF_AVERAGES = {
-            # 'Geometric': 'geometric',
-            # 'Medial': 'medial',
+            'Geometric': 'geometric',
+            'Medial': 'medial',
             'Regression': 'regression',
             'Straight': 'simple',
             'Volume': 'volume'
 }
 
+# Number of exclusion states whose heatmap colors are kept by a FactorModel.
+HEATMAP_CACHE_SIZE = 16
+
 TEMP_LDF_LIST = pd.DataFrame(
     data=[
         [True, "All-year volume-weighted", "Volume", "9"],
         [False, "3-year volume-weighted", "Volume", "3"],
         [False, "5-year volume-weighted", "Volume", "5"],
+        [False, "All-year straight", "Straight", "9"],
+        [False, "3-year straight", "Straight", "3"],
+        [False, "5-year straight", "Straight", "5"],
+        [False, "All-year geometric", "Geometric", "9"],
+        [False, "3-year geometric", "Geometric", "3"],
+        [False, "5-year geometric", "Geometric", "5"],
+        [False, "All-year medial", "Medial", "9"],
+        [False, "5-year medial", "Medial", "5"],
+        [False, "All-year regression", "Regression", "9"],
     ],
     columns=["Selected", "Label", "Type", "Number of Years"]
 )
-
-
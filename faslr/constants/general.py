@@ -32,6 +32,9 @@ ISSUES_URL = 'https://github.com/casact/FASLR/issues'
 
 OCTICONS_PATH = os.path.join(dirname(dirname(os.path.realpath(__file__))), 'style/icons/octicons/')
 
+# Default location of the on-disk triangle cache, which is enabled in the CACHE section of faslr.ini.
+TRIANGLE_CACHE_PATH = os.path.join(ROOT_PATH, 'cache', 'triangles')
+
 
 repo = git.Repo(search_parent_directories=True)
 
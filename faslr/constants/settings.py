@@ -1,4 +1,5 @@
 SETTINGS_LIST = [
     "Startup",
-    "User"
+    "User",
+    "Database"
 ]
\ No newline at end of file
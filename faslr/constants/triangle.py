@@ -28,3 +28,36 @@ GRAINS = [
     'Quarterly',
     'Monthly'
 ]
+
+# Number of months spanned by a period of each grain.
+GRAIN_MONTHS = {
+    'Annual': 12,
+    'Semi-Annual': 6,
+    'Quarterly': 3,
+    'Monthly': 1
+}
+
+# Grain codes used by chainladder, e.g., in Triangle.grain('OYDQ').
+GRAIN_CODES = {
+    'Annual': 'Y',
+    'Semi-Annual': 'S',
+    'Quarterly': 'Q',
+    'Monthly': 'M'
+}
+
+# Grain of integer period keys stored in the project_view_data table, by number of digits, e.g., 2008 for a year,
+# 20081 for the first quarter of 2008 and 200801 for January 2008.
+PERIOD_KEY_GRAINS = {
+    4: 'Annual',
+    5: 'Quarterly',
+    6: 'Monthly'
+}
+
+# Number of built triangles kept in memory, so that reopening a view or sample does not build it again.
+TRIANGLE_CACHE_SIZE = 32
+
+# Number of fitted estimators kept in memory, so that refitting one to the same triangle returns the earlier fit.
+MODEL_CACHE_SIZE = 64
+
+# Size limit of the optional on-disk triangle cache, beyond which the least recently used files are removed.
+TRIANGLE_CACHE_DISK_BYTES = 256 * 1024 * 1024
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from chainladder import Triangle
 import datetime as dt
+import logging
 import numpy as np
+import os
 import pandas as pd
 
 from faslr.analysis import AnalysisTab
@@ -18,21 +20,57 @@ from faslr.connection import (
 
 from faslr.constants import (
     DEVELOPMENT_FIELDS,
+    GRAIN_CODES,
+    GRAIN_MONTHS,
     GRAINS,
     ICONS_PATH,
     LOSS_FIELDS,
     ORIGIN_FIELDS,
-    QT_FILEPATH_OPTION
+    PROJECT_VIEW_COLUMNS,
+    QT_FILEPATH_OPTION,
+    VIEW_DATA_COLUMNS
 )
 
-from faslr.utilities import open_item_tab
+from faslr.utilities import (
+    LoadingTab,
+    open_item_tab
+)
+
+from faslr.utilities.aggregation import (
+    build_triangle,
+    month_dates
+)
+
+from faslr.utilities.cache import get_triangle_cache
+
+from faslr.utilities.importer import (
+    aggregate_file,
+    file_dialog_filter,
+    read_preview
+)
+
+from faslr.utilities.queries import (
+    bulk_insert_view_data,
+    count_project_views,
+    fetch_project_views,
+    fetch_view_cells,
+    fetch_view_rows,
+    fetch_view_snapshot,
+    save_view_snapshot,
+    view_period_grains
+)
+
+from faslr.utilities.workers import (
+    Worker,
+    start_worker
+)
 
 from faslr.schema import (
-    ProjectViewTable,
-    ProjectViewData
+    ProjectViewTable
 )
 
 from PyQt6.QtCore import (
+    QDate,
     QModelIndex,
     Qt
 )
@@ -44,6 +82,7 @@ from PyQt6.QtGui import (
 
 from PyQt6.QtWidgets import (
     QComboBox,
+    QDateEdit,
     QDialogButtonBox,
     QFileDialog,
     QFormLayout,
@@ -53,6 +92,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMenu,
+    QProgressBar,
     QPushButton,
     QRadioButton,
     QTabWidget,
@@ -68,6 +108,7 @@ from typing import (
 
 if TYPE_CHECKING:
     from faslr.__main__ import MainWindow
+    from sqlalchemy.orm import Session
 
 # Starting contents of data preview when no files have been uploaded yet
 dummy_df = pd.DataFrame(
@@ -80,24 +121,299 @@ dummy_df = pd.DataFrame(
 )
 
 
-data_views_df = pd.DataFrame(
-    data={
-        'View Id': [],
-        'Name': [],
-        'Description': [],
-        'Created': [],
-        'Modified': [],
-        # 'Origin': [],
-        # 'Development': [],
-        # 'Columns': [],
-        # 'Cumulative': [],
-        # 'Project ID': []
-    }
-)
+# Column headers of the list of data views in the data pane, one for each of PROJECT_VIEW_COLUMNS
+PROJECT_VIEW_HEADERS = [
+    'View Id',
+    'Name',
+    'Description',
+    'Created',
+    'Modified'
+]
+
+# Date filters offered in the data pane, and the project_view column each applies to.
+VIEW_DATE_FILTERS = {
+    'Any date': None,
+    'Created': 'created',
+    'Modified': 'modified'
+}
 
 COMBO_BOX_STARTING_WIDTH = 120
 
 
+def load_view_page(
+        db_path: str,
+        project_id: str,
+        sort_column: str,
+        descending: bool,
+        name_filter: str,
+        offset: int,
+        count: bool = False,
+        created_range: tuple = None,
+        modified_range: tuple = None
+) -> (int, pd.DataFrame):
+    """
+    Reads one page of a project's views for ProjectDataModel. Runs on a worker thread. If count is True, also
+    counts the views that match the filter, otherwise None is returned in place of the count.
+    """
+
+    with FaslrConnection(db_path=db_path) as fc:
+        if count:
+            total = count_project_views(
+                session=fc.session,
+                project_id=project_id,
+                name_filter=name_filter,
+                created_range=created_range,
+                modified_range=modified_range
+            )
+        else:
+            total = None
+
+        rows = fetch_project_views(
+            session=fc.session,
+            project_id=project_id,
+            sort_column=sort_column,
+            descending=descending,
+            name_filter=name_filter,
+            created_range=created_range,
+            modified_range=modified_range,
+            offset=offset
+        )
+
+    page = pd.DataFrame(
+        data=[tuple(row) for row in rows],
+        columns=PROJECT_VIEW_HEADERS
+    )
+
+    return total, page
+
+
+def build_view_triangle(
+        session: Session,
+        view_id: int,
+        origin_grain: str = None,
+        development_grain: str = None
+) -> Triangle:
+    """
+    Builds the triangle of a view from its rows, optionally at a coarser origin and development grain than the one
+    it was stored at. The cells are summed to the requested grain by the database, so the raw rows are never read
+    into Python.
+    """
+
+    cumulative = session.query(
+        ProjectViewTable.cumulative
+    ).filter(
+        ProjectViewTable.view_id == view_id
+    ).scalar()
+
+    # Views saved before the flag was recorded were all cumulative.
+    cumulative = cumulative is not False
+
+    if view_period_grains(session=session, view_id=view_id) is None:
+        return build_dated_view_triangle(
+            session=session,
+            view_id=view_id,
+            origin_grain=origin_grain,
+            development_grain=development_grain,
+            cumulative=cumulative
+        )
+
+    rows = fetch_view_cells(
+        session=session,
+        view_id=view_id,
+        origin_grain=origin_grain,
+        development_grain=development_grain,
+        cumulative=cumulative
+    )
+
+    cells = np.array(
+        [tuple(row) for row in rows],
+        dtype=float
+    ).reshape(-1, 4)
+
+    df = pd.DataFrame({
+        'Accident Year': month_dates(cells[:, 0].astype(np.int64)),
+        'Calendar Year': month_dates(cells[:, 1].astype(np.int64), end=True),
+        'Paid Loss': cells[:, 2],
+        'Reported Loss': cells[:, 3]
+    })
+
+    triangle = Triangle(
+        data=df,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Loss', 'Reported Loss'],
+        cumulative=cumulative
+    )
+
+    return triangle
+
+
+def build_dated_view_triangle(
+        session: Session,
+        view_id: int,
+        origin_grain: str = None,
+        development_grain: str = None,
+        cumulative: bool = True
+) -> Triangle:
+    """
+    Builds the triangle of a view whose periods are stored as dates, e.g., 1995-01-01, rather than integer period
+    keys. Chainladder parses the dates and infers the grains, and the triangle is then summed to the requested grain.
+    """
+
+    df = pd.DataFrame(
+        data=[tuple(row) for row in fetch_view_rows(session=session, view_id=view_id)],
+        columns=[
+            'Accident Year',
+            'Calendar Year',
+            'Paid Loss',
+            'Reported Loss'
+        ]
+    )
+
+    triangle = Triangle(
+        data=df,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Loss', 'Reported Loss'],
+        cumulative=cumulative
+    )
+
+    if origin_grain is None and development_grain is None:
+        return triangle
+
+    stored_origin_grain, stored_development_grain = triangle_grains(triangle=triangle)
+
+    origin_grain = origin_grain or stored_origin_grain
+    development_grain = development_grain or stored_development_grain
+
+    if GRAIN_MONTHS[origin_grain] < GRAIN_MONTHS[stored_origin_grain] or \
+            GRAIN_MONTHS[development_grain] < GRAIN_MONTHS[stored_development_grain]:
+        raise ValueError("A view cannot be opened at a finer grain than it was stored at.")
+
+    return triangle.grain('O' + GRAIN_CODES[origin_grain] + 'D' + GRAIN_CODES[development_grain])
+
+
+def triangle_grains(
+        triangle: Triangle
+) -> (str, str):
+    """
+    Returns the names of the origin and development grains of a triangle, e.g., ('Annual', 'Quarterly').
+    """
+
+    names = {code: grain for grain, code in GRAIN_CODES.items()}
+
+    return names[triangle.origin_grain], names[triangle.development_grain]
+
+
+def write_view(
+        db_path: str,
+        view: dict,
+        data: pd.DataFrame,
+        progress_callback=None,
+        cancelled=None
+) -> (int, int, float) | None:
+    """
+    Saves a new view with its cells, along with the snapshot of its triangle, in one transaction. Runs on a worker
+    thread. Nothing is saved if the import is cancelled before the transaction is committed.
+
+    Returns the view id, the number of rows written and the rows written per second.
+    """
+
+    with FaslrConnection(db_path=db_path) as fc:
+
+        project_view = ProjectViewTable(**view)
+
+        fc.session.add(project_view)
+        fc.session.flush()
+
+        view_id = project_view.view_id
+
+        n_rows, rows_per_second = bulk_insert_view_data(
+            connection=fc.session.connection(),
+            data=data,
+            view_id=view_id,
+            progress_callback=progress_callback
+        )
+
+        # Store the finished triangle too, so that opening the view does not have to rebuild it.
+        save_view_snapshot(
+            session=fc.session,
+            view_id=view_id,
+            triangle=build_view_triangle(
+                session=fc.session,
+                view_id=view_id
+            )
+        )
+
+        if cancelled is not None and cancelled():
+            fc.session.rollback()
+            return None
+
+        fc.session.commit()
+
+    return view_id, n_rows, rows_per_second
+
+
+def load_triangle(
+        db_path: str,
+        view_id: int,
+        origin_grain: str = None,
+        development_grain: str = None
+) -> Triangle:
+    """
+    Loads the triangle of a view. Runs on a worker thread.
+
+    Triangles are cached by view and modified timestamp, so reopening a view is served from the triangle cache. At
+    the stored grain, the triangle is otherwise decompressed from the view's snapshot. Views without a snapshot,
+    such as those saved by earlier versions, are built from their rows and given one. Other grains are always built
+    from the rows.
+    """
+
+    with FaslrConnection(db_path=db_path) as fc:
+
+        modified = fc.session.query(
+            ProjectViewTable.modified
+        ).filter(
+            ProjectViewTable.view_id == view_id
+        ).scalar()
+
+        def build() -> Triangle:
+
+            if origin_grain is not None or development_grain is not None:
+                return build_view_triangle(
+                    session=fc.session,
+                    view_id=view_id,
+                    origin_grain=origin_grain,
+                    development_grain=development_grain
+                )
+
+            triangle = fetch_view_snapshot(
+                session=fc.session,
+                view_id=view_id
+            )
+
+            if triangle is None:
+                triangle = build_view_triangle(
+                    session=fc.session,
+                    view_id=view_id
+                )
+
+                save_view_snapshot(
+                    session=fc.session,
+                    view_id=view_id,
+                    triangle=triangle
+                )
+
+                fc.session.commit()
+
+            return triangle
+
+        return get_triangle_cache().get_or_build(
+            key=('view', os.path.abspath(db_path), view_id, modified, origin_grain, development_grain),
+            build=build
+        )
+
+
 class DataPane(QWidget):
     """
     Holds links to data views uploaded from the user.
@@ -117,19 +433,47 @@ class DataPane(QWidget):
 
         self.layout = QVBoxLayout()
         self.upload_btn = QPushButton("Upload")
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter views")
         self.setLayout(self.layout)
 
-        # Keep the upload button in the upper right-hand corner
-        self.layout.addWidget(
-            self.upload_btn,
-            alignment=Qt.AlignmentFlag.AlignRight
-        )
+        # Views can also be filtered on the date they were created or modified.
+        self.date_column_box = QComboBox()
+        self.date_column_box.addItems(VIEW_DATE_FILTERS)
+        self.date_from = QDateEdit(QDate.currentDate().addYears(-1))
+        self.date_to = QDateEdit(QDate.currentDate())
+
+        for date_edit in [self.date_from, self.date_to]:
+            date_edit.setCalendarPopup(True)
+            date_edit.setEnabled(False)
+
+        # Keep the upload button in the upper right-hand corner, next to the filter box
+        self.button_layout = QHBoxLayout()
+        self.button_layout.addWidget(self.filter_edit)
+        self.button_layout.addWidget(self.date_column_box)
+        self.button_layout.addWidget(self.date_from)
+        self.button_layout.addWidget(QLabel("to"))
+        self.button_layout.addWidget(self.date_to)
+        self.button_layout.addStretch()
+        self.button_layout.addWidget(self.upload_btn)
+        self.layout.addLayout(self.button_layout)
 
         self.data_view = ProjectDataView(parent=self)
         self.data_model = ProjectDataModel(parent=self)
         self.data_view.setModel(self.data_model)
         self.layout.addWidget(self.data_view)
 
+        # Sorting and filtering are passed on to the database by the model
+        self.data_view.horizontalHeader().setSortIndicator(
+            0,
+            Qt.SortOrder.AscendingOrder
+        )
+        self.data_view.setSortingEnabled(True)
+        self.filter_edit.returnPressed.connect(self.apply_filter) # noqa
+        self.date_column_box.currentTextChanged.connect(self.apply_filter) # noqa
+        self.date_from.dateChanged.connect(self.apply_filter) # noqa
+        self.date_to.dateChanged.connect(self.apply_filter) # noqa
+
         self.data_view.doubleClicked.connect(self.data_view.open_triangle) # noqa
 
         self.data_view.horizontalHeader().setSectionResizeMode(
@@ -141,6 +485,21 @@ class DataPane(QWidget):
         self.layout.addWidget(filler)
         self.upload_btn.pressed.connect(self.start_wizard)  # noqa
 
+    def apply_filter(self) -> None:
+
+        date_column = VIEW_DATE_FILTERS[self.date_column_box.currentText()]
+
+        for date_edit in [self.date_from, self.date_to]:
+            date_edit.setEnabled(date_column is not None)
+
+        date_range = (self.date_from.date().toPyDate(), self.date_to.date().toPyDate())
+
+        self.data_model.set_filter(
+            name_filter=self.filter_edit.text(),
+            created_range=date_range if date_column == 'created' else None,
+            modified_range=date_range if date_column == 'modified' else None
+        )
+
     def start_wizard(self) -> None:
         self.wizard = DataImportWizard(parent=self)
         self.wizard.show()
@@ -150,30 +509,44 @@ class DataPane(QWidget):
             name: str,
             desc: str,
             triangle: Triangle
-    ) -> None:
+    ) -> Worker:
+        """
+        Saves the imported data as a new view in the background. Returns the worker, so that the import wizard can
+        follow its progress.
+        """
 
         created = dt.datetime.today()
         modified = dt.datetime.today()
 
         self.triangle = triangle
-        self.data = self.wizard.args_tab.data
+        self.data = self.wizard.cells
 
-        view_id = self.save_to_db(
+        worker = self.save_to_db(
             name=name,
             description=desc,
             created=created,
             modified=modified
         )
 
-        test_record = [
-            view_id,
-            name,
-            desc,
-            created,
-            modified
-        ]
+        worker.signals.finished.connect(self.finish_record) # noqa
+
+        return worker
+
+    def finish_record(
+            self,
+            result: (int, int, float)
+    ) -> None:
 
-        self.data_model.add_record(record=test_record)
+        view_id, n_rows, rows_per_second = result
+
+        self.report_progress(
+            rows_written=n_rows,
+            total_rows=n_rows,
+            rows_per_second=rows_per_second
+        )
+
+        # The new view is read back at its place in the current sort order, if it passes the filter.
+        self.data_model.reload()
 
     def save_to_db(
             self,
@@ -181,11 +554,13 @@ class DataPane(QWidget):
             description: str,
             created,
             modified,
-    ):
-
-        faslr_conn = FaslrConnection(db_path=self.main_window.db)
+    ) -> Worker:
+        """
+        Writes the imported cells and the snapshot of their triangle to the database on a worker thread, which emits
+        the view id, the number of rows written and the rows written per second when it is done.
+        """
 
-        project_view = ProjectViewTable(
+        view = dict(
             name=name,
             description=description,
             created=created,
@@ -197,43 +572,41 @@ class DataPane(QWidget):
             project_id=self.project_id
         )
 
-        faslr_conn.session.add(project_view)
-
-        faslr_conn.session.flush()
-        view_id = project_view.view_id
-
+        # The cells hold the origin, development and value columns, in the order of the table columns
         data = self.data.copy()
+        data.columns = VIEW_DATA_COLUMNS[:data.shape[1]]
+
+        worker = Worker(
+            write_view,
+            db_path=self.main_window.db,
+            view=view,
+            data=data,
+            report_progress=True
+        )
 
-        data.columns = [
-            'accident_year',
-            'calendar_year',
-            'paid_loss',
-            'reported_loss'
-        ]
-
-        data['view_id'] = view_id
-        #
-        # data.to_sql(
-        #     name='project_view_data',
-        #     con=connection,
-        #     index=False,
-        #     if_exists='append'
-        # )
+        worker.signals.progress.connect(self.report_progress) # noqa
 
-        data_list = data.to_dict('records')
+        return start_worker(worker=worker)
 
-        obj_list = []
-        for record in data_list:
-            data_obj = ProjectViewData(**record)
-            obj_list.append(data_obj)
+    def report_progress(
+            self,
+            rows_written: int,
+            total_rows: int,
+            rows_per_second: float = None
+    ) -> None:
+        """
+        Shows the progress of a data import in the status bar of the main window.
+        """
 
-        faslr_conn.session.add_all(obj_list)
+        if self.main_window is None:
+            return
 
-        faslr_conn.session.commit()
+        message = "Imported {:,} of {:,} rows".format(rows_written, total_rows)
 
-        faslr_conn.connection.close()
+        if rows_per_second is not None:
+            message += " ({:,.0f} rows/s)".format(rows_per_second)
 
-        return view_id
+        self.main_window.statusBar().showMessage(message)
 
 
 class DataImportWizard(QWidget):
@@ -250,6 +623,11 @@ class DataImportWizard(QWidget):
         self.setWindowTitle("Import Wizard")
         self.triangle = None
 
+        # Cells summed from the whole file, and the file and mapping they were read with
+        self.cells = None
+        self.cells_key = None
+        self.worker = None
+
         self.parent = parent
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -289,33 +667,163 @@ class DataImportWizard(QWidget):
         self.button_box.accepted.connect(self.accept_import)  # noqa
         self.button_box.rejected.connect(self.reject_import)  # noqa
 
+        # Shows how much of the file has been read while it is being imported
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.hide()
+
+        self.layout.addWidget(self.progress_bar)
         self.layout.addWidget(self.button_box)
 
+    def read_cells(
+            self,
+            on_finished
+    ) -> None:
+        """
+        Streams the uploaded file in the background, summing it into one row per triangle cell, then calls
+        on_finished. The cells are kept, so the file is only read again if it or the header mapping changes.
+        """
+
+        dropdowns = self.args_tab.dropdowns
+        file_path = self.args_tab.file_path.text()
+
+        try:
+            file_stat = os.stat(file_path)
+            # A file changed on disk under the same name is read again.
+            file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            file_version = None
+
+        key = (
+            file_path,
+            dropdowns['origin'].currentText(),
+            dropdowns['development'].currentText(),
+            tuple(self.preview_tab.get_columns()),
+            file_version
+        )
+
+        if key == self.cells_key:
+            on_finished()
+            return
+
+        if self.worker is not None:
+            self.worker.cancel()
+
+        self.cells = None
+        self.cells_key = None
+
+        self.worker = Worker(
+            aggregate_file,
+            file_path=key[0],
+            origin=key[1],
+            development=key[2],
+            values=list(key[3]),
+            report_progress=True
+        )
+
+        self.worker.signals.progress.connect(self.update_progress) # noqa
+        self.worker.signals.finished.connect( # noqa
+            lambda result: self.store_cells(
+                result=result,
+                key=key,
+                on_finished=on_finished
+            )
+        )
+        self.worker.signals.error.connect(self.show_error) # noqa
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Reading file... %p%")
+        self.progress_bar.show()
+        self.button_box.setEnabled(False)
+
+        start_worker(worker=self.worker)
+
+    def update_progress(
+            self,
+            done: int,
+            total: int
+    ) -> None:
+        """
+        Shows the bytes of the file read so far, or the rows written to the database, out of the total.
+        """
+
+        if total:
+            self.progress_bar.setValue(int(100 * done / total))
+
+    def store_cells(
+            self,
+            result: (pd.DataFrame, int, int),
+            key: tuple,
+            on_finished
+    ) -> None:
+
+        self.worker = None
+        self.progress_bar.hide()
+        self.button_box.setEnabled(True)
+
+        cells, n_rows, n_dropped = result
+
+        self.cells = cells
+        self.cells_key = key
+
+        if self.parent and self.parent.main_window:
+            message = "Read {:,} rows into {:,} cells".format(n_rows, cells.shape[0])
+
+            if n_dropped:
+                message += ", {:,} rows without an origin or development period were skipped".format(n_dropped)
+
+            self.parent.main_window.statusBar().showMessage(message)
+
+        on_finished()
+
+    def show_error(
+            self,
+            message: str
+    ) -> None:
+
+        self.worker = None
+        self.button_box.setEnabled(True)
+        self.progress_bar.setFormat("Unable to import the file.")
+        logging.error(message)
+
     def accept_import(self) -> None:
         """
         Accept the configuration, import the triangle into the data store, and exit.
         """
 
-        if self.parent:
-            # Add metadata to data pane view
-            self.preview_tab.generate_triangle()
-            triangle = self.triangle
-            self.parent.add_record(
-                name=self.args_tab.name_line.text(),
-                desc=self.args_tab.desc_edit.toPlainText(),
-                triangle=triangle
-            )
+        if self.parent and self.args_tab.data is not None:
+            self.read_cells(on_finished=self.finish_import)
+        else:
             self.close()
 
-        self.close()
+    def finish_import(self) -> None:
+
+        # Add metadata to data pane view
+        self.preview_tab.generate_triangle()
+        triangle = self.triangle
+        self.worker = self.parent.add_record(
+            name=self.args_tab.name_line.text(),
+            desc=self.args_tab.desc_edit.toPlainText(),
+            triangle=triangle
+        )
+
+        # The wizard stays open, showing how many rows have been written, until the view is saved.
+        self.worker.signals.progress.connect(self.update_progress) # noqa
+        self.worker.signals.finished.connect(lambda result: self.close()) # noqa
+        self.worker.signals.error.connect(self.show_error) # noqa
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Saving view... %p%")
+        self.progress_bar.show()
+        self.button_box.setEnabled(False)
 
     def reject_import(self) -> None:
         """
         Cancel import and close the dialog box.
         """
 
-        if self.parent:
-            self.close()
+        if self.worker is not None:
+            self.worker.cancel()
 
         self.close()
 
@@ -334,7 +842,7 @@ class ImportArgumentsTab(QWidget):
         self.setWindowTitle("Import Wizard")
         self.parent = parent
 
-        # Holds the uploaded dataframe
+        # Holds the first rows of the uploaded file, the whole file is only read when the triangle is built
         self.data = None
         self.triangle = None
 
@@ -532,7 +1040,7 @@ class ImportArgumentsTab(QWidget):
         filename = QFileDialog.getOpenFileName(
             parent=self,
             caption='Open File',
-            filter='CSV (*.csv)',
+            filter=file_dialog_filter(),
             options=QT_FILEPATH_OPTION
         )[0]
 
@@ -548,7 +1056,7 @@ class ImportArgumentsTab(QWidget):
 
         self.upload_sample_view.resizeColumnsToContents()
 
-        self.data = pd.read_csv(filename)
+        self.data = self.upload_sample_model._data
         columns = self.data.columns
 
         # Resize mapping dropdowns to fit contents
@@ -636,14 +1144,7 @@ class ImportArgumentsTab(QWidget):
 
         self.file_path.clear()
         self.data = None
-        self.upload_sample_model._data = dummy_df
-        index = QModelIndex()
-        self.upload_sample_model.setData(
-            index=index,
-            value=None,
-            role=Qt.ItemDataRole.DisplayRole,
-            refresh=True
-        )
+        self.upload_sample_model.set_frame(data=dummy_df)
 
         n_dropdowns = len(self.dropdowns.keys())
         if n_dropdowns > 3:
@@ -704,18 +1205,7 @@ class UploadSampleModel(FAbstractTableModel):
             self,
             file_path: str
     ):
-        df = pd.read_csv(file_path)
-
-        self._data = df.head()
-
-        index = QModelIndex()
-
-        self.setData(
-            index=index,
-            value=None,
-            role=Qt.ItemDataRole.DisplayRole,
-            refresh=True
-        )
+        self.set_frame(data=read_preview(file_path=file_path))
 
     def setData(
             self,
@@ -725,7 +1215,9 @@ class UploadSampleModel(FAbstractTableModel):
             refresh: bool = False
     ):
 
-        self.layoutChanged.emit()  # noqa
+        self.emit_data_changed()
+
+        return True
 
 
 class UploadSampleView(FTableView):
@@ -784,6 +1276,12 @@ class TrianglePreviewTab(QWidget):
         # Removes the previous triangle when arguments are changed
         self.clear_layout()
 
+        self.parent.read_cells(on_finished=self.show_triangle)
+
+    def show_triangle(self) -> None:
+
+        self.clear_layout()
+
         self.generate_triangle()
 
         self.analysis_tab = AnalysisTab(
@@ -804,8 +1302,9 @@ class TrianglePreviewTab(QWidget):
         else:
             self.cumulative = False
 
-        self.parent.triangle = Triangle(
-            data=self.sibling.data,
+        # Integer year, quarter and month keys are summed into cells before the triangle is built.
+        self.parent.triangle = build_triangle(
+            data=self.parent.cells,
             origin=self.dropdowns['origin'].currentText(),
             development=self.sibling.dropdowns['development'].currentText(),
             columns=self.columns,
@@ -818,7 +1317,7 @@ class TrianglePreviewTab(QWidget):
         for key in self.sibling.dropdowns:
 
             if 'values' in key:
-                columns.append(self.dropdowns[key].currentText())
+                columns.append(self.sibling.dropdowns[key].currentText())
 
         return columns
 
@@ -834,6 +1333,12 @@ class TrianglePreviewTab(QWidget):
 
 
 class ProjectDataModel(FAbstractTableModel):
+    """
+    Lists the data views of the project shown in a DataPane. Views are read from the database one page at a time,
+    as the table is scrolled, and sorting and filtering are done by the database, so opening a project does not
+    depend on how many views the database holds in total. Pages are read by background workers and inserted when
+    they arrive.
+    """
     def __init__(
             self,
             parent: DataPane = None
@@ -842,11 +1347,164 @@ class ProjectDataModel(FAbstractTableModel):
 
         self.parent = parent
 
-        fc = FaslrConnection(db_path=self.parent.main_window.db)
-        df = pd.read_sql_table('project_view', con=fc.connection)
-        df = df[['view_id', 'name', 'description', 'created', 'modified']]
-        df.columns = ['View Id', 'Name', 'Description', 'Created', 'Modified']
-        self._data = df
+        self._data = pd.DataFrame(columns=PROJECT_VIEW_HEADERS)
+
+        self.sort_column = 'view_id'
+        self.descending = False
+        self.name_filter = None
+        self.created_range = None
+        self.modified_range = None
+        # Number of views of the project that match the filter.
+        self.total = 0
+        # Worker reading the next page, None when no page is being read.
+        self.worker = None
+
+        self.reload()
+
+    def reload(self) -> None:
+        """
+        Discards the loaded views and reads the first page again, e.g., after the sort order or filter changes.
+        """
+
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+        self.beginResetModel()
+        self._data = pd.DataFrame(columns=PROJECT_VIEW_HEADERS)
+        self.total = 0
+        self.endResetModel()
+
+        self.request_page(count=True)
+
+    def request_page(
+            self,
+            count: bool = False
+    ) -> None:
+
+        self.worker = Worker(
+            load_view_page,
+            db_path=self.parent.main_window.db,
+            project_id=self.parent.project_id,
+            sort_column=self.sort_column,
+            descending=self.descending,
+            name_filter=self.name_filter,
+            created_range=self.created_range,
+            modified_range=self.modified_range,
+            offset=self._data.shape[0],
+            count=count
+        )
+
+        self.worker.signals.finished.connect(self.insert_page) # noqa
+        self.worker.signals.error.connect(self.stop_fetching) # noqa
+
+        start_worker(worker=self.worker)
+
+    def canFetchMore(
+            self,
+            parent: QModelIndex
+    ) -> bool:
+
+        if parent.isValid() or self.worker is not None:
+            return False
+
+        return self._data.shape[0] < self.total
+
+    def fetchMore(
+            self,
+            parent: QModelIndex
+    ) -> None:
+
+        self.request_page()
+
+    def is_current_worker(self) -> bool:
+        """
+        Whether the signal being handled comes from the worker of the current sort order and filter.
+        """
+
+        return self.worker is not None and self.sender() is self.worker.signals
+
+    def stop_fetching(
+            self,
+            message: str
+    ) -> None:
+
+        if not self.is_current_worker():
+            return
+
+        self.worker = None
+        self.total = self._data.shape[0]
+
+    def insert_page(
+            self,
+            result: (int, pd.DataFrame)
+    ) -> None:
+
+        if not self.is_current_worker():
+            return
+
+        self.worker = None
+
+        total, page = result
+        offset = self._data.shape[0]
+
+        if total is not None:
+            self.total = total
+
+        if page.empty:
+            # The views were changed elsewhere, stop asking for more.
+            self.total = offset
+            return
+
+        self.beginInsertRows(
+            QModelIndex(),
+            offset,
+            offset + page.shape[0] - 1
+        )
+
+        if offset:
+            self._data = pd.concat(
+                [self._data, page],
+                ignore_index=True
+            )
+        else:
+            self._data = page
+
+        self.endInsertRows()
+
+    def sort(
+            self,
+            column: int,
+            order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+
+        sort_column = PROJECT_VIEW_COLUMNS[column]
+        descending = order == Qt.SortOrder.DescendingOrder
+
+        if sort_column == self.sort_column and descending == self.descending:
+            return
+
+        self.sort_column = sort_column
+        self.descending = descending
+
+        self.reload()
+
+    def set_filter(
+            self,
+            name_filter: str,
+            created_range: tuple = None,
+            modified_range: tuple = None
+    ) -> None:
+        """
+        Keeps only the views whose name or description contains name_filter, and that were created or modified within
+        a (start, end) range of dates, if given.
+        """
+
+        self.name_filter = name_filter or None
+        self.created_range = created_range
+        self.modified_range = modified_range
+
+        self.reload()
 
     def data(
             self,
@@ -860,7 +1518,7 @@ class ProjectDataModel(FAbstractTableModel):
 
             value = str(value)
 
-            if value == "nan":
+            if value in ["nan", "None"]:
                 value = ""
 
             return value
@@ -880,16 +1538,6 @@ class ProjectDataModel(FAbstractTableModel):
             # if qt_orientation == Qt.Orientation.Vertical:
             #     return str(self._data.index[p_int])
 
-    def add_record(self, record: list):
-        self._data.loc[len(self._data.index)] = record
-        index = QModelIndex()
-        self.setData(
-            index=index,
-            value=None,
-            role=Qt.ItemDataRole.DisplayRole,
-            refresh=True
-        )
-
     def setData(
             self,
             index: QModelIndex,
@@ -898,7 +1546,9 @@ class ProjectDataModel(FAbstractTableModel):
             refresh: bool = False
     ):
 
-        self.layoutChanged.emit()  # noqa
+        self.emit_data_changed()
+
+        return True
 
 
 class ProjectDataView(FTableView):
@@ -911,52 +1561,71 @@ class ProjectDataView(FTableView):
         self.parent = parent
         self.open_action = QAction("&Open", self)
         self.open_action.setStatusTip("Open view in new window.")
-        self.open_action.triggered.connect(self.open_triangle) # noqa
+        self.open_action.triggered.connect(lambda: self.open_current()) # noqa
 
     def open_triangle(
             self,
-            val: QModelIndex
+            val: QModelIndex,
+            origin_grain: str = None,
+            development_grain: str = None
     ) -> None:
-
-        fc = FaslrConnection(db_path=self.parent.main_window.db)
+        """
+        Opens the triangle of a view in a new analysis tab, at the grain it was stored at unless a coarser origin
+        and development grain are given.
+        """
 
         view_id = self.model().sibling(val.row(), 0, val).data()
-        query = fc.session.query(
-            ProjectViewData.accident_year,
-            ProjectViewData.calendar_year,
-            ProjectViewData.paid_loss,
-            ProjectViewData.reported_loss
-        ).filter(
-            ProjectViewData.view_id == view_id
-        )
-
-        df = pd.read_sql(query.statement, con=fc.connection)
-
-        df.columns = [
-            'Accident Year',
-            'Calendar Year',
-            'Paid Loss',
-            'Reported Loss'
-        ]
-
-        triangle = Triangle(
-            data=df,
-            origin='Accident Year',
-            development='Calendar Year',
-            columns=['Paid Loss', 'Reported Loss'],
-            cumulative=True
+        tab_widget = self.parent.main_window.analysis_pane
+
+        # The triangle is built in the background, the tab shows a placeholder until it is ready.
+        placeholder = LoadingTab(
+            tab_widget=tab_widget,
+            worker=Worker(
+                load_triangle,
+                db_path=self.parent.main_window.db,
+                view_id=int(view_id),
+                origin_grain=origin_grain,
+                development_grain=development_grain
+            ),
+            build_widget=lambda triangle: AnalysisTab(triangle=triangle)
         )
 
         open_item_tab(
             title="Test Triangle",
-            tab_widget=self.parent.main_window.analysis_pane,
-            item_widget=AnalysisTab(triangle=triangle)
+            tab_widget=tab_widget,
+            item_widget=placeholder
         )
 
-        fc.connection.close()
+    def open_current(
+            self,
+            grain: str = None
+    ) -> None:
+
+        index = self.currentIndex()
+
+        if not index.isValid():
+            return
+
+        self.open_triangle(
+            val=index,
+            origin_grain=grain,
+            development_grain=grain
+        )
 
     def contextMenuEvent(self, event):
 
         menu = QMenu()
         menu.addAction(self.open_action)
+
+        # The view's cells are summed to a coarser grain when it is opened.
+        open_as_menu = menu.addMenu("Open &As")
+
+        # Grains finer than the one the view was stored at fail in the background, and the loading tab says why,
+        # so that the menu does not have to query the view before it appears.
+        for grain in GRAINS:
+            grain_action = open_as_menu.addAction(grain)
+            grain_action.triggered.connect( # noqa
+                lambda checked, g=grain: self.open_current(grain=g)
+            )
+
         menu.exec(event.globalPos())
@@ -142,29 +142,6 @@ class ExhibitModel(FAbstractTableModel):
             else:
                 return Qt.AlignmentFlag.AlignCenter
 
-    def insertColumn(
-            self,
-            column: int,
-            parent: QModelIndex = ...
-    ) -> bool:
-        """
-        Adds a column to the model. This is triggered when the user adds a column to the ._data DataFrame.
-        """
-        idx = QModelIndex()
-
-        new_column = self.columnCount()
-
-        self.beginInsertColumns(
-            idx,
-            new_column,
-            new_column
-        )
-
-        self.endInsertColumns()
-        self.layoutChanged.emit() # noqa
-
-        return True
-
     def setData(
             self,
             index: QModelIndex,
@@ -195,7 +172,14 @@ class ExhibitModel(FAbstractTableModel):
                 else:
                     column_name = column_name + '.1'
 
-            self._data[column_name] = column_values
+            new_column = self.columnCount()
+
+            if new_column == 0:
+                # The first column brings the rows with it, so the model is reset instead.
+                self.set_frame(data=pd.DataFrame({column_name: column_values}))
+            else:
+                with self.inserting_columns(new_column, new_column):
+                    self._data[column_name] = column_values
 
         # Swaps two columns. Need to consider if we are swapping groups with nested columns or just the columns.
         # For this role, the values provided are the two ExhibitOutputTreeItems selected for swapping. These
@@ -211,7 +195,7 @@ class ExhibitModel(FAbstractTableModel):
 
                 a, b = cols.index(colname_a), cols.index(colname_b)
                 cols[b], cols[a] = cols[a], cols[b]
-                self._data = self._data[cols]
+                self.reorder_columns(columns=cols)
 
             # At least one column is a column group.
             else:
@@ -233,7 +217,7 @@ class ExhibitModel(FAbstractTableModel):
                 cols[prior_idx:prior_idx] = labels
                 cols[curr_idx:curr_idx] = prior_labels
 
-                self._data = self._data[cols]
+                self.reorder_columns(columns=cols)
 
         # Happens when selected item is at the top or bottom of the exhibit output tree. In this case,
         # we need to rotate all the columns to the left or right.
@@ -269,10 +253,7 @@ class ExhibitModel(FAbstractTableModel):
                     print(subcols)
                 cols[idx:idx] = subcols
 
-            self._data = self._data[cols]
-
-        self.dataChanged.emit(index, index)  # noqa
-        self.layoutChanged.emit()  # noqa
+            self.reorder_columns(columns=cols)
 
         return True
 
@@ -324,9 +305,7 @@ class ExhibitView(GridTableView):
             label=column_alias[colname])
 
         column_position = model.columnCount() + 1
-        model.insertColumn(column_position)
         self.hheader.model().insertColumn(column_position + 1)
-        model.layoutChanged.emit() # noqa
 
     def remove_group(
             self,
@@ -1,4 +1,6 @@
-import chainladder as cl
+import csv
+import io
+
 import numpy as np
 import pandas as pd
 
@@ -11,7 +13,12 @@ from faslr.base_table import (
     FTableView
 )
 
+from collections import OrderedDict
+
+from contextlib import nullcontext
+
 from faslr.constants import (
+    HEATMAP_CACHE_SIZE,
     LDF_AVERAGES,
     TEMP_LDF_LIST
 )
@@ -22,8 +29,7 @@ from PyQt6.QtCore import (
     QAbstractTableModel,
     QModelIndex,
     Qt,
-    QSize,
-    QVariant
+    QSize
 )
 
 from PyQt6.QtGui import (
@@ -36,6 +42,7 @@ from PyQt6.QtGui import (
 
 from PyQt6.QtWidgets import (
     QAbstractButton,
+    QApplication,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -51,19 +58,66 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
+from faslr.triangle_model import format_values
+
+from faslr.utilities.heatmap import (
+    color_palette,
+    heatmap_colors
+)
+
+from faslr.utilities.ldf import (
+    cdf_from_ldfs,
+    latest_diagonal,
+    ldf_averages,
+    link_arrays,
+    n_periods_mask,
+    ultimate_losses,
+    window_starts
+)
+
 from faslr.style.triangle import (
     BLANK_TEXT,
     EXCL_FACTOR_COLOR,
+    HEATMAP_CMAP,
     LOWER_DIAG_COLOR,
     MAIN_TRIANGLE_COLOR,
     RATIO_STYLE,
     VALUE_STYLE
 )
 
-from typing import Any
+from typing import (
+    Any,
+    Iterable
+)
+
+
+# Background regions of the factor table. Link ratio cells are shaded according to the heatmap or their
+# exclusion, the other regions have a fixed color, see REGION_COLORS.
+NO_REGION = 0
+LOWER_DIAG_REGION = 1
+MAIN_REGION = 2
+LINK_RATIO_REGION = 3
+
+REGION_COLORS = [
+    None,
+    LOWER_DIAG_COLOR,
+    MAIN_TRIANGLE_COLOR,
+    None
+]
 
 
 class FactorModel(FAbstractTableModel):
+    """
+    Table model of the link ratios of a triangle, with the LDF averages, selected LDFs and CDFs below them.
+
+    Each time the displayed data is recalculated, refresh_display() formats it into an array of display strings
+    and classifies each cell into a background region, so that data() only reads arrays. Excluded link ratios are
+    tracked in a boolean mask, and heatmap colors as indexes into a palette of shared QColors.
+
+    Striking out a link ratio marks its development column as dirty. recalculate_factors() then recalculates the
+    averages of the dirty columns only, and updates the CDFs and ultimate losses from the selected LDFs, rewriting
+    just the cells that change.
+    """
 
     def __init__(
             self,
@@ -80,12 +134,31 @@ class FactorModel(FAbstractTableModel):
         self.factor_frame = None
         self.heatmap_checked = False
 
-        self.heatmap_frame = self.triangle.to_frame(origin_as_datetime=False).astype(str)
-        self.heatmap_frame.loc[:] = LOWER_DIAG_COLOR.name()
+        # Heatmap colors of the link ratios, as indexes into heatmap_palette. Index 0 is the lower diagonal color.
+        self.heatmap_palette = [LOWER_DIAG_COLOR]
+        self.heatmap_index = np.zeros(self.link_frame.shape, dtype=np.int16)
+
+        # Heatmap palettes and indexes by exclusion state, most recently used last.
+        self.heatmap_cache = OrderedDict()
 
         self.ldf_types = TEMP_LDF_LIST
         self.num_ldf_types = self.ldf_types[self.ldf_types["Selected"]].shape[0]
 
+        # Values at the start and end of each link ratio, and the latest diagonal, used to calculate the LDF
+        # averages and ultimate losses.
+        self.x, self.y = link_arrays(triangle=triangle)
+        self.latest, self.latest_index = latest_diagonal(triangle=triangle)
+
+        # First row of the link ratios within the latest n periods of each column, by n.
+        self.period_starts = {}
+
+        # Averages currently displayed, as (label, average, number of years), and their factors, one row each.
+        self.averages = []
+        self.factors = None
+
+        # Development columns whose averages need to be recalculated.
+        self.dirty_columns = set()
+
         ldf_blanks = [np.nan] * len(self.link_frame.columns)
 
         selected_data = {"Selected LDF": ldf_blanks}
@@ -111,116 +184,220 @@ class FactorModel(FAbstractTableModel):
 
         self.n_triangle_columns = self.triangle.shape[3] - 1
 
-        # Extract data from the triangle that gets displayed in the tab.
-        self._data = self.get_display_data()
-
         self.value_type = value_type
 
-        # excl_frame is a dataframe that is the same size of the triangle which uses
-        # boolean values to indicate which factors in the corresponding triangle should be excluded
-        # it is first initialized to be all False, indicating no factors excluded initially
-        self.excl_frame = self.link_frame.copy()
-        self.excl_frame.loc[:] = False
+        # excluded is a boolean mask that is the same size of the link ratio triangle, indicating which factors
+        # should be excluded. It is first initialized to be all False, indicating no factors excluded initially.
+        self.excluded = np.zeros(self.link_frame.shape, dtype=bool)
+
+        self.font = QFont()
+        self.excluded_font = QFont()
+        self.excluded_font.setStrikeOut(True)
+
+        self.values = None
+        self.ultimate_column = None
+        self.display = None
+        self.regions = None
+        self.strike_cells = None
+        self.row_headers = None
+        self.column_headers = None
+
+        # Extract data from the triangle that gets displayed in the tab.
+        self._data = self.get_display_data()
 
         # Get the position of a blank row to be inserted between the end of the triangle
         # and before the development factors
 
         self.ldf_row = self.triangle_spacer_row
 
-        self.selected_spacer_row = self.triangle_spacer_row + 1
+        self.refresh_display()
 
-        self.selected_row_num = self.selected_spacer_row + 1
-        self.cdf_row_num = self.selected_row_num + 1
+    def refresh_display(self) -> None:
+        """
+        Precomputes the display strings, background regions and headers of the current data.
+        """
 
-    def data(
+        n_rows, n_columns = self.values.shape
+        ultimate_column = self.ultimate_column
+
+        self.display = self.format_cells(
+            rows=slice(None),
+            columns=slice(None)
+        )
+
+        rows = np.arange(n_rows)[:, np.newaxis]
+        columns = np.arange(n_columns)[np.newaxis, :]
+        shape = (n_rows, n_columns)
+
+        triangle_rows = np.broadcast_to(rows < self.triangle_spacer_row, shape)
+        link_cells = (rows < self.link_frame.shape[0]) & (columns < self.link_frame.shape[1])
+
+        regions = np.full(shape, NO_REGION, dtype=np.int8)
+        regions[(rows == self.selected_spacer_row) | (columns > self.n_triangle_columns - 1)] = LOWER_DIAG_REGION
+        regions[triangle_rows] = MAIN_REGION
+        regions[triangle_rows & link_cells] = LINK_RATIO_REGION
+        # Case when the cell is on the lower diagonal
+        regions[triangle_rows & (columns >= self.n_triangle_rows - rows)] = LOWER_DIAG_REGION
+        regions[:, ultimate_column] = np.where(
+            np.arange(n_rows) < self.triangle_spacer_row - 1,
+            MAIN_REGION,
+            LOWER_DIAG_REGION
+        )
+
+        self.regions = regions
+
+        # Strike out the link ratios if double-clicked, but not the averaged factors at the bottom
+        self.strike_cells = (rows < self.triangle_spacer_row - 2) & (columns < self.n_triangle_columns) & link_cells
+
+        self.row_headers = [str(label) for label in self._data.index]
+        self.column_headers = [str(label) for label in self._data.columns]
+
+    def format_cells(
             self,
-            index: QModelIndex,
-            role: int = None
-    ) -> Any:
+            rows: Any,
+            columns: Any
+    ) -> np.ndarray:
+        """
+        Returns the display strings of a block of cells, given by row and column indexers.
+        """
 
-        if role == Qt.ItemDataRole.DisplayRole:
+        row_numbers = np.arange(self.values.shape[0])[rows]
+        column_numbers = np.arange(self.values.shape[1])[columns]
 
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
+        values = self.values[np.ix_(row_numbers, column_numbers)]
 
-            if col == "Ultimate Loss":
-                if index.row() > self.n_triangle_rows:
-                    display_value = BLANK_TEXT
-                else:
-                    display_value = VALUE_STYLE.format(value)
-            else:
-                if (index.row() == self.cdf_row_num) and self.selected_row.isnull().all().all():
-                    display_value = BLANK_TEXT
+        # "value" means stuff like losses and premiums, for "ratio", want to display 3 decimal places.
+        if self.value_type == "value":
+            style = VALUE_STYLE
+        else:
+            style = RATIO_STYLE
 
-                # Display blank when there are nans in the lower-right hand of the triangle.
-                elif str(value) == "nan":
+        display = format_values(values=values, style=style)
 
-                    display_value = BLANK_TEXT
-                else:
-                    # "value" means stuff like losses and premiums, should have 2 decimal places.
-                    if self.value_type == "value":
+        ultimate = column_numbers == self.ultimate_column
 
-                        display_value = VALUE_STYLE.format(value)
+        if ultimate.any():
+            display[:, ultimate] = format_values(values=values[:, ultimate], style=VALUE_STYLE)
+            display[np.ix_(row_numbers > self.n_triangle_rows, ultimate)] = BLANK_TEXT
 
-                    # for "ratio", want to display 3 decimal places.
-                    else:
+        if self.selected_row.isnull().all().all():
+            display[np.ix_(row_numbers == self.cdf_row_num, column_numbers < self.ultimate_column)] = BLANK_TEXT
 
-                        display_value = RATIO_STYLE.format(value)
+        return display
 
-            display_value = str(display_value)
+    def update_cells(
+            self,
+            rows: Any,
+            columns: Any
+    ) -> None:
+        """
+        Reformats the display strings of a block of cells after their values have changed.
+        """
+
+        row_numbers = np.arange(self.values.shape[0])[rows]
+        column_numbers = np.arange(self.values.shape[1])[columns]
 
-            self.setData(
-                self.index(
-                    index.row(),
-                    index.column()
-                ),
-                QVariant(Qt.AlignmentFlag.AlignRight),
-                Qt.ItemDataRole.TextAlignmentRole
+        self.display[np.ix_(row_numbers, column_numbers)] = self.format_cells(
+            rows=row_numbers,
+            columns=column_numbers
+        )
+
+    def set_heatmap(
+            self,
+            colors: np.ndarray
+    ) -> None:
+        """
+        Stores the heatmap colors of the link ratios, given as an array of 8-bit RGBA values, as palette indexes.
+        """
+
+        palette, self.heatmap_index = color_palette(colors=colors)
+
+        self.heatmap_palette = [QColor(*color) for color in palette.tolist()]
+
+    def set_heatmap_checked(
+            self,
+            checked: bool
+    ) -> None:
+        """
+        Turns the heatmap on or off, signaling a change of color over the link ratios only.
+        """
+
+        self.heatmap_checked = checked
+
+        if checked:
+            self.update_heatmap()
+
+        n_link_rows, n_link_columns = self.link_frame.shape
+
+        self.emit_data_changed(
+            bottom=n_link_rows - 1,
+            right=n_link_columns - 1,
+            roles=[Qt.ItemDataRole.BackgroundRole]
+        )
+
+    def update_heatmap(self) -> None:
+        """
+        Colors the link ratios by their rank within each column, leaving out the excluded ones. Colors are cached by
+        exclusion state, so that striking a link ratio out and back in does not color the triangle again.
+        """
+
+        key = self.excluded.tobytes()
+
+        if key in self.heatmap_cache:
+            self.heatmap_cache.move_to_end(key)
+            self.heatmap_palette, self.heatmap_index = self.heatmap_cache[key]
+            return
+
+        self.set_heatmap(
+            colors=heatmap_colors(
+                ratios=self.link_frame.to_numpy(dtype=np.float64),
+                excluded=self.excluded,
+                cmap=HEATMAP_CMAP
             )
+        )
+
+        self.heatmap_cache[key] = (self.heatmap_palette, self.heatmap_index)
+
+        while len(self.heatmap_cache) > HEATMAP_CACHE_SIZE:
+            self.heatmap_cache.popitem(last=False)
+
+    def data(
+            self,
+            index: QModelIndex,
+            role: int = None
+    ) -> Any:
 
-            return display_value
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Blank when there are nans in the lower-right hand of the triangle.
+            return self.display[index.row(), index.column()]
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignRight
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            if self._data.columns[index.column()] != "Ultimate Loss":
-                # Case when the index is on the lower diagonal
-                if (index.column() >= self.n_triangle_rows - index.row()) and \
-                        (index.row() < self.triangle_spacer_row):
-                    return LOWER_DIAG_COLOR
-                # Case when the index is on the triangle
-                elif index.row() < self.triangle_spacer_row:
-                    if self.heatmap_checked:
-                        return QColor(self.heatmap_frame.iloc[[index.row()], [index.column()]].squeeze())
-                    else:
-                        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
-                        # Change color if factor is excluded
-                        if exclude:
-                            return EXCL_FACTOR_COLOR
-                        else:
-                            return MAIN_TRIANGLE_COLOR
-                elif (index.row() == self.selected_spacer_row) | (index.column() > self.n_triangle_columns - 1):
-                    return LOWER_DIAG_COLOR
-            else:
-                if index.row() < self.triangle_spacer_row - 1:
-                    return MAIN_TRIANGLE_COLOR
+            row = index.row()
+            column = index.column()
+            region = self.regions[row, column]
+
+            if region == LINK_RATIO_REGION:
+                # Change color if factor is excluded, excluded factors are also left out of the heatmap.
+                if self.excluded[row, column]:
+                    return EXCL_FACTOR_COLOR
+                elif self.heatmap_checked:
+                    return self.heatmap_palette[self.heatmap_index[row, column]]
                 else:
-                    return LOWER_DIAG_COLOR
+                    return MAIN_TRIANGLE_COLOR
+
+            return REGION_COLORS[region]
 
-        # Strike out the link ratios if double-clicked, but not the averaged factors at the bottom
         if (role == Qt.ItemDataRole.FontRole) and \
                 (self.value_type == "ratio") and \
-                (index.row() < self.triangle_spacer_row - 2) and \
-                (index.column() < self.n_triangle_columns):
+                self.strike_cells[index.row(), index.column()]:
 
-            font = QFont()
-            exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
-            if exclude:
-                font.setStrikeOut(True)
+            if self.excluded[index.row(), index.column()]:
+                return self.excluded_font
             else:
-                font.setStrikeOut(False)
-            return font
+                return self.font
 
     def flags(
             self,
@@ -242,168 +419,383 @@ class FactorModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_headers[p_int]
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.row_headers[p_int]
 
     def toggle_exclude(
             self,
             index: QModelIndex
     ) -> None:
         """
-        Sets values of the exclusion frame to True or False to indicate whether a link ratio should be excluded.
+        Flips the exclusion mask to indicate whether a link ratio should be excluded, and marks its column as dirty.
         """
-        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
+        row = index.row()
+        column = index.column()
 
-        if exclude:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = False
-        else:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = True
+        if row < self.excluded.shape[0] and column < self.excluded.shape[1]:
+            self.excluded[row, column] = not self.excluded[row, column]
+            self.dirty_columns.add(column)
 
     def select_factor(
             self,
             index: QModelIndex
     ) -> None:
 
-        self.selected_row.iloc[[0], [index.column()]] = self._data.iloc[[index.row()], [index.column()]].copy()
-
-        self.recalculate_factors()
+        self.edit_factors(selections=[(index.row(), index.column())])
 
     def select_ldf_row(
             self,
             index: QModelIndex
     ) -> None:
 
-        self.selected_row.iloc[[0]] = self._data.iloc[[index.row()], 0:self.link_frame.shape[1]]
-        self.recalculate_factors()
+        self.edit_factors(selections=[(index.row(), column) for column in range(self.link_frame.shape[1])])
 
     def clear_selected_ldfs(self) -> None:
 
-        self.selected_row.iloc[[0]] = np.nan
-        self.recalculate_factors()
+        self.edit_factors(deletions=range(self.link_frame.shape[1]))
 
     def delete_ldf(
             self,
             index: QModelIndex
     ) -> None:
-        self.selected_row.iloc[[0], [index.column()]] = np.nan
-        self.recalculate_factors()
+
+        self.edit_factors(deletions=[index.column()])
+
+    def selected_averages(self) -> list:
+        """
+        Returns the averages checked in the list of LDF averages, as (label, average, number of years).
+        """
+
+        df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
+
+        return [
+            (label, LDF_AVERAGES[average], int(years)) for label, average, years in zip(
+                df_ldfs_to_calc["Label"],
+                df_ldfs_to_calc["Type"],
+                df_ldfs_to_calc["Number of Years"]
+            )
+        ]
+
+    def period_start(
+            self,
+            n_periods: int
+    ) -> np.ndarray:
+
+        if n_periods not in self.period_starts:
+            self.period_starts[n_periods] = window_starts(
+                mask=n_periods_mask(
+                    triangle=self.triangle,
+                    n_periods=n_periods
+                )
+            )
+
+        return self.period_starts[n_periods]
+
+    def calculate_factors(
+            self,
+            columns: Any
+    ) -> None:
+        """
+        Recalculates the LDF averages of the given development columns, leaving out the excluded link ratios. All
+        averages are calculated together in one pass over the link ratios of the columns.
+        """
+
+        if not self.averages:
+            return
+
+        x = self.x[:, columns]
+        y = self.y[:, columns]
+
+        included = np.ones(x.shape, dtype=bool)
+        included[:self.excluded.shape[0]] = ~self.excluded[:, columns]
+
+        self.factors[:, columns] = ldf_averages(
+            x=x,
+            y=y,
+            included=included,
+            windows=[(average, self.period_start(n_periods=years)[columns]) for _, average, years in self.averages]
+        )
+
+    def calculate_selection(self) -> None:
+        """
+        Updates the CDFs and ultimate losses from the selected LDFs.
+        """
+
+        ldfs = self.selected_row.to_numpy(dtype=np.float64)[0]
+        cdfs = cdf_from_ldfs(ldfs=ldfs)
+
+        self.cdf_row.iloc[0] = cdfs
+
+        n_link_columns = self.link_frame.shape[1]
+
+        self.values[self.selected_row_num, :n_link_columns] = ldfs
+        self.values[self.cdf_row_num, :n_link_columns] = cdfs
+        self.values[:self.triangle.shape[2], self.ultimate_column] = ultimate_losses(
+            latest=self.latest,
+            latest_index=self.latest_index,
+            cdfs=cdfs
+        )
 
     def recalculate_factors(self) -> None:
         """
-        Method to update the view and LDFs as the user strikes out link ratios.
+        Method to update the view and LDFs as the user strikes out link ratios or selects LDFs.
+        """
+
+        self.edit_factors()
+
+    def rebuild(self) -> None:
         """
-        drop_list = []
-        for i in range(self.link_frame.shape[0]):
-            for j in range(self.link_frame.shape[1]):
+        Rebuilds the table after the list of averages to display has changed. Rows are inserted or removed at the end
+        of the averages, and the rows from the averages down are signaled as changed.
+        """
+
+        previous_spacer_row = self.selected_spacer_row
+        previous_row_count = self.rowCount()
 
-                exclude = self.excl_frame.iloc[[i], [j]].squeeze()
+        data = self.get_display_data()
+        difference = data.shape[0] - previous_row_count
 
-                if exclude:
+        if difference > 0:
+            change = self.inserting_rows(previous_spacer_row, previous_spacer_row + difference - 1)
+        elif difference < 0:
+            change = self.removing_rows(previous_spacer_row + difference, previous_spacer_row - 1)
+        else:
+            change = nullcontext()
 
-                    row_drop = str(self.link_frame.iloc[i].name)
-                    col_drop = int(str(self.link_frame.columns[j]).split('-')[0])
+        with change:
+            self._data = data
+            self.refresh_display()
 
-                    drop_list.append((row_drop, col_drop))
+        self.emit_data_changed(top=self.triangle_spacer_row)
+        self.emit_headers_changed(
+            orientation=Qt.Orientation.Vertical,
+            first=self.triangle_spacer_row
+        )
 
-                else:
+    def update_factors(self) -> (np.ndarray, np.ndarray):
+        """
+        Recalculates the averages of the dirty columns, then the selected LDF, CDF and ultimate loss cells in place,
+        so that a strike-out costs time in proportion to the size of one column. Returns the rows and columns of the
+        cells whose display changed, other than those signaled by a rebuild when the list of averages changed.
+        """
+
+        if self.selected_averages() != self.averages:
+            self.rebuild()
+            return np.array([], dtype=int), np.array([], dtype=int)
+
+        rows = []
+        columns = []
+
+        dirty_columns = sorted(self.dirty_columns)
+        self.dirty_columns.clear()
+
+        if dirty_columns and self.num_ldf_types:
+            self.calculate_factors(columns=dirty_columns)
+
+            factor_rows = slice(self.triangle_spacer_row, self.selected_spacer_row)
+
+            self.values[factor_rows, dirty_columns] = self.factors[:, dirty_columns]
+            self.factor_frame.iloc[:, dirty_columns] = self.factors[:, dirty_columns]
 
-                    pass
+            self.update_cells(
+                rows=factor_rows,
+                columns=dirty_columns
+            )
+
+            rows += [self.triangle_spacer_row, self.selected_spacer_row - 1]
+            columns += [dirty_columns[0], dirty_columns[-1]]
+
+        selection_rows = [self.selected_row_num, self.cdf_row_num]
+        previous_rows = self.display[selection_rows].copy()
+        previous_ultimates = self.display[:, self.ultimate_column].copy()
+
+        self.calculate_selection()
+
+        self.update_cells(
+            rows=selection_rows,
+            columns=slice(None)
+        )
+
+        self.update_cells(
+            rows=slice(None),
+            columns=[self.ultimate_column]
+        )
 
-        self._data = self.get_display_data(drop_list=drop_list)
+        changed_rows, changed_columns = np.nonzero(self.display[selection_rows] != previous_rows)
+        changed_ultimates = np.flatnonzero(self.display[:, self.ultimate_column] != previous_ultimates)
 
-    def get_display_data(
+        rows = np.concatenate([rows, np.take(selection_rows, changed_rows), changed_ultimates]).astype(int)
+        columns = np.concatenate([
+            columns,
+            changed_columns,
+            np.full(changed_ultimates.size, self.ultimate_column)
+        ]).astype(int)
+
+        return rows, columns
+
+    def edit_factors(
             self,
-            drop_list: list = None
-    ) -> DataFrame:
+            exclusions: Iterable = (),
+            selections: Iterable = (),
+            deletions: Iterable = (),
+            ldfs: dict = None
+    ) -> None:
         """
-        Concatenates the link ratio triangle and LDFs below it to be displayed in the GUI.
+        Applies a batch of edits, then recalculates the factors and notifies the views once, with a single
+        dataChanged signal spanning the cells that changed, for only the roles that changed.
+
+        :param exclusions: (row, column) positions of link ratios whose exclusion is toggled.
+        :param selections: (row, column) positions of LDF averages to use as the selected LDF of their column.
+        :param deletions: Columns whose selected LDF is removed.
+        :param ldfs: Selected LDFs entered directly, by column.
         """
-        ratios = self.link_frame.copy()
 
-        df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
-        self.num_ldf_types = df_ldfs_to_calc.shape[0]
+        rows = []
+        columns = []
+
+        n_link_columns = self.link_frame.shape[1]
 
-        factor_frame = pd.DataFrame()
+        for row, column in exclusions:
+            if row < self.excluded.shape[0] and column < self.excluded.shape[1]:
+                self.excluded[row, column] = not self.excluded[row, column]
+                self.dirty_columns.add(column)
 
-        for i in range(self.num_ldf_types):
-            ldf_name = df_ldfs_to_calc["Label"].iloc[i]
-            ldf_years = int(df_ldfs_to_calc["Number of Years"].iloc[i])
-            average = df_ldfs_to_calc['Type'].iloc[i]
+                rows.append(row)
+                columns.append(column)
 
-            development = cl.Development(
-                drop=drop_list,
-                n_periods=[ldf_years] * ratios.shape[1],
-                average=LDF_AVERAGES[average]
+        for row, column in selections:
+            if self.triangle_spacer_row <= row < self.selected_spacer_row and column < n_link_columns:
+                self.selected_row.iloc[0, column] = self.values[row, column]
+
+        for column in deletions:
+            if column < n_link_columns:
+                self.selected_row.iloc[0, column] = np.nan
+
+        if ldfs:
+            ldf_columns = [column for column in ldfs if column < n_link_columns]
+
+            self.selected_row.iloc[0, ldf_columns] = [ldfs[column] for column in ldf_columns]
+
+        if rows and self.heatmap_checked:
+            self.update_heatmap()
+
+            # Colors change throughout the columns of the toggled link ratios.
+            rows.append(0)
+
+        # Struck link ratios change color and font, everything else only changes its text.
+        if rows:
+            roles = [
+                Qt.ItemDataRole.DisplayRole,
+                Qt.ItemDataRole.BackgroundRole,
+                Qt.ItemDataRole.FontRole
+            ]
+        else:
+            roles = [Qt.ItemDataRole.DisplayRole]
+
+        changed_rows, changed_columns = self.update_factors()
+
+        rows = np.concatenate([rows, changed_rows])
+        columns = np.concatenate([columns, changed_columns])
+
+        if rows.size:
+            self.emit_data_changed(
+                top=int(rows.min()),
+                left=int(columns.min()),
+                bottom=int(rows.max()),
+                right=int(columns.max()),
+                roles=roles
             )
 
-            factors = development.fit(X=self.triangle)
+    def exclude_high_low(
+            self,
+            columns: Iterable
+    ) -> None:
+        """
+        Excludes the highest and lowest of the link ratios that are still included in each of the given columns.
+        """
+
+        link_ratios = self.link_frame.to_numpy(dtype=np.float64)
 
-            # noinspection PyUnresolvedReferences
-            factor_row = factors.ldf_.to_frame(origin_as_datetime=False)
-            factor_row = factor_row.rename(index={'(All)': ldf_name})
+        exclusions = []
 
-            if i == 0:
-                factor_frame = factor_row
-            else:
-                factor_frame = pd.concat([factor_frame, factor_row])
+        for column in sorted(set(columns)):
+            if column >= link_ratios.shape[1]:
+                continue
 
-        self.factor_frame = factor_frame
+            candidates = np.flatnonzero(np.isfinite(link_ratios[:, column]) & ~self.excluded[:, column])
 
-        blank_data = {"": [np.nan] * len(ratios.columns)}
+            # Keep at least one link ratio in the column.
+            if candidates.size < 3:
+                continue
 
-        blank_row = pd.DataFrame.from_dict(
-            blank_data,
-            orient="index",
-            columns=ratios.columns
-        )
+            ratios = link_ratios[candidates, column]
+            high = candidates[np.argmax(ratios)]
+            low = candidates[np.argmin(ratios)]
 
-        # fit factors
-        patterns = {}
-        for i in range(ratios.shape[1]):
-            col = int(str(self.link_frame.columns[i]).split('-')[0])
-            patterns[col] = self.selected_row.iloc[[0], [i]].squeeze().copy()
+            # All of the link ratios are equal.
+            if high == low:
+                continue
 
-        selected_dev = cl.DevelopmentConstant(
-            patterns=patterns,
-            style="ldf"
-        ).fit_transform(self.triangle)
+            exclusions += [
+                (high, column),
+                (low, column)
+            ]
 
-        selected_model = cl.Chainladder().fit(selected_dev)
-        # noinspection PyUnresolvedReferences
-        ultimate_frame = selected_model.ultimate_.to_frame(origin_as_datetime=False)
+        self.edit_factors(exclusions=exclusions)
 
-        self.cdf_row.iloc[[0]] = selected_dev.cdf_.to_frame(origin_as_datetime=False).iloc[[0]]
+    def get_display_data(self) -> DataFrame:
+        """
+        Concatenates the link ratio triangle and LDFs below it to be displayed in the GUI.
+        """
 
-        # ratios["To Ult"] = np.nan
-        ratios[""] = np.nan
+        n_origins = self.triangle.shape[2]
+        n_link_rows, n_link_columns = self.link_frame.shape
 
-        ratios = pd.concat([ratios, ultimate_frame], axis=1)
-        ratios.columns = [*ratios.columns[:-1], "Ultimate Loss"]
+        self.averages = self.selected_averages()
+        self.num_ldf_types = len(self.averages)
+
+        self.factors = np.full((self.num_ldf_types, n_link_columns), np.nan)
+        self.calculate_factors(columns=slice(None))
+        self.dirty_columns.clear()
+
+        self.factor_frame = pd.DataFrame(
+            data=self.factors.copy(),
+            index=[label for label, _, _ in self.averages],
+            columns=self.link_frame.columns
+        )
 
         self.selected_spacer_row = self.triangle_spacer_row + self.num_ldf_types
         self.selected_row_num = self.selected_spacer_row + 1
         self.cdf_row_num = self.selected_row_num + 1
 
-        index = QModelIndex()
+        # Link ratios, a blank column and the ultimate losses, then a blank row, the averages, another blank row,
+        # and the selected LDFs and CDFs.
+        self.values = np.full((self.cdf_row_num + 1, n_link_columns + 2), np.nan)
+        self.ultimate_column = n_link_columns + 1
 
-        res = pd.concat([
-            ratios,
-            blank_row,
-            factor_frame,
-            blank_row,
-            self.selected_row,
-            self.cdf_row
-        ])
+        self.values[:n_link_rows, :n_link_columns] = self.link_frame.to_numpy(dtype=np.float64)
+        self.values[self.triangle_spacer_row:self.selected_spacer_row, :n_link_columns] = self.factors
 
-        # noinspection PyUnresolvedReferences
-        self.dataChanged.emit(
-            index,
-            index
+        self.calculate_selection()
+
+        index = [
+            *self.triangle.origin[:n_origins],
+            "",
+            *self.factor_frame.index,
+            "",
+            *self.selected_row.index,
+            *self.cdf_row.index
+        ]
+
+        # The frame shares its memory with values, which is updated in place.
+        res = pd.DataFrame(
+            data=self.values,
+            index=index,
+            columns=[*self.link_frame.columns, "", "Ultimate Loss"],
+            copy=False
         )
-        # noinspection PyUnresolvedReferences
-        self.layoutChanged.emit()
 
         return res
 
@@ -422,19 +814,10 @@ class FactorModel(FAbstractTableModel):
                 value = np.nan
                 # return False
 
-            self.selected_row.iloc[0, index.column()] = value
-            self.recalculate_factors()
-            self.get_display_data()
-            self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
+            self.edit_factors(ldfs={index.column(): value})
             return True
         elif refresh:
-            self.recalculate_factors()
-            self.get_display_data()
-            self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
+            self.edit_factors()
 
 
 class FactorView(FTableView):
@@ -452,6 +835,15 @@ class FactorView(FTableView):
         self.delete_action.setStatusTip("Delete the selected LDF(s).")
         self.delete_action.triggered.connect(self.delete_selection) # noqa
 
+        self.paste_action = QAction("&Paste Selected LDFs", self)
+        self.paste_action.setShortcut(QKeySequence("Ctrl+v"))
+        self.paste_action.setStatusTip("Paste a row of LDFs from the clipboard into the selected LDFs.")
+        self.paste_action.triggered.connect(self.paste_selection) # noqa
+
+        self.exclude_high_low_action = QAction("Exclude &High/Low in Column", self)
+        self.exclude_high_low_action.setStatusTip("Exclude the highest and lowest link ratios in the selected columns.")
+        self.exclude_high_low_action.triggered.connect(self.exclude_high_low) # noqa
+
         self.installEventFilter(self)
 
         # self.delete_action = QAction("&Delete", self)
@@ -517,6 +909,8 @@ class FactorView(FTableView):
 
         if e.key() == Qt.Key.Key_Delete:
             self.delete_selection()
+        elif e.matches(QKeySequence.StandardKey.Paste):
+            self.paste_selection()
         else:
             super().keyPressEvent(e)
 
@@ -535,30 +929,45 @@ class FactorView(FTableView):
     def process_double_click(self):
         """
         Respond to when the user double-clicks on the table. Route methods depends on where in the table the user
-        clicks.
+        clicks. All the selected cells are edited in one batch, so that the factors are recalculated once.
         """
 
-        selection = self.selectedIndexes()
+        model = self.model()
+
+        exclusions = []
+        selections = []
 
-        for index in selection:
+        for index in self.selectedIndexes():
             # Case when user double-clicks on the link ratios in the triangle, toggle exclude
-            if index.row() < index.model().triangle_spacer_row - 2 and \
-                    index.column() <= index.model().n_triangle_columns:
-                index.model().toggle_exclude(index=index)
-                index.model().recalculate_factors()
+            if index.row() < model.triangle_spacer_row - 2 and \
+                    index.column() <= model.n_triangle_columns:
+                exclusions.append((index.row(), index.column()))
             # Case when the user clicks on an LDF average, select it.
-            elif (index.model().selected_spacer_row > index.row() > index.model().triangle_spacer_row - 1) and \
-                    (index.column() < index.model().n_triangle_columns):
-                index.model().select_factor(index=index)
+            elif (model.selected_spacer_row > index.row() > model.triangle_spacer_row - 1) and \
+                    (index.column() < model.n_triangle_columns):
+                selections.append((index.row(), index.column()))
             # elif index.row() == index.model().selected_row_num and index.column() < index.model().n_triangle_columns:
             #     index.model().clear_selected_ldf(index=index)
 
+        model.edit_factors(
+            exclusions=exclusions,
+            selections=selections
+        )
+
     def exclude_ratio(self):
-        selection = self.selectedIndexes()
 
-        for index in selection:
-            index.model().toggle_exclude(index=index)
-            index.model().recalculate_factors(index=index)
+        self.model().edit_factors(
+            exclusions=[(index.row(), index.column()) for index in self.selectedIndexes()]
+        )
+
+    def exclude_high_low(self):
+        """
+        Excludes the highest and lowest link ratios in each of the selected columns.
+        """
+
+        self.model().exclude_high_low(
+            columns=[index.column() for index in self.selectedIndexes()]
+        )
 
     def custom_menu_event(
             self,
@@ -581,9 +990,15 @@ class FactorView(FTableView):
         # only add the delete option if the selection contains the row of selected LDFs
         if self.model().selected_row_num in rows:
             menu.addAction(self.delete_action)
+            menu.addAction(self.paste_action)
         else:
             pass
 
+        columns = [index.column() for index in self.selectedIndexes()]
+
+        if columns and min(columns) < self.model().link_frame.shape[1]:
+            menu.addAction(self.exclude_high_low_action)
+
         if event is None:
             if header_type == "horizontal":
                 position = self.horizontalHeader().mapToGlobal(pos)
@@ -604,13 +1019,50 @@ class FactorView(FTableView):
         )
 
     def delete_selection(self):
-        selection = self.selectedIndexes()
 
-        for index in selection:
-            if index.row() == self.model().selected_row_num and index.column() < self.model().selected_row.shape[1]:
-                self.model().delete_ldf(index=index)
-            else:
-                pass
+        self.model().edit_factors(
+            deletions=[
+                index.column() for index in self.selectedIndexes()
+                if index.row() == self.model().selected_row_num and
+                index.column() < self.model().selected_row.shape[1]
+            ]
+        )
+
+    def paste_selection(self):
+        """
+        Pastes tab-separated factors from the clipboard, e.g., a row copied from Excel, into the selected LDFs,
+        starting at the selected column. A single column of factors is pasted across the row. Entries that are not
+        numbers clear the selected LDF of their column. All the factors are entered in one batch.
+        """
+
+        model = self.model()
+        selection = [index for index in self.selectedIndexes() if index.row() == model.selected_row_num]
+
+        if not selection:
+            return
+
+        rows = list(csv.reader(io.StringIO(QApplication.clipboard().text()), delimiter='\t'))
+        rows = [row for row in rows if row]
+
+        if not rows:
+            return
+
+        if len(rows) > 1 and all(len(row) == 1 for row in rows):
+            entries = [row[0] for row in rows]
+        else:
+            entries = rows[0]
+
+        start = min(index.column() for index in selection)
+
+        ldfs = {}
+
+        for column, entry in enumerate(entries, start=start):
+            try:
+                ldfs[column] = float(entry)
+            except ValueError:
+                ldfs[column] = np.nan
+
+        model.edit_factors(ldfs=ldfs)
 
 
 class LDFAverageModel(QAbstractTableModel):
@@ -732,17 +1184,13 @@ class LDFAverageModel(QAbstractTableModel):
             columns=self._data.columns
         )
 
-        index = QModelIndex()
+        row = self.rowCount()
 
+        # The factor model picks up the new average when the dialog is accepted.
+        self.beginInsertRows(QModelIndex(), row, row)
         self._data = pd.concat([self._data, df])
         self.parent.ldf_types = self._data
-
-        self.dataChanged.emit(index, index) # noqa
-        # noinspection PyUnresolvedReferences
-        self.layoutChanged.emit()
-        self.parent.dataChanged.emit(index, index) # noqa
-        # noinspection PyUnresolvedReferences
-        self.parent.layoutChanged.emit()
+        self.endInsertRows()
 
 
 class LDFAverageView(QTableView):
@@ -825,7 +1273,6 @@ class LDFAverageBox(QDialog):
             ldf_dialog.exec()
 
     def accept_changes(self):
-        self.parent.get_display_data()
         index = QModelIndex()
         self.parent.setData(
             index=index,
@@ -91,7 +91,16 @@ class IndexTableModel(FAbstractTableModel):
             self._data['Values'] = values
             print(self._data)
 
-        self.layoutChanged.emit()
+            columns = [self._data.columns.get_loc(column) for column in ['Changes', 'Values']]
+
+            self.emit_data_changed(
+                left=min(columns),
+                right=max(columns)
+            )
+
+            return True
+
+        return False
 
 
 class IndexTableView(FTableView):
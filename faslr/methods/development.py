@@ -6,8 +6,6 @@ from faslr.factor import (
     FactorView
 )
 
-from faslr.utilities.style_parser import parse_styler
-
 from PyQt6.QtCore import Qt
 
 from PyQt6.QtWidgets import (
@@ -89,13 +87,5 @@ class DevelopmentTab(QWidget):
         self.ldf_average_box.show()
 
     def toggle_heatmap(self):
-        if self.check_heatmap.isChecked():
-            self.factor_model.heatmap_checked = True
-            self.factor_model.heatmap_frame = parse_styler(
-                self.factor_model.triangle,
-                cmap="coolwarm"
-            )
-            self.factor_model.layoutChanged.emit() # noqa
-        else:
-            self.factor_model.heatmap_checked = False
-            self.factor_model.layoutChanged.emit() # noqa
+
+        self.factor_model.set_heatmap_checked(checked=self.check_heatmap.isChecked())
@@ -1,4 +1,5 @@
 from __future__ import annotations
+
 from faslr.connection import connect_db
 
 from faslr.data import (
@@ -13,20 +14,14 @@ from faslr.schema import (
     StateTable
 )
 
-from faslr.project_item import ProjectItem
-
 from faslr.utilities import open_item_tab
+from faslr.utilities.queries import delete_project_node
 
-from PyQt6.QtCore import (
-    Qt,
-    QModelIndex
-)
+from PyQt6.QtCore import QModelIndex
 
 from PyQt6.QtGui import (
     QAction,
-    QColor,
-    QKeySequence,
-    QStandardItem
+    QKeySequence
 )
 
 from PyQt6.QtWidgets import (
@@ -86,25 +81,6 @@ class ProjectDialog(QDialog):
         state_text = self.state_edit.text()
         lob_text = self.lob_edit.text()
 
-        # Create an entries for the project tree
-        country = ProjectItem(
-            country_text,
-            set_bold=True
-        )
-
-        state = ProjectItem(
-            state_text,
-        )
-
-        lob = ProjectItem(
-            lob_text,
-            text_color=QColor(
-                155,
-                0,
-                0
-            )
-        )
-
         # Check if the country is already in the database
         country_query = session.query(CountryTable).filter(CountryTable.country_name == country_text)
 
@@ -156,15 +132,6 @@ class ProjectDialog(QDialog):
             new_country_project.country = [new_country]
             new_state_project.state = [new_state]
 
-            # Add entries into the project tree
-            country.appendRow([state, QStandardItem(state_uuid)])
-            state.appendRow([lob, QStandardItem(lob_uuid)])
-
-            main_window.project_root.appendRow([
-                country,
-                QStandardItem(country_uuid)
-            ])
-
             # Add entries to the database session
             session.add(new_country_project)
             session.add(new_state_project)
@@ -188,6 +155,9 @@ class ProjectDialog(QDialog):
 
             session.add(new_lob_project)
 
+            country = new_country
+            state = new_state
+
         # Otherwise, check if the state is already in the database
         else:
 
@@ -248,20 +218,8 @@ class ProjectDialog(QDialog):
 
                 session.add(new_lob_project)
 
-                # populate the project tree
-                # find the existing country and append the new state to it
-                country_tree_item = main_window.project_model.findItems(
-                    country_uuid,
-                    Qt.MatchFlag.MatchExactly,
-                    1
-                )
-
-                if country_tree_item:
-                    ix = main_window.project_model.indexFromItem(country_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([state, QStandardItem(state_uuid)])
-                    state.appendRow([lob, QStandardItem(lob_uuid)])
+                country = existing_country
+                state = new_state
 
             # If the state already exists append the LOB to it
             else:
@@ -287,23 +245,26 @@ class ProjectDialog(QDialog):
                 session.add(new_lob)
                 session.add(new_lob_project)
 
-                state_tree_item = main_window.project_model.findItems(
-                    state_uuid,
-                    Qt.MatchFlag.MatchRecursive,
-                    1
-                )
-                # state_tree_item = country_tree_item.findItems(state_uuid, Qt.MatchExactly, 1)
-                if state_tree_item:
-                    ix = main_window.project_model.indexFromItem(state_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([lob, QStandardItem(lob_uuid)])
+                country = existing_country
+                state = existing_state
+
+        # flush the session to get the id of the new LOB
+        session.flush()
+
+        # Keys, names and uuids of the nodes leading to the new project in the project tree
+        path = [
+            (country.country_id, country.country_name, country.project_id),
+            (state.location_id, state.state_name, state.project_id),
+            (new_lob.lob_id, new_lob.lob_type, new_lob.project_id)
+        ]
 
         session.commit()
 
+        session.close()
         connection.close()
 
-        # main_window.project_pane.expandAll()
+        # Insert only the rows that are new to the project tree
+        main_window.project_model.add_project(path=path)
 
         print("new project created")
 
@@ -397,112 +358,22 @@ class ProjectTreeView(QTreeView):
 
     def delete_project(self) -> None:
 
-        """print uuid of current selected index"""
+        """Delete the selected project and everything beneath it."""
         uuid = self.currentIndex().siblingAtColumn(1).data()
-        current_item = self.model().itemFromIndex(self.currentIndex())
+
         # connect to the database
         session, connection = connect_db(db_path=self.parent.db)
-        
-        # delete the item from the database with uuid
-
-        if current_item.parent():
-            parent = current_item.parent()
-            # case when selection is an LOB
-            if parent.parent():
-                lob = session.query(LOBTable).filter(LOBTable.project_id == uuid).one()
-                session.delete(lob)
-
-            # Case when selection is a state
-            else:
-                state = session.query(StateTable).filter(StateTable.project_id == uuid)
-                state_first = state.first()
-                location_id = state_first.location_id
-                location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
-                session.delete(location)
 
-        # Case when selection is a country
-        else:
-            country = session.query(CountryTable).filter(CountryTable.project_id == uuid)
-            country_first = country.first()
-            location_id = country_first.location_id
-            location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
-            session.delete(location)
+        # delete the item and its descendants from the database with uuid
+        delete_project_node(
+            session=session,
+            project_id=uuid
+        )
 
         session.commit()
-        
-        "remove all rows from qtreeview and refresh"
-        self.model().removeRows(0, self.model().rowCount())
-        """
-    Upon connection to an existing database, populates the project tree in the left-hand pane of the
-    main window based on what projects have been saved to the database.
-    """
-
-    # Open up the connection to the database
-        
-        # Query all the countries
-        countries = session.query(
-            CountryTable.country_id,
-            CountryTable.country_name,
-            CountryTable.project_id
-        ).all()
-
-        # Append each row one at a time, brute force method. For each country, add state rows, and
-        # for each state, add LOB rows.
-
-        for country_id, country, country_uuid in countries:
-
-            country_item = ProjectItem(
-                text=country,
-                set_bold=True
-            )
-
-            country_row = [
-                country_item,
-                QStandardItem(country_uuid)
-            ]
-
-            states = session.query(
-                StateTable.state_id,
-                StateTable.state_name,
-                StateTable.project_id
-            ).filter(
-                StateTable.country_id == country_id
-            )
-
-            for state_id, state, state_uuid in states:
-
-                state_item = ProjectItem(
-                    state,
-                )
-
-                state_row = [state_item, QStandardItem(state_uuid)]
-
-                lobs = session.query(
-                    LOBTable.lob_type, LOBTable.project_id
-                ).join(
-                    LocationTable
-                ).join(
-                    StateTable
-                ).filter(
-                    StateTable.country_id == country_id
-                ).filter(
-                    StateTable.state_id == state_id
-                )
-
-                for lob, lob_uuid in lobs:
-                    lob_item = ProjectItem(
-                        lob,
-                        text_color=QColor(0, 77, 122)
-                    )
-
-                    lob_row = [lob_item, QStandardItem(lob_uuid)]
-
-                    state_item.appendRow(lob_row)
-
-                country_item.appendRow(state_row)
-
-            self.parent.project_root.appendRow(country_row)
-
-        self.parent.project_pane.expandAll()
 
+        session.close()
         connection.close()
+
+        # remove only the affected rows from the project tree
+        self.model().remove_project(project_id=uuid)
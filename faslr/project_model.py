@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+from array import array
+
+from faslr.connection import get_session_factory
+
+from faslr.style.project import DEFAULT_PROJECT_FONT
+
+from faslr.utilities.queries import (
+    fetch_countries,
+    fetch_lobs,
+    fetch_states
+)
+
+from PyQt6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    Qt
+)
+
+from PyQt6.QtGui import (
+    QColor,
+    QFont
+)
+
+from typing import Any
+
+# Levels of the project hierarchy. The invisible root node sits above the countries.
+ROOT_LEVEL = -1
+COUNTRY_LEVEL = 0
+STATE_LEVEL = 1
+LOB_LEVEL = 2
+
+PROJECT_HEADERS = [
+    "Project",
+    "Project_UUID"
+]
+
+
+class ProjectTreeModel(QAbstractItemModel):
+    """
+    Item model for the country/state/LOB project hierarchy shown in the left-hand pane of the main window.
+
+    Children are only queried from the database the first time their parent is expanded, via canFetchMore() and
+    fetchMore(). Nodes are stored in flat arrays indexed by a node id, which is also the internal id of each model
+    index, rather than as one QStandardItem per cell. Node 0 is the invisible root. A map from project uuid to node
+    id lets projects be inserted and removed in place, without reading the tree again.
+    """
+    def __init__(
+            self,
+            db_path: str = None
+    ):
+        super().__init__()
+
+        self.db_path = db_path
+
+        # Fonts and colors are shared by every node on the same level.
+        self.fonts = {}
+        for level in [COUNTRY_LEVEL, STATE_LEVEL, LOB_LEVEL]:
+            self.fonts[level] = QFont(
+                DEFAULT_PROJECT_FONT,
+                12
+            )
+        self.fonts[COUNTRY_LEVEL].setBold(True)
+
+        self.colors = {
+            COUNTRY_LEVEL: QColor(0, 0, 0),
+            STATE_LEVEL: QColor(0, 0, 0),
+            LOB_LEVEL: QColor(0, 77, 122)
+        }
+
+        self.names = None
+        self.uuids = None
+        self.levels = None
+        self.parents = None
+        self.rows = None
+        self.keys = None
+        self.children = None
+        self.project_nodes = None
+
+        self.clear_nodes()
+
+    def clear_nodes(self) -> None:
+        """
+        Discards every node except the invisible root.
+        """
+
+        self.names = [None]
+        self.uuids = [None]
+        # Position of each node among its siblings.
+        self.rows = array('l', [0])
+        self.levels = array('b', [ROOT_LEVEL])
+        self.parents = array('l', [0])
+        # Database key used to query the children of a node: the country id for countries and the location id
+        # for states.
+        self.keys = array('l', [0])
+        # Child node ids of each node, None until they have been fetched from the database.
+        self.children = [None]
+        # Node id of each fetched project, keyed by project uuid.
+        self.project_nodes = {}
+
+    def set_database(
+            self,
+            db_path: str
+    ) -> None:
+        """
+        Points the model at a database. Only the top level is read, once the view asks for it.
+        """
+
+        self.beginResetModel()
+        self.db_path = db_path
+        self.clear_nodes()
+        self.endResetModel()
+
+    def refresh(self) -> None:
+        """
+        Drops all fetched nodes, so that the tree is read again from the database as it is expanded.
+        """
+
+        self.set_database(db_path=self.db_path)
+
+    def node(
+            self,
+            index: QModelIndex
+    ) -> int:
+
+        if index.isValid():
+            return index.internalId()
+        else:
+            return 0
+
+    def node_index(
+            self,
+            node: int
+    ) -> QModelIndex:
+
+        if node == 0:
+            return QModelIndex()
+
+        return self.createIndex(
+            self.rows[node],
+            0,
+            node
+        )
+
+    def find(
+            self,
+            project_id: str
+    ) -> QModelIndex:
+        """
+        Returns the index of a project, or an invalid index if it has not been fetched.
+        """
+
+        node = self.project_nodes.get(project_id)
+
+        if node is None:
+            return QModelIndex()
+
+        return self.node_index(node=node)
+
+    def level(
+            self,
+            index: QModelIndex
+    ) -> int:
+        """
+        Returns the hierarchy level of an index, i.e., COUNTRY_LEVEL, STATE_LEVEL or LOB_LEVEL.
+        """
+
+        return self.levels[self.node(index)]
+
+    def index(
+            self,
+            row: int,
+            column: int,
+            parent: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+
+        children = self.children[self.node(parent)]
+
+        if children is None or not 0 <= row < len(children) or not 0 <= column < len(PROJECT_HEADERS):
+            return QModelIndex()
+
+        return self.createIndex(
+            row,
+            column,
+            children[row]
+        )
+
+    def parent(
+            self,
+            index: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+
+        if not index.isValid():
+            return QModelIndex()
+
+        return self.node_index(node=self.parents[index.internalId()])
+
+    def rowCount(
+            self,
+            parent: QModelIndex = QModelIndex()
+    ) -> int:
+
+        if parent.column() > 0:
+            return 0
+
+        children = self.children[self.node(parent)]
+
+        if children is None:
+            return 0
+
+        return len(children)
+
+    def columnCount(
+            self,
+            parent: QModelIndex = QModelIndex()
+    ) -> int:
+
+        return len(PROJECT_HEADERS)
+
+    def hasChildren(
+            self,
+            parent: QModelIndex = QModelIndex()
+    ) -> bool:
+
+        node = self.node(parent)
+
+        if parent.column() > 0 or self.levels[node] == LOB_LEVEL:
+            return False
+
+        # Unfetched nodes show an expansion arrow, their children are only looked up once it is clicked.
+        if self.children[node] is None:
+            return self.db_path is not None
+
+        return len(self.children[node]) > 0
+
+    def canFetchMore(
+            self,
+            parent: QModelIndex
+    ) -> bool:
+
+        node = self.node(parent)
+
+        return self.db_path is not None and \
+            self.levels[node] != LOB_LEVEL and \
+            self.children[node] is None
+
+    def fetchMore(
+            self,
+            parent: QModelIndex
+    ) -> None:
+
+        node = self.node(parent)
+        level = self.levels[node]
+
+        session = get_session_factory(db_path=self.db_path)()
+
+        try:
+            if level == ROOT_LEVEL:
+                rows = fetch_countries(session=session)
+            elif level == COUNTRY_LEVEL:
+                rows = fetch_states(
+                    session=session,
+                    country_id=self.keys[node]
+                )
+            else:
+                rows = fetch_lobs(
+                    session=session,
+                    location_id=self.keys[node]
+                )
+        finally:
+            session.close()
+
+        self.children[node] = []
+
+        if not rows:
+            return
+
+        self.beginInsertRows(
+            parent,
+            0,
+            len(rows) - 1
+        )
+
+        for key, name, uuid in rows:
+            self.add_node(
+                parent_node=node,
+                name=name,
+                uuid=uuid,
+                key=key
+            )
+
+        self.endInsertRows()
+
+    def add_node(
+            self,
+            parent_node: int,
+            name: str,
+            uuid: str,
+            key: int
+    ) -> int:
+        """
+        Appends a node to the arrays, as the last child of its parent. Does not notify attached views.
+        """
+
+        node = len(self.names)
+        siblings = self.children[parent_node]
+
+        self.names.append(name)
+        self.uuids.append(uuid)
+        self.rows.append(len(siblings))
+        self.levels.append(self.levels[parent_node] + 1)
+        self.parents.append(parent_node)
+        self.keys.append(key)
+        self.children.append(None)
+
+        siblings.append(node)
+        self.project_nodes[uuid] = node
+
+        return node
+
+    def add_project(
+            self,
+            path: list
+    ) -> None:
+        """
+        Inserts a newly created project into the tree. The path holds a (key, name, uuid) tuple for the country,
+        state and LOB of the project. Only the nodes missing under already fetched parents are inserted, everything
+        else is read from the database when it is expanded.
+        """
+
+        node = 0
+
+        for key, name, uuid in path:
+            siblings = self.children[node]
+
+            if siblings is None:
+                return
+
+            child = self.project_nodes.get(uuid)
+
+            if child is None:
+                row = len(siblings)
+
+                self.beginInsertRows(
+                    self.node_index(node=node),
+                    row,
+                    row
+                )
+
+                child = self.add_node(
+                    parent_node=node,
+                    name=name,
+                    uuid=uuid,
+                    key=key
+                )
+
+                self.endInsertRows()
+
+            node = child
+
+    def remove_project(
+            self,
+            project_id: str
+    ) -> None:
+        """
+        Removes a project and its descendants from the tree. Their slots in the node arrays are left unused until
+        the next refresh.
+        """
+
+        node = self.project_nodes.get(project_id)
+
+        if node is None:
+            return
+
+        parent_node = self.parents[node]
+        row = self.rows[node]
+        siblings = self.children[parent_node]
+
+        self.beginRemoveRows(
+            self.node_index(node=parent_node),
+            row,
+            row
+        )
+
+        del siblings[row]
+
+        for position in range(row, len(siblings)):
+            self.rows[siblings[position]] = position
+
+        self.forget(node=node)
+
+        self.endRemoveRows()
+
+    def forget(
+            self,
+            node: int
+    ) -> None:
+        """
+        Drops a node and its fetched descendants from the project id map.
+        """
+
+        self.project_nodes.pop(self.uuids[node], None)
+
+        for child in self.children[node] or []:
+            self.forget(node=child)
+
+    def data(
+            self,
+            index: QModelIndex,
+            role: int = None
+    ) -> Any:
+
+        if not index.isValid():
+            return None
+
+        node = index.internalId()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return self.names[node]
+            else:
+                return self.uuids[node]
+
+        if index.column() == 0:
+            if role == Qt.ItemDataRole.FontRole:
+                return self.fonts[self.levels[node]]
+
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self.colors[self.levels[node]]
+
+    def headerData(
+            self,
+            p_int: int,
+            qt_orientation: Qt.Orientation,
+            role: int = None
+    ) -> Any:
+
+        if role == Qt.ItemDataRole.DisplayRole and qt_orientation == Qt.Orientation.Horizontal:
+            return PROJECT_HEADERS[p_int]
+
+    def flags(
+            self,
+            index: QModelIndex
+    ) -> Qt.ItemFlag:
+
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
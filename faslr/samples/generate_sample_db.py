@@ -6,7 +6,10 @@ import pandas as pd
 import sqlalchemy as sa
 
 from faslr import schema
-from faslr.utilities.queries import delete_country
+from faslr.utilities.queries import (
+    bulk_insert_view_data,
+    delete_country
+)
 
 from faslr.schema import (
     UserTable,
@@ -15,8 +18,7 @@ from faslr.schema import (
     StateTable,
     LOBTable,
     ProjectTable,
-    ProjectViewTable,
-    ProjectViewData
+    ProjectViewTable
 )
 
 from sqlalchemy.orm import sessionmaker
@@ -107,16 +109,13 @@ df_steady_state.columns = [
             'reported_loss'
 ]
 
-df_steady_state['view_id'] = project_view.view_id
-
-data_list = df_steady_state.to_dict('records')
-
-obj_list = []
-for record in data_list:
-    data_obj = ProjectViewData(**record)
-    obj_list.append(data_obj)
+n_rows, rows_per_second = bulk_insert_view_data(
+    connection=session.connection(),
+    data=df_steady_state,
+    view_id=project_view.view_id
+)
 
-session.add_all(obj_list)
+print("Inserted {:,} rows ({:,.0f} rows/s)".format(n_rows, rows_per_second))
 
 session.commit()
 session.close()
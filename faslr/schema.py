@@ -7,6 +7,8 @@ from sqlalchemy import (
     DateTime,
     Integer,
     ForeignKey,
+    Index,
+    LargeBinary,
     String,
 )
 
@@ -65,7 +67,8 @@ class CountryTable(Base):
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     location_id = Column(
@@ -73,10 +76,14 @@ class CountryTable(Base):
         ForeignKey(
             'location.location_id',
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
-    country_name = Column(String)
+    country_name = Column(
+        String,
+        index=True
+    )
 
     location = relationship(
         "LocationTable",
@@ -122,7 +129,8 @@ class StateTable(Base):
         ForeignKey(
             "location.location_id",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
     country_id = Column(
@@ -130,12 +138,14 @@ class StateTable(Base):
         ForeignKey(
             "country.country_id",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     state_name = Column(String)
@@ -188,12 +198,14 @@ class LOBTable(Base):
         ForeignKey(
             'location.location_id',
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     location = relationship(
@@ -340,7 +352,8 @@ class ProjectViewTable(Base):
 
     project_id = Column(
         String,
-        ForeignKey("project.project_id")
+        ForeignKey("project.project_id"),
+        index=True
     )
 
     project = relationship(
@@ -367,6 +380,17 @@ class ProjectViewTable(Base):
 class ProjectViewData(Base):
     __tablename__ = 'project_view_data'
 
+    # Triangles are looked up by view, and each view holds at most one row per origin/calendar period cell.
+    __table_args__ = (
+        Index(
+            'ix_project_view_data_view_cell',
+            'view_id',
+            'accident_year',
+            'calendar_year',
+            unique=True
+        ),
+    )
+
     record_id = Column(
         Integer,
         primary_key=True
@@ -396,3 +420,41 @@ class ProjectViewData(Base):
     case_outstanding = Column(
         Float
     )
+
+
+class ProjectViewSnapshot(Base):
+    __tablename__ = 'project_view_snapshot'
+
+    # The finished triangle of a view, stored as a compressed npz blob so that it can be opened without rebuilding
+    # it from the view's project_view_data rows, which are kept as the record of what was imported.
+    view_id = Column(
+        Integer,
+        ForeignKey('project_view.view_id'),
+        primary_key=True
+    )
+
+    origin_grain = Column(
+        String
+    )
+
+    development_grain = Column(
+        String
+    )
+
+    # Shape of the values array, index x columns x origin x development, e.g., '1,2,10,10'.
+    shape = Column(
+        String
+    )
+
+    format_version = Column(
+        Integer
+    )
+
+    created = Column(
+        DateTime,
+        default=datetime.now
+    )
+
+    data = Column(
+        LargeBinary
+    )
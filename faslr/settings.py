@@ -8,8 +8,17 @@ import os
 
 from faslr.constants import (
     CONFIG_PATH,
+    DEFAULT_SQLITE_PROFILE,
     QT_FILEPATH_OPTION,
-    SETTINGS_LIST
+    SETTINGS_LIST,
+    SQLITE_PROFILES
+)
+
+from faslr.connection import dispose_engines
+
+from faslr.utilities.sqlite import (
+    read_sqlite_pragmas,
+    reset_sqlite_pragmas
 )
 
 from PyQt6.QtCore import (
@@ -19,9 +28,11 @@ from PyQt6.QtCore import (
 )
 
 from PyQt6.QtWidgets import (
+    QComboBox,
     QDialog,
     QDialogButtonBox,
     QFileDialog,
+    QFormLayout,
     QLabel,
     QListView,
     QPushButton,
@@ -64,6 +75,10 @@ class SettingsDialog(QDialog):
         self.config.sections()
         self.startup_db = self.config['STARTUP_CONNECTION']['startup_db']
 
+        # Configuration files written by earlier versions have no database section.
+        if not self.config.has_section('DATABASE'):
+            self.config['DATABASE'] = {'performance_profile': DEFAULT_SQLITE_PROFILE}
+
         self.resize(1000, 700)
         self.setWindowTitle("Settings")
 
@@ -85,14 +100,20 @@ class SettingsDialog(QDialog):
         self.startup_connected_container = QWidget()
         self.startup_unconnected_container = QWidget()
         self.user_container = QWidget()
+        self.database_container = QWidget()
+
+        self.profile_combo = QComboBox()
+        self.pragma_labels = {}
 
         self.startup_unconnected_layout()
         self.startup_connected_layout()
         self.user_layout()
+        self.database_layout()
 
         self.configuration_layout.addWidget(self.startup_connected_container)
         self.configuration_layout.addWidget(self.startup_unconnected_container)
         self.configuration_layout.addWidget(self.user_container)
+        self.configuration_layout.addWidget(self.database_container)
         self.configuration_layout.setCurrentIndex(0)
         self.list_pane.setCurrentIndex(self.list_model.index(0))
         self.update_config_layout(self.list_pane.currentIndex())
@@ -125,6 +146,8 @@ class SettingsDialog(QDialog):
                 self.configuration_layout.setCurrentIndex(1)
         elif index.data() == "User":
             self.configuration_layout.setCurrentIndex(2)
+        elif index.data() == "Database":
+            self.configuration_layout.setCurrentIndex(3)
 
     def startup_unconnected_layout(self):
         """
@@ -169,6 +192,55 @@ class SettingsDialog(QDialog):
         delete_configuration_button.clicked.connect(self.delete_configuration)
         self.user_container.setLayout(layout)
 
+    def database_layout(self):
+        """
+        Layout that lets the user pick the SQLite performance profile, and shows the pragmas that it applies to each
+        new database connection.
+        :return:
+        """
+        layout = QVBoxLayout()
+        form = QFormLayout()
+
+        self.profile_combo.addItems(SQLITE_PROFILES.keys())
+        self.profile_combo.setCurrentText(self.config['DATABASE'].get('performance_profile', DEFAULT_SQLITE_PROFILE))
+        form.addRow("Performance profile: ", self.profile_combo)
+
+        for pragma in SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE].keys():
+            self.pragma_labels[pragma] = QLabel()
+            form.addRow(pragma + ": ", self.pragma_labels[pragma])
+
+        layout.addLayout(form)
+        layout.addWidget(QLabel("Changes apply to new database connections."))
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.update_pragma_labels()
+        # noinspection PyUnresolvedReferences
+        self.profile_combo.currentTextChanged.connect(self.set_performance_profile)
+        self.database_container.setLayout(layout)
+
+    def set_performance_profile(self, profile_name):
+        """
+        Saves the selected SQLite performance profile to the configuration file, and closes the pooled connections
+        so that the new pragmas apply from the next connection on.
+        :return:
+        """
+        self.config['DATABASE']['performance_profile'] = profile_name
+        with open(self.config_path, 'w') as configfile:
+            self.config.write(configfile)
+
+        reset_sqlite_pragmas()
+        dispose_engines()
+        self.update_pragma_labels()
+
+    def update_pragma_labels(self):
+        """
+        Shows the pragma values of the active profile, including any overrides in the configuration file.
+        :return:
+        """
+        pragmas = read_sqlite_pragmas(config_path=self.config_path)
+
+        for pragma, label in self.pragma_labels.items():
+            label.setText(str(pragmas[pragma]))
+
     def reset_connection(self):
         """
         This method decouples the database from automatic connection upon startup, and returns the layout
@@ -12,4 +12,6 @@ RATIO_STYLE = "{0:,.3f}"
 
 VALUE_STYLE = "{0:,.0f}"
 
+HEATMAP_CMAP = "coolwarm"
+
 PERCENT_STYLE = "{:.1%}"
\ No newline at end of file
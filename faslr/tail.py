@@ -22,6 +22,8 @@ from faslr.constants import (
     ICONS_PATH
 )
 
+from faslr.utilities.model_cache import get_model_cache
+
 from functools import partial
 
 from matplotlib.backends.backend_qt5agg import (
@@ -230,6 +232,9 @@ class TailPane(QWidget):
         tcs = []
         tcds = []
 
+        # Candidates whose settings did not change since the last redraw are not fitted again.
+        model_cache = get_model_cache()
+
         # fit tail
         for config in self.tail_candidates:
 
@@ -243,12 +248,15 @@ class TailPane(QWidget):
                 attach = tail_params.constant_config.sb_attach.spin_box.value()
                 projection = tail_params.constant_config.sb_projection.spin_box.value()
 
-                tc = cl.TailConstant(
-                    tail=tail_constant,
-                    decay=decay,
-                    attachment_age=attach,
-                    projection_period=projection
-                ).fit_transform(self.triangle)
+                tc = model_cache.fit_transform(
+                    estimator=cl.TailConstant(
+                        tail=tail_constant,
+                        decay=decay,
+                        attachment_age=attach,
+                        projection_period=projection
+                    ),
+                    triangle=self.triangle
+                )
 
             elif gb_tail_type.curve_btn.isChecked():
 
@@ -262,7 +270,7 @@ class TailPane(QWidget):
                 attachment_age = curve_config.attachment_age.spin_box.value()
                 projection_period = curve_config.projection.spin_box.value()
 
-                tc = cl.TailCurve(
+                tail_curve = cl.TailCurve(
                     curve=curve,
                     fit_period=(
                         fit_from,
@@ -273,20 +281,14 @@ class TailPane(QWidget):
                     attachment_age=attachment_age,
                     projection_period=projection_period
 
-                ).fit_transform(self.triangle)
+                )
 
-                tcd = cl.TailCurve(
-                    curve=curve,
-                    fit_period=(
-                        fit_from,
-                        fit_to
-                    ),
-                    extrap_periods=extrap_periods,
-                    errors=errors,
-                    attachment_age=attachment_age,
-                    projection_period=projection_period
+                tcd = model_cache.fit(
+                    estimator=tail_curve,
+                    triangle=self.triangle
+                )
 
-                ).fit(self.triangle)
+                tc = tcd.transform(self.triangle)
 
                 tcds.append(tcd)
 
@@ -297,11 +299,14 @@ class TailPane(QWidget):
                 attachment_age = bondy.attachment_age.spin_box.value()
                 projection_period = bondy.projection.spin_box.value()
 
-                tc = cl.TailBondy(
-                    earliest_age=earliest_age,
-                    attachment_age=attachment_age,
-                    projection_period=projection_period
-                ).fit_transform(self.triangle)
+                tc = model_cache.fit_transform(
+                    estimator=cl.TailBondy(
+                        earliest_age=earliest_age,
+                        attachment_age=attachment_age,
+                        projection_period=projection_period
+                    ),
+                    triangle=self.triangle
+                )
 
             elif gb_tail_type.clark_btn.isChecked():
 
@@ -312,12 +317,15 @@ class TailPane(QWidget):
                 attachment_age = clark.attachment_age.spin_box.value()
                 projection_period = clark.projection.spin_box.value()
 
-                tc = cl.TailClark(
-                    growth=growth,
-                    truncation_age=truncation_age,
-                    attachment_age=attachment_age,
-                    projection_period=projection_period
-                ).fit_transform(self.triangle)
+                tc = model_cache.fit_transform(
+                    estimator=cl.TailClark(
+                        growth=growth,
+                        truncation_age=truncation_age,
+                        attachment_age=attachment_age,
+                        projection_period=projection_period
+                    ),
+                    triangle=self.triangle
+                )
             else:
                 raise Exception("Invalid tail type selected.")
 
@@ -438,7 +446,10 @@ class TailPane(QWidget):
 
             # base
 
-            tcb = cl.Development().fit_transform(self.triangle)
+            tcb = model_cache.fit_transform(
+                estimator=cl.Development(),
+                triangle=self.triangle
+            )
             obs = (tcb.ldf_ - 1).T.iloc[:, 0]
             obs[obs < 0] = np.nan
             ax = np.log(obs).rename('Selected LDF')
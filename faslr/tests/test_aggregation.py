@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chainladder import Triangle
+
+from faslr.utilities.aggregation import (
+    aggregate_transactions,
+    build_triangle,
+    month_keys,
+    period_key_grain
+)
+
+
+def make_transactions(n, seed=0):
+    rng = np.random.default_rng(seed)
+
+    loss = np.datetime64('2015-01-01') + rng.integers(0, 365 * 5, n).astype('timedelta64[D]')
+    report = loss + rng.integers(0, 200, n).astype('timedelta64[D]')
+    transaction = report + rng.integers(0, 1000, n).astype('timedelta64[D]')
+
+    return pd.DataFrame({
+        'claim_id': rng.integers(0, n // 4, n),
+        'loss_date': loss,
+        'report_date': report,
+        'transaction_date': transaction,
+        'paid': rng.gamma(2, 500, n)
+    })
+
+
+def test_month_keys():
+    keys = month_keys(np.array(['2000-01-15', '2001-12-31', 'NaT'], dtype='datetime64[D]'))
+
+    assert keys.tolist() == [24000, 24023, -1]
+
+
+def test_aggregate_transactions_matches_groupby():
+    df = make_transactions(n=20000)
+    evaluation = np.datetime64('2019-12-31')
+
+    triangle = aggregate_transactions(
+        loss_date=df['loss_date'],
+        transaction_date=df['transaction_date'],
+        paid=df['paid'],
+        origin_grain='Annual',
+        development_grain='Quarterly',
+        evaluation_date=evaluation
+    )
+
+    paid = triangle.values['Paid Loss']
+
+    # Reference: group the transactions on their origin year and age in quarters with pandas.
+    kept = df[df['transaction_date'] <= evaluation]
+    origin = kept['loss_date'].dt.year
+    age = (kept['transaction_date'].dt.year - origin) * 12 + kept['transaction_date'].dt.month - 1
+    expected = kept.groupby([origin, age // 3])['paid'].sum().unstack(fill_value=0).cumsum(axis=1)
+
+    assert paid.shape == (5, 20)
+    assert triangle.n_dropped == df.shape[0] - kept.shape[0]
+
+    for row, year in enumerate(range(2015, 2020)):
+        n_observed = 4 * (2020 - year)
+        expected_row = expected.loc[year].reindex(range(n_observed)).ffill().fillna(0)
+
+        np.testing.assert_allclose(paid[row, :n_observed], expected_row.values)
+        assert np.isnan(paid[row, n_observed:]).all()
+
+    # The latest diagonal of each origin year is valued at the evaluation date.
+    frame = triangle.to_frame()
+    assert frame.groupby('Origin')['Valuation'].max().eq(pd.Timestamp(evaluation)).all()
+
+
+def test_aggregate_transactions_counts_claims():
+    df = make_transactions(n=5000)
+
+    triangle = aggregate_transactions(
+        loss_date=df['loss_date'],
+        transaction_date=df['transaction_date'],
+        paid=df['paid'],
+        claim_id=df['claim_id'],
+        report_date=df['report_date']
+    )
+
+    counts = triangle.values['Reported Count']
+
+    # At the latest evaluation every claim has been reported exactly once.
+    latest = np.nanmax(counts, axis=1)
+    assert latest.sum() == df['claim_id'].nunique()
+
+
+def test_aggregate_transactions_rejects_coarser_development_grain():
+    df = make_transactions(n=10)
+
+    with pytest.raises(ValueError):
+        aggregate_transactions(
+            loss_date=df['loss_date'],
+            transaction_date=df['transaction_date'],
+            paid=df['paid'],
+            origin_grain='Quarterly',
+            development_grain='Annual'
+        )
+
+
+def test_period_key_grain():
+    assert period_key_grain(np.array([2008, 2009])) == 'Annual'
+    assert period_key_grain(np.array([20081, 20094])) == 'Quarterly'
+    assert period_key_grain(np.array([200801.0, 200912.0])) == 'Monthly'
+
+    assert period_key_grain(np.array([20085])) is None
+    assert period_key_grain(np.array([200813])) is None
+    assert period_key_grain(np.array([2008, 20081])) is None
+    assert period_key_grain(np.array([2008.5])) is None
+    assert period_key_grain(np.array(['2008'])) is None
+
+
+def test_build_triangle_matches_constructor():
+    rng = np.random.default_rng(0)
+    n = 2000
+
+    origin = rng.integers(0, 24, n)
+    development = np.minimum(origin + rng.integers(0, 24, n), 23)
+
+    data = pd.DataFrame({
+        'Accident Month': 200800 + 100 * (origin // 12) + origin % 12 + 1,
+        'Calendar Month': 200800 + 100 * (development // 12) + development % 12 + 1,
+        'Paid Loss': rng.gamma(2, 500, n)
+    })
+
+    # Repeated rows of the same cell are summed, as the constructor does.
+    expected = Triangle(
+        data=data,
+        origin='Accident Month',
+        development='Calendar Month',
+        columns=['Paid Loss'],
+        cumulative=False
+    )
+
+    triangle = build_triangle(
+        data=data,
+        origin='Accident Month',
+        development='Calendar Month',
+        columns=['Paid Loss'],
+        cumulative=False
+    )
+
+    assert triangle.shape == expected.shape
+    assert triangle.development_grain == 'M'
+    np.testing.assert_allclose(triangle.values, expected.values)
+
+    # Quarter keys are read as quarters, with annual origins.
+    data = pd.DataFrame({
+        'Accident Year': [2008, 2008, 2008, 2008, 2009],
+        'Calendar Quarter': [20081, 20082, 20083, 20084, 20092],
+        'Paid Loss': [100.0, 50.0, 20.0, 10.0, 70.0]
+    })
+
+    triangle = build_triangle(
+        data=data,
+        origin='Accident Year',
+        development='Calendar Quarter',
+        columns=['Paid Loss'],
+        cumulative=False
+    )
+
+    assert triangle.origin_grain == 'Y'
+    assert triangle.development_grain == 'Q'
+    assert triangle.ddims.tolist()[:4] == [3, 6, 9, 12]
+    assert np.nansum(triangle.values) == 250.0
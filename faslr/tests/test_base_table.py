@@ -0,0 +1,89 @@
+import os
+import pandas as pd
+
+from faslr.constants import (
+    AddColumnRole,
+    ColumnSwapRole
+)
+from faslr.exhibit import ExhibitModel
+
+from PyQt6.QtCore import (
+    QModelIndex,
+    Qt
+)
+from PyQt6.QtGui import QStandardItem
+from PyQt6.QtWidgets import QApplication
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+app = QApplication.instance() or QApplication([])
+
+
+def record_signals(model):
+    signals = []
+
+    model.layoutChanged.connect(lambda *args: signals.append(('layout',)))  # noqa
+    model.modelReset.connect(lambda: signals.append(('reset',)))  # noqa
+    model.dataChanged.connect(lambda top_left, bottom_right, roles: signals.append(  # noqa
+        ('data', top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+    ))
+    model.headerDataChanged.connect(lambda orientation, first, last: signals.append(  # noqa
+        ('header', orientation, first, last)
+    ))
+    model.columnsInserted.connect(lambda parent, first, last: signals.append(('columns', first, last)))  # noqa
+
+    return signals
+
+
+def test_set_frame():
+    model = ExhibitModel()
+    signals = record_signals(model)
+
+    model.set_frame(data=pd.DataFrame({'a': [1, 2], 'b': [3, 4]}))
+
+    assert signals == [('reset',)]
+
+    signals.clear()
+
+    model.set_frame(data=pd.DataFrame({'a': [5, 6], 'c': [7, 8]}))
+
+    # A frame of the same shape changes the cells and headers in place.
+    assert signals == [
+        ('data', 0, 0, 1, 1),
+        ('header', Qt.Orientation.Horizontal, 0, 1),
+        ('header', Qt.Orientation.Vertical, 0, 1)
+    ]
+    assert list(model._data.columns) == ['a', 'c']
+
+
+def test_exhibit_model_first_column():
+    model = ExhibitModel()
+    signals = record_signals(model)
+
+    model.setData(index=QModelIndex(), value=('a', [1, 2]), role=AddColumnRole)
+
+    # The rows arrive with the first column, so the model is reset.
+    assert signals == [('reset',)]
+    assert (model.rowCount(), model.columnCount()) == (2, 1)
+
+
+def test_exhibit_model_columns():
+    model = ExhibitModel()
+    model.set_frame(data=pd.DataFrame({'a': [1, 2], 'b': [3, 4], 'c': [5, 6]}))
+
+    signals = record_signals(model)
+
+    model.setData(index=QModelIndex(), value=('a', [7, 8]), role=AddColumnRole)
+
+    assert signals == [('columns', 3, 3)]
+    assert list(model._data.columns) == ['a', 'b', 'c', 'a.1']
+
+    signals.clear()
+
+    model.setData(index=QModelIndex(), value=(QStandardItem('b'), QStandardItem('a.1')), role=ColumnSwapRole)
+
+    # Only the columns between the swapped ones are signaled, without a layout change.
+    assert signals == [
+        ('data', 0, 1, 1, 3),
+        ('header', Qt.Orientation.Horizontal, 1, 3)
+    ]
+    assert list(model._data.columns) == ['a', 'a.1', 'c', 'b']
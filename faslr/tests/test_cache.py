@@ -0,0 +1,65 @@
+import chainladder as cl
+import os
+
+from faslr.utilities.cache import (
+    TriangleCache,
+    read_cache_settings
+)
+
+
+def test_triangle_cache_evicts_least_recently_used():
+    cache = TriangleCache(max_entries=2)
+    raa = cl.load_sample('raa')
+
+    builds = []
+
+    def build():
+        builds.append(1)
+        return raa
+
+    cache.get_or_build(key=('raa', 1), build=build)
+    cache.get_or_build(key=('raa', 2), build=build)
+    cache.get_or_build(key=('raa', 1), build=build)
+    assert len(builds) == 2
+
+    # Key 2 is now the least recently used entry.
+    cache.put(key=('raa', 3), triangle=raa)
+    assert cache.get(key=('raa', 2)) is None
+    assert cache.get(key=('raa', 1)) == raa
+    assert cache.hits == 2
+
+    # Callers get copies, so changing one does not change the cached triangle.
+    triangle = cache.get(key=('raa', 3))
+    triangle.values[0, 0, 0, 0] = 0
+    assert cache.get(key=('raa', 3)) == raa
+
+
+def test_triangle_disk_cache(tmp_path):
+    cache_path = str(tmp_path / 'triangles')
+    raa = cl.load_sample('raa')
+
+    cache = TriangleCache(cache_path=cache_path)
+    cache.put(key=('raa', 1), triangle=raa)
+
+    # A new cache, e.g., in the next session, finds the triangle on disk.
+    cache = TriangleCache(cache_path=cache_path)
+    assert cache.get(key=('raa', 1)) == raa
+    assert cache.get(key=('raa', 2)) is None
+
+    file_size = os.path.getsize(cache.file_path(key=('raa', 1)))
+
+    cache = TriangleCache(cache_path=cache_path, max_disk_bytes=file_size)
+    cache.put(key=('raa', 2), triangle=raa)
+    assert len(os.listdir(cache_path)) == 1
+    assert os.path.exists(cache.file_path(key=('raa', 2)))
+
+
+def test_read_cache_settings(tmp_path):
+    config_path = str(tmp_path / 'faslr.ini')
+
+    assert not read_cache_settings(config_path=config_path)[0]
+
+    with open(config_path, 'w') as file:
+        file.write("[CACHE]\ndisk_cache = True\ncache_path = %s\n" % tmp_path)
+
+    assert read_cache_settings(config_path=config_path) == (True, str(tmp_path))
@@ -0,0 +1,45 @@
+import sqlalchemy as sa
+
+from faslr.connection import (
+    FaslrConnection,
+    dispose_engine,
+    dispose_engines,
+    get_engine
+)
+
+
+def test_engine_is_shared_per_database(tmp_path):
+    db_path = str(tmp_path / 'shared.db')
+
+    engine = get_engine(db_path=db_path)
+
+    assert get_engine(db_path=db_path) is engine
+    assert not engine.echo
+
+    with FaslrConnection(db_path=db_path) as faslr_conn:
+        assert faslr_conn.engine is engine
+        assert faslr_conn.connection.execute(sa.text('SELECT 1')).scalar() == 1
+        assert engine.pool.checkedout() == 1
+
+    # Both the session and the connection are returned to the pool on exit.
+    assert engine.pool.checkedout() == 0
+
+    dispose_engine(db_path=db_path)
+
+    assert get_engine(db_path=db_path) is not engine
+
+    dispose_engine(db_path=db_path)
+
+
+def test_dispose_engines(tmp_path):
+    db_paths = [str(tmp_path / 'first.db'), str(tmp_path / 'second.db')]
+
+    engines = [get_engine(db_path=db_path) for db_path in db_paths]
+
+    dispose_engines()
+
+    # Each database gets a new engine, whose connections pick up the current pragmas.
+    for db_path, engine in zip(db_paths, engines):
+        assert get_engine(db_path=db_path) is not engine
+
+    dispose_engines()
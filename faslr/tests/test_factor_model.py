@@ -0,0 +1,186 @@
+import chainladder as cl
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+from faslr.factor import (
+    FactorModel,
+    FactorView
+)
+from faslr.style.triangle import (
+    EXCL_FACTOR_COLOR,
+    LOWER_DIAG_COLOR,
+    MAIN_TRIANGLE_COLOR
+)
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+# Fonts need an application object, but not a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+app = QApplication.instance() or QApplication([])
+
+
+def test_factor_model_exclusions_and_heatmap():
+    raa = cl.load_sample('raa')
+
+    model = FactorModel(triangle=raa)
+
+    ratio = model.index(1, 1)
+    assert ratio.data() == '1.259'
+    assert model.data(ratio, Qt.ItemDataRole.BackgroundRole) == MAIN_TRIANGLE_COLOR
+    assert not model.data(ratio, Qt.ItemDataRole.FontRole).strikeOut()
+
+    # Cells below the latest diagonal.
+    assert model.data(model.index(8, 1), Qt.ItemDataRole.BackgroundRole) == LOWER_DIAG_COLOR
+
+    ldf = model.index(model.triangle_spacer_row, 1).data()
+
+    model.toggle_exclude(index=ratio)
+
+    assert model.dirty_columns == {1}
+
+    model.recalculate_factors()
+
+    assert not model.dirty_columns
+    assert model.excluded[1, 1]
+    assert model.data(ratio, Qt.ItemDataRole.BackgroundRole) == EXCL_FACTOR_COLOR
+    assert model.data(ratio, Qt.ItemDataRole.FontRole).strikeOut()
+    assert model.index(model.triangle_spacer_row, 1).data() != ldf
+
+    colors = np.zeros((*model.link_frame.shape, 4), dtype=np.uint8)
+    colors[...] = [255, 0, 0, 255]
+    colors[0, 0] = [0, 0, 255, 255]
+
+    model.set_heatmap(colors=colors)
+    model.heatmap_checked = True
+
+    assert len(model.heatmap_palette) == 2
+    assert model.data(model.index(0, 0), Qt.ItemDataRole.BackgroundRole) == QColor('#0000ff')
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.BackgroundRole) == QColor('#ff0000')
+    # Excluded link ratios are left out of the heatmap.
+    assert model.data(ratio, Qt.ItemDataRole.BackgroundRole) == EXCL_FACTOR_COLOR
+
+    model.update_heatmap()
+    excluded_palette = model.heatmap_palette
+
+    # Colors follow exclusions, and are reused when an exclusion state comes back.
+    model.edit_factors(exclusions=[(1, 1)])
+    assert model.heatmap_palette is not excluded_palette
+    assert len(model.heatmap_cache) == 2
+
+    model.edit_factors(exclusions=[(1, 1)])
+    assert model.heatmap_palette is excluded_palette
+
+    # The CDF row stays blank until an LDF is selected.
+    assert model.index(model.cdf_row_num, 0).data() == ''
+
+    model.select_factor(index=model.index(model.triangle_spacer_row, 0))
+
+    assert model.index(model.selected_row_num, 0).data() == model.index(model.triangle_spacer_row, 0).data()
+    assert pd.notna(model.cdf_row.iloc[0, 0])
+
+
+def test_factor_model_batch_edits():
+    raa = cl.load_sample('raa')
+
+    model = FactorModel(triangle=raa)
+
+    changes = []
+    model.dataChanged.connect(lambda top_left, bottom_right: changes.append(  # noqa
+        (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+    ))
+
+    model.edit_factors(exclusions=[(0, 0), (2, 0), (4, 0)])
+
+    # Only the struck link ratios and the averages of their column change.
+    assert changes == [(0, 0, model.selected_spacer_row - 1, 0)]
+    assert model.excluded[[0, 2, 4], 0].all()
+
+    changes.clear()
+
+    model.edit_factors(selections=[(model.triangle_spacer_row, 2), (model.triangle_spacer_row, 3)])
+
+    assert len(changes) == 1
+    assert model.selected_row.iloc[0, 2] == model.factor_frame.iloc[0, 2]
+    assert model.selected_row.iloc[0, 3] == model.factor_frame.iloc[0, 3]
+
+    model.edit_factors(deletions=[2])
+
+    assert pd.isna(model.selected_row.iloc[0, 2])
+    assert model.selected_row.iloc[0, 3] == model.factor_frame.iloc[0, 3]
+
+    ratios = model.link_frame.iloc[:, 1]
+    included = ratios[~model.excluded[:, 1]].dropna()
+
+    model.exclude_high_low(columns=[1, 1])
+
+    assert model.excluded[ratios.index.get_loc(included.idxmax()), 1]
+    assert model.excluded[ratios.index.get_loc(included.idxmin()), 1]
+    assert model.excluded[:, 1].sum() == 2
+
+
+def test_factor_view_paste():
+    raa = cl.load_sample('raa')
+
+    model = FactorModel(triangle=raa)
+
+    view = FactorView()
+    view.setModel(model)
+
+    changes = []
+    model.dataChanged.connect(lambda *args: changes.append(args))  # noqa
+
+    QApplication.clipboard().setText("1.5\t1.25\t\tn/a\r\n")
+
+    view.setCurrentIndex(model.index(model.selected_row_num, 1))
+    view.paste_selection()
+
+    assert len(changes) == 1
+    assert pd.isna(model.selected_row.iloc[0, 0])
+    assert model.selected_row.iloc[0, 1:3].tolist() == [1.5, 1.25]
+    assert model.selected_row.iloc[0, 3:].isna().all()
+    assert model.cdf_row.iloc[0, 1] == 1.5 * 1.25
+    assert model.index(model.selected_row_num, 1).data() == '1.500'
+
+    # A column of factors is pasted across the row.
+    QApplication.clipboard().setText("2\n3\n")
+
+    view.setCurrentIndex(model.index(model.selected_row_num, 7))
+    view.paste_selection()
+
+    assert model.selected_row.iloc[0, 7:].tolist() == [2, 3]
+
+
+def test_factor_model_rebuild_inserts_rows():
+    raa = cl.load_sample('raa')
+
+    model = FactorModel(triangle=raa)
+
+    signals = []
+    model.layoutChanged.connect(lambda *args: signals.append(('layout',)))  # noqa
+    model.rowsInserted.connect(lambda parent, first, last: signals.append(('rows', first, last)))  # noqa
+    model.rowsRemoved.connect(lambda parent, first, last: signals.append(('removed', first, last)))  # noqa
+
+    spacer_row = model.selected_spacer_row
+    row_count = model.rowCount()
+
+    model.ldf_types.iloc[1:3, 0] = True
+    model.recalculate_factors()
+
+    # The new averages are inserted after the existing ones.
+    assert signals == [('rows', spacer_row, spacer_row + 1)]
+    assert model.rowCount() == row_count + 2
+    assert float(model.index(spacer_row, 0).data()) == pytest.approx(model.factor_frame.iloc[1, 0], abs=5e-4)
+    assert model.headerData(spacer_row + 1, Qt.Orientation.Vertical, Qt.ItemDataRole.DisplayRole) == \
+        "5-year volume-weighted"
+
+    signals.clear()
+
+    model.ldf_types.iloc[:3, 0] = [True, False, False]
+    model.recalculate_factors()
+
+    assert signals == [('removed', spacer_row, spacer_row + 1)]
+    assert model.rowCount() == row_count
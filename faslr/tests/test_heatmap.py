@@ -0,0 +1,50 @@
+import numpy as np
+
+from faslr.utilities.heatmap import (
+    color_palette,
+    heatmap_colors,
+    heatmap_positions
+)
+
+
+def test_heatmap_positions():
+    ratios = np.array([
+        [1.5, 2.0],
+        [1.2, 3.0],
+        [1.8, np.nan],
+        [np.nan, np.nan]
+    ])
+
+    positions = heatmap_positions(ratios=ratios)
+
+    # Ranks are stretched over the rows in each column, and missing ratios go to the middle.
+    np.testing.assert_allclose(positions[:, 0], [0.5, 0, 1, 0.5])
+    np.testing.assert_allclose(positions[:, 1], [0, 1, 0.5, 0.5])
+
+    excluded = np.zeros(ratios.shape, dtype=bool)
+    excluded[2, 0] = True
+
+    positions = heatmap_positions(ratios=ratios, excluded=excluded)
+
+    np.testing.assert_allclose(positions[:, 0], [1, 0, 0.5, 0.5])
+
+
+def test_heatmap_colors():
+    ratios = np.array([
+        [1.5, 2.0],
+        [1.2, 3.0],
+        [1.8, np.nan]
+    ])
+
+    colors = heatmap_colors(ratios=ratios, cmap='coolwarm')
+
+    assert colors.shape == (3, 2, 4)
+    assert colors.dtype == np.uint8
+    # The lowest ratios are blue and the highest red.
+    assert colors[1, 0, 2] > colors[1, 0, 0]
+    assert colors[2, 0, 0] > colors[2, 0, 2]
+
+    palette, index = color_palette(colors=colors)
+
+    assert len(palette) == len(np.unique(colors.reshape(-1, 4), axis=0))
+    assert (palette[index] == colors).all()
@@ -0,0 +1,110 @@
+import io
+
+import pandas as pd
+import pytest
+
+from faslr.utilities.importer import (
+    aggregate_file,
+    read_preview
+)
+
+CSV = """origin,development,paid,reported,notes
+2000,2000,100,200,a
+2000,2001,150,210,b
+2000,2001,50,,c
+2001,2001,90,180,d
+,2001,10,10,e
+2001,2002,x,190,f
+"""
+
+
+def test_read_preview(tmp_path):
+    path = tmp_path / 'losses.csv'
+    path.write_text(CSV)
+
+    preview = read_preview(file_path=str(path), n_rows=2)
+
+    assert list(preview.columns) == ['origin', 'development', 'paid', 'reported', 'notes']
+    assert preview.shape[0] == 2
+
+
+def test_aggregate_file(tmp_path):
+    path = tmp_path / 'losses.csv'
+    path.write_text(CSV)
+
+    progress = []
+
+    cells, n_rows, n_dropped = aggregate_file(
+        file_path=str(path),
+        origin='origin',
+        development='development',
+        values=['paid', 'reported'],
+        chunk_size=2,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert n_rows == 6
+    assert n_dropped == 1
+
+    # Unmapped columns are not read, and duplicate cells are summed across chunks.
+    assert list(cells.columns) == ['origin', 'development', 'paid', 'reported']
+    assert cells[['origin', 'development']].values.tolist() == [[2000, 2000], [2000, 2001], [2001, 2001], [2001, 2002]]
+    assert cells['paid'].tolist()[:3] == [100, 200, 90]
+    assert cells['reported'].tolist() == [200, 210, 180, 190]
+    assert cells['paid'].isna().tolist()[3]
+
+    assert len(progress) == 3
+    assert progress[-1] == (path.stat().st_size, path.stat().st_size)
+
+
+def test_aggregate_file_cancelled(tmp_path):
+    path = tmp_path / 'losses.csv'
+    path.write_text(CSV)
+
+    cells, n_rows, n_dropped = aggregate_file(
+        file_path=str(path),
+        origin='origin',
+        development='development',
+        values=['paid'],
+        chunk_size=2,
+        cancelled=lambda: True
+    )
+
+    assert cells is None
+    assert n_rows == 0
+
+
+@pytest.mark.parametrize('extension', ['.parquet', '.feather'])
+def test_aggregate_columnar_file(tmp_path, extension):
+    pytest.importorskip('pyarrow')
+
+    data = pd.read_csv(io.StringIO(CSV))
+    path = str(tmp_path / ('losses' + extension))
+
+    # Write several row groups/record batches, so that the file is read in more than one chunk.
+    if extension == '.parquet':
+        data.to_parquet(path, row_group_size=2)
+    else:
+        data.to_feather(path, chunksize=2)
+
+    preview = read_preview(file_path=path, n_rows=2)
+    assert list(preview.columns) == ['origin', 'development', 'paid', 'reported', 'notes']
+    assert preview.shape[0] == 2
+
+    progress = []
+
+    cells, n_rows, n_dropped = aggregate_file(
+        file_path=path,
+        origin='origin',
+        development='development',
+        values=['reported'],
+        chunk_size=2,
+        progress_callback=lambda done, total: progress.append((done, total))
+    )
+
+    assert n_rows == 6
+    assert n_dropped == 1
+    assert list(cells.columns) == ['origin', 'development', 'reported']
+    assert cells['reported'].tolist() == [200, 210, 180, 190]
+    assert len(progress) == 3
+    assert progress[-1][0] == progress[-1][1]
@@ -0,0 +1,126 @@
+import chainladder as cl
+import numpy as np
+import pytest
+
+from faslr.utilities.ldf import (
+    cdf_from_ldfs,
+    latest_diagonal,
+    ldf_averages,
+    link_arrays,
+    n_periods_mask,
+    ultimate_losses,
+    window_starts
+)
+
+
+@pytest.mark.parametrize('sample', ['raa', 'genins', 'quarterly'])
+@pytest.mark.parametrize('average', ['volume', 'simple', 'regression'])
+@pytest.mark.parametrize('n_periods', [-1, 2, 5])
+def test_ldf_averages(sample, average, n_periods):
+    triangle = cl.load_sample(sample)
+
+    if sample == 'quarterly':
+        triangle = triangle['paid']
+
+    link_frame = triangle.link_ratio.to_frame(origin_as_datetime=False)
+
+    excluded = np.zeros(link_frame.shape, dtype=bool)
+    excluded[1, 1] = True
+    excluded[3, 0] = True
+
+    drop = [
+        (str(link_frame.index[i]), int(str(link_frame.columns[j]).split('-')[0])) for i, j in np.argwhere(excluded)
+    ]
+
+    development = cl.Development(
+        drop=drop,
+        n_periods=[n_periods] * link_frame.shape[1],
+        average=average
+    ).fit(triangle)
+
+    x, y = link_arrays(triangle=triangle)
+
+    included = np.ones(x.shape, dtype=bool)
+    included[:excluded.shape[0]] = ~excluded
+
+    starts = window_starts(mask=n_periods_mask(triangle=triangle, n_periods=n_periods))
+
+    averages = ldf_averages(
+        x=x,
+        y=y,
+        included=included,
+        windows=[(average, starts)]
+    )[0]
+
+    np.testing.assert_allclose(averages, development.ldf_.values[0, 0, 0], rtol=1e-12)
+
+    # Averages of a subset of columns are the same as those of the whole triangle.
+    np.testing.assert_allclose(
+        ldf_averages(x=x[:, 2:4], y=y[:, 2:4], included=included[:, 2:4], windows=[(average, starts[2:4])])[0],
+        averages[2:4],
+        rtol=1e-12
+    )
+
+
+def test_geometric_and_medial_averages():
+    x = np.array([
+        [1.0, 2.0],
+        [1.0, 2.0],
+        [1.0, 2.0],
+        [1.0, np.nan],
+        [1.0, np.nan]
+    ])
+
+    y = np.array([
+        [2.0, 3.0],
+        [4.0, 5.0],
+        [8.0, -1.0],
+        [1.0, np.nan],
+        [16.0, np.nan]
+    ])
+
+    included = np.ones(x.shape, dtype=bool)
+    included[0, 0] = False
+
+    averages = ldf_averages(
+        x=x,
+        y=y,
+        included=included,
+        windows=[
+            ('geometric', np.array([0, 0])),
+            ('medial', np.array([0, 0])),
+            ('medial', np.array([3, 1])),
+            ('geometric', np.array([5, 0]))
+        ]
+    )
+
+    # Ratios of 4, 8, 1 and 16 in the first column, 1.5, 2.5 and -0.5 in the second.
+    np.testing.assert_allclose(averages[0], [np.exp(np.log([4, 8, 1, 16]).mean()), np.nan])
+    np.testing.assert_allclose(averages[1], [6, 1.5])
+    np.testing.assert_allclose(averages[2], [8.5, 1])
+    np.testing.assert_allclose(averages[3], [np.nan, np.nan])
+
+
+def test_cdf_and_ultimate_losses():
+    raa = cl.load_sample('raa')
+
+    ldfs = np.linspace(2, 1, 9)
+    ldfs[4] = np.nan
+
+    patterns = {age: ldf for age, ldf in zip(raa.development[:-1], ldfs)}
+
+    selected = cl.DevelopmentConstant(
+        patterns=patterns,
+        style="ldf"
+    ).fit_transform(raa)
+
+    cdfs = cdf_from_ldfs(ldfs=ldfs)
+
+    assert np.array_equal(cdfs, selected.cdf_.values[0, 0, 0])
+
+    latest, latest_index = latest_diagonal(triangle=raa)
+
+    assert np.array_equal(
+        ultimate_losses(latest=latest, latest_index=latest_index, cdfs=cdfs),
+        cl.Chainladder().fit(selected).ultimate_.values[0, 0, :, 0]
+    )
@@ -0,0 +1,63 @@
+import chainladder as cl
+
+from faslr.constants import MODEL_CACHE_SIZE
+from faslr.utilities.model_cache import (
+    ModelCache,
+    read_model_cache_size,
+    triangle_fingerprint
+)
+
+
+def test_model_cache_reuses_fits():
+    cache = ModelCache(max_entries=2)
+    raa = cl.load_sample('raa')
+
+    development = cache.fit(estimator=cl.Development(n_periods=3), triangle=raa)
+
+    # A new estimator with the same parameters, fitted to an equal triangle, is a hit.
+    assert cache.fit(estimator=cl.Development(n_periods=3), triangle=raa.copy()) is development
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Different parameters, a different triangle or a transform are misses.
+    cache.fit(estimator=cl.Development(n_periods=5), triangle=raa)
+
+    changed = raa.copy()
+    changed.values[0, 0, 0, 0] += 1
+    assert triangle_fingerprint(triangle=changed) != triangle_fingerprint(triangle=raa)
+
+    tail = cache.fit_transform(estimator=cl.TailConstant(tail=1.05), triangle=changed)
+    assert tail.tail_.values[0, 0] == 1.05
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    # The 3-year fit is now the least recently used entry.
+    assert len(cache.entries) == 2
+    cache.fit(estimator=cl.Development(n_periods=3), triangle=raa)
+    assert cache.misses == 4
+
+
+def test_model_cache_tells_developments_apart():
+    cache = ModelCache()
+    raa = cl.load_sample('raa')
+
+    # Both developments carry the values of raa, but different LDFs.
+    volume = cl.Development().fit_transform(raa)
+    dropped = cl.Development(drop_high=True, preserve=2).fit_transform(raa)
+
+    assert triangle_fingerprint(triangle=volume) != triangle_fingerprint(triangle=dropped)
+
+    cache.fit_transform(estimator=cl.TailConstant(tail=1.05), triangle=volume)
+    tail = cache.fit_transform(estimator=cl.TailConstant(tail=1.05), triangle=dropped)
+
+    assert cache.misses == 2
+    assert tail.cdf_ == cl.TailConstant(tail=1.05).fit_transform(dropped).cdf_
+
+
+def test_read_model_cache_size(tmp_path):
+    config_path = str(tmp_path / 'faslr.ini')
+
+    assert read_model_cache_size(config_path=config_path) == MODEL_CACHE_SIZE
+
+    with open(config_path, 'w') as file:
+        file.write("[CACHE]\nmodel_cache_size = 8\n")
+
+    assert read_model_cache_size(config_path=config_path) == 8
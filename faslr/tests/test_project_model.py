@@ -0,0 +1,111 @@
+import os
+import sqlalchemy as sa
+
+from faslr import schema
+from faslr.connection import dispose_engine
+from faslr.project_model import (
+    COUNTRY_LEVEL,
+    LOB_LEVEL,
+    ProjectTreeModel,
+    STATE_LEVEL
+)
+
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtWidgets import QApplication
+
+# The model builds fonts, which needs an application object, but not a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+app = QApplication.instance() or QApplication([])
+
+
+def make_db(db_path):
+    engine = sa.create_engine('sqlite:///' + db_path)
+    schema.Base.metadata.create_all(engine)
+
+    with engine.begin() as connection:
+        connection.execute(sa.insert(schema.LocationTable.__table__), [
+            {'location_id': 1, 'hierarchy': 'country'},
+            {'location_id': 2, 'hierarchy': 'state'}
+        ])
+        connection.execute(sa.insert(schema.ProjectTable.__table__), [
+            {'project_id': 'usa'},
+            {'project_id': 'texas'},
+            {'project_id': 'auto'}
+        ])
+        connection.execute(sa.insert(schema.CountryTable.__table__), [
+            {'country_id': 1, 'country_name': 'USA', 'location_id': 1, 'project_id': 'usa'}
+        ])
+        connection.execute(sa.insert(schema.StateTable.__table__), [
+            {'state_id': 1, 'state_name': 'Texas', 'country_id': 1, 'location_id': 2, 'project_id': 'texas'}
+        ])
+        connection.execute(sa.insert(schema.LOBTable.__table__), [
+            {'lob_type': 'Auto', 'location_id': 2, 'project_id': 'auto'}
+        ])
+
+    engine.dispose()
+
+
+def test_project_tree_fetches_on_expand(tmp_path):
+    db_path = str(tmp_path / 'tree.db')
+    make_db(db_path=db_path)
+
+    model = ProjectTreeModel()
+    model.set_database(db_path=db_path)
+
+    root = QModelIndex()
+
+    # Nothing is read until the view asks for the top level.
+    assert model.rowCount(root) == 0
+    assert model.canFetchMore(root)
+
+    model.fetchMore(root)
+    assert model.rowCount(root) == 1
+
+    country = model.index(0, 0, root)
+    assert country.data() == 'USA'
+    assert country.siblingAtColumn(1).data() == 'usa'
+    assert model.level(country) == COUNTRY_LEVEL
+    assert model.hasChildren(country)
+    assert model.rowCount(country) == 0
+
+    model.fetchMore(country)
+    state = model.index(0, 0, country)
+    assert state.data() == 'Texas'
+    assert model.level(state) == STATE_LEVEL
+    assert model.parent(state) == country
+
+    model.fetchMore(state)
+    lob = model.index(0, 0, state)
+    assert lob.data() == 'Auto'
+    assert model.level(lob) == LOB_LEVEL
+    assert not model.hasChildren(lob)
+    assert not model.canFetchMore(lob)
+
+    # New projects are only inserted under parents that have been fetched.
+    model.add_project(path=[
+        (1, 'USA', 'usa'),
+        (2, 'Texas', 'texas'),
+        (2, 'Home', 'home')
+    ])
+    assert model.rowCount(state) == 2
+    assert model.find('home') == model.index(1, 0, state)
+
+    model.add_project(path=[
+        (1, 'USA', 'usa'),
+        (3, 'Ohio', 'ohio'),
+        (3, 'Auto', 'oh_auto')
+    ])
+    ohio = model.find('ohio')
+    assert ohio.row() == 1
+    assert model.rowCount(ohio) == 0
+    assert not model.find('oh_auto').isValid()
+
+    model.remove_project(project_id='texas')
+    assert model.rowCount(country) == 1
+    assert model.find('ohio').row() == 0
+    assert not model.find('home').isValid()
+
+    model.refresh()
+    assert model.rowCount(root) == 0
+
+    dispose_engine(db_path=db_path)
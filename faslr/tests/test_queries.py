@@ -0,0 +1,363 @@
+import chainladder as cl
+import datetime as dt
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from faslr import schema
+from faslr.data import build_view_triangle
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    LocationTable,
+    ProjectTable,
+    ProjectViewData,
+    ProjectViewTable,
+    StateTable
+)
+from faslr.utilities.queries import (
+    bulk_insert_view_data,
+    count_project_views,
+    delete_project_node,
+    fetch_project_views,
+    fetch_view_cells,
+    view_period_grains
+)
+
+from sqlalchemy.orm import sessionmaker
+
+
+def test_bulk_insert_view_data():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    project_view = ProjectViewTable(name="Test")
+    session.add(project_view)
+    session.flush()
+
+    data = pd.DataFrame({
+        'accident_year': [2000, 2000, 2001],
+        'calendar_year': [2000, 2001, 2001],
+        'paid_loss': [100.0, 150.0, 90.0],
+        'reported_loss': [200.0, 210.0, 180.0]
+    })
+
+    progress = []
+
+    n_rows, rows_per_second = bulk_insert_view_data(
+        connection=session.connection(),
+        data=data,
+        view_id=project_view.view_id,
+        batch_size=2,
+        progress_callback=lambda written, total: progress.append((written, total))
+    )
+
+    session.commit()
+
+    assert n_rows == 3
+    assert rows_per_second > 0
+    assert progress == [(2, 3), (3, 3)]
+
+    rows = session.query(
+        ProjectViewData.view_id,
+        ProjectViewData.calendar_year,
+        ProjectViewData.paid_loss
+    ).order_by(ProjectViewData.record_id).all()
+
+    assert rows == [
+        (project_view.view_id, 2000, 100.0),
+        (project_view.view_id, 2001, 150.0),
+        (project_view.view_id, 2001, 90.0)
+    ]
+
+    session.close()
+
+
+def test_bulk_insert_view_data_sums_duplicate_cells():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    project_view = ProjectViewTable(name="Test")
+    session.add(project_view)
+    session.flush()
+
+    data = pd.DataFrame({
+        'accident_year': [2000, 2000, 2000],
+        'calendar_year': [2000, 2001, 2001],
+        'paid_loss': [100.0, 150.0, 50.0]
+    })
+
+    n_rows, rows_per_second = bulk_insert_view_data(
+        connection=session.connection(),
+        data=data,
+        view_id=project_view.view_id
+    )
+
+    session.commit()
+
+    assert n_rows == 2
+
+    rows = session.query(
+        ProjectViewData.calendar_year,
+        ProjectViewData.paid_loss
+    ).order_by(ProjectViewData.calendar_year).all()
+
+    assert rows == [(2000, 100.0), (2001, 200.0)]
+
+    session.close()
+
+
+def make_hierarchy(session):
+    """
+    One country with two states, each with one LOB. The first LOB has a view.
+    """
+    session.execute(sa.insert(LocationTable.__table__), [
+        {'location_id': 1, 'hierarchy': 'country'},
+        {'location_id': 2, 'hierarchy': 'state'},
+        {'location_id': 3, 'hierarchy': 'state'}
+    ])
+    session.execute(sa.insert(ProjectTable.__table__), [
+        {'project_id': project_id} for project_id in ['usa', 'texas', 'ohio', 'tx_auto', 'oh_auto']
+    ])
+    session.execute(sa.insert(CountryTable.__table__), [
+        {'country_id': 1, 'country_name': 'USA', 'location_id': 1, 'project_id': 'usa'}
+    ])
+    session.execute(sa.insert(StateTable.__table__), [
+        {'state_id': 1, 'state_name': 'Texas', 'country_id': 1, 'location_id': 2, 'project_id': 'texas'},
+        {'state_id': 2, 'state_name': 'Ohio', 'country_id': 1, 'location_id': 3, 'project_id': 'ohio'}
+    ])
+    session.execute(sa.insert(LOBTable.__table__), [
+        {'lob_type': 'Auto', 'location_id': 2, 'project_id': 'tx_auto'},
+        {'lob_type': 'Auto', 'location_id': 3, 'project_id': 'oh_auto'}
+    ])
+    session.add(ProjectViewTable(name="Test", project_id='tx_auto'))
+    session.commit()
+
+
+def test_delete_project_node():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    make_hierarchy(session=session)
+
+    assert delete_project_node(session=session, project_id='oh_auto') == ['oh_auto']
+    session.commit()
+    assert session.query(LOBTable.project_id).all() == [('tx_auto',)]
+
+    deleted = delete_project_node(session=session, project_id='usa')
+    session.commit()
+
+    assert sorted(deleted) == ['ohio', 'texas', 'tx_auto', 'usa']
+
+    for table in [LocationTable, ProjectTable, CountryTable, StateTable, LOBTable]:
+        assert session.query(table).count() == 0
+
+    # Views of deleted projects are kept but detached.
+    assert session.query(ProjectViewTable.project_id).all() == [(None,)]
+
+    assert delete_project_node(session=session, project_id='usa') == []
+
+    session.close()
+
+
+def test_fetch_project_views():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    make_hierarchy(session=session)
+
+    for i in range(5):
+        session.add(ProjectViewTable(name="Paid %d" % i, description="Auto", project_id='oh_auto'))
+    session.add(ProjectViewTable(name="Reported", description="Auto", project_id='oh_auto'))
+    session.commit()
+
+    # Views of other projects are not counted.
+    assert count_project_views(session=session, project_id='oh_auto') == 6
+    assert count_project_views(session=session, project_id='oh_auto', name_filter='Paid') == 5
+
+    page = fetch_project_views(
+        session=session,
+        project_id='oh_auto',
+        sort_column='name',
+        descending=True,
+        limit=2,
+        offset=1
+    )
+
+    assert [row.name for row in page] == ['Paid 4', 'Paid 3']
+
+    page = fetch_project_views(
+        session=session,
+        project_id='oh_auto',
+        name_filter='Rep'
+    )
+
+    assert [row.name for row in page] == ['Reported']
+
+    session.close()
+
+
+def test_filter_project_views():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    make_hierarchy(session=session)
+
+    for i, name in enumerate(["100% paid", "1000 paid", "paid_auto", "paidXauto"]):
+        session.add(ProjectViewTable(
+            name=name,
+            project_id='oh_auto',
+            created=dt.datetime(2023, 1, 1 + i, 12),
+            modified=dt.datetime(2023, 6, 1 + i, 12)
+        ))
+    session.commit()
+
+    def names(**kwargs):
+        return [row.name for row in fetch_project_views(session=session, project_id='oh_auto', **kwargs)]
+
+    # Wildcards typed by the user are matched literally.
+    assert names(name_filter='%') == ["100% paid"]
+    assert names(name_filter='_') == ["paid_auto"]
+
+    # Date ranges include their end dates, and may be open on either side.
+    assert names(created_range=(dt.date(2023, 1, 2), dt.date(2023, 1, 3))) == ["1000 paid", "paid_auto"]
+    assert names(modified_range=(None, dt.date(2023, 6, 1))) == ["100% paid"]
+    assert names(modified_range=(dt.date(2023, 6, 4), None)) == ["paidXauto"]
+    assert count_project_views(
+        session=session,
+        project_id='oh_auto',
+        name_filter='paid',
+        created_range=(dt.date(2023, 1, 3), None)
+    ) == 2
+
+    session.close()
+
+
+def test_fetch_view_cells():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    project_view = ProjectViewTable(name="Monthly")
+    session.add(project_view)
+    session.flush()
+
+    # Monthly accident and calendar periods, e.g., 200803 for March 2008, over two years.
+    months = [(year, month) for year in [2008, 2009] for month in range(1, 13)]
+    rng = np.random.default_rng(seed=1)
+
+    data = pd.DataFrame(
+        [
+            (origin[0] * 100 + origin[1], calendar[0] * 100 + calendar[1])
+            for i, origin in enumerate(months) for calendar in months[i:]
+        ],
+        columns=['accident_year', 'calendar_year']
+    )
+    data['paid_loss'] = rng.integers(0, 100, data.shape[0]).astype(float)
+    data['reported_loss'] = rng.integers(0, 100, data.shape[0]).astype(float)
+
+    bulk_insert_view_data(
+        connection=session.connection(),
+        data=data,
+        view_id=project_view.view_id
+    )
+
+    origin_month = (data['accident_year'] // 100) * 12 + data['accident_year'] % 100 - 1
+    calendar_month = (data['calendar_year'] // 100) * 12 + data['calendar_year'] % 100 - 1
+
+    for grain, months_per_period in [('Quarterly', 3), ('Annual', 12)]:
+        frame = data.assign(
+            origin=origin_month // months_per_period * months_per_period,
+            valuation=calendar_month // months_per_period * months_per_period + months_per_period - 1
+        )
+
+        # Incremental values are summed over each period.
+        expected = frame.groupby(['origin', 'valuation'])[['paid_loss', 'reported_loss']].sum().reset_index()
+
+        rows = fetch_view_cells(
+            session=session,
+            view_id=project_view.view_id,
+            origin_grain=grain,
+            development_grain=grain,
+            cumulative=False
+        )
+
+        assert [tuple(row) for row in rows] == list(expected.itertuples(index=False, name=None))
+
+        # Cumulative values are taken at the last month of each period.
+        last = frame[frame.groupby(['accident_year', 'valuation'])['calendar_year'].transform('max') ==
+                     frame['calendar_year']]
+        expected = last.groupby(['origin', 'valuation'])[['paid_loss', 'reported_loss']].sum().reset_index()
+
+        rows = fetch_view_cells(
+            session=session,
+            view_id=project_view.view_id,
+            origin_grain=grain,
+            development_grain=grain
+        )
+
+        assert [tuple(row) for row in rows] == list(expected.itertuples(index=False, name=None))
+
+    # The stored grain is kept by default.
+    rows = fetch_view_cells(
+        session=session,
+        view_id=project_view.view_id
+    )
+
+    assert len(rows) == data.shape[0]
+    assert tuple(rows[0]) == (2008 * 12, 2008 * 12, data['paid_loss'][0], data['reported_loss'][0])
+
+    with pytest.raises(ValueError):
+        fetch_view_cells(
+            session=session,
+            view_id=project_view.view_id,
+            origin_grain='Quarterly',
+            development_grain='Annual'
+        )
+
+    session.close()
+
+
+def test_build_dated_view_triangle():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    project_view = ProjectViewTable(name="Dated", cumulative=True)
+    session.add(project_view)
+    session.flush()
+
+    raa = cl.load_sample('raa')
+    frame = raa.dev_to_val().to_frame(keepdims=True).reset_index()
+
+    # Periods stored as date strings, as imported from a file, rather than integer period keys.
+    data = pd.DataFrame({
+        'accident_year': frame['origin'].dt.strftime('%Y-%m-%d'),
+        'calendar_year': frame['valuation'].dt.strftime('%Y-%m-%d'),
+        'paid_loss': frame['values'],
+        'reported_loss': frame['values']
+    })
+
+    bulk_insert_view_data(
+        connection=session.connection(),
+        data=data,
+        view_id=project_view.view_id
+    )
+
+    assert view_period_grains(session=session, view_id=project_view.view_id) is None
+
+    with pytest.raises(ValueError):
+        fetch_view_cells(session=session, view_id=project_view.view_id)
+
+    triangle = build_view_triangle(session=session, view_id=project_view.view_id)
+
+    assert (triangle.origin_grain, triangle.development_grain) == ('Y', 'Y')
+    assert np.array_equal(triangle['Paid Loss'].values, raa.values, equal_nan=True)
+
+    session.close()
@@ -0,0 +1,66 @@
+import chainladder as cl
+import numpy as np
+import sqlalchemy as sa
+
+from faslr import schema
+from faslr.schema import (
+    ProjectViewSnapshot,
+    ProjectViewTable
+)
+from faslr.utilities.queries import (
+    fetch_view_snapshot,
+    save_view_snapshot
+)
+from faslr.utilities.snapshot import (
+    snapshot_to_triangle,
+    triangle_to_snapshot
+)
+
+from sqlalchemy.orm import sessionmaker
+
+
+def test_snapshot_round_trip():
+
+    for triangle in [cl.load_sample('clrd').iloc[:3], cl.load_sample('quarterly')]:
+        restored = snapshot_to_triangle(snapshot=triangle_to_snapshot(triangle=triangle))
+
+        assert restored == triangle
+        assert restored.key_labels == triangle.key_labels
+        assert restored.valuation_date == triangle.valuation_date
+        assert restored.development_grain == triangle.development_grain
+        assert restored.is_cumulative
+
+        # The restored triangle supports the usual slicing and development methods.
+        assert restored.iloc[0, 0].link_ratio == triangle.iloc[0, 0].link_ratio
+
+        np.testing.assert_allclose(
+            cl.Chainladder().fit(restored).ultimate_.set_backend('numpy').values,
+            cl.Chainladder().fit(triangle).ultimate_.set_backend('numpy').values
+        )
+
+
+def test_save_view_snapshot():
+    engine = sa.create_engine('sqlite://')
+    schema.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    project_view = ProjectViewTable(name="RAA")
+    session.add(project_view)
+    session.flush()
+
+    assert fetch_view_snapshot(session=session, view_id=project_view.view_id) is None
+
+    raa = cl.load_sample('raa')
+
+    save_view_snapshot(session=session, view_id=project_view.view_id, triangle=raa)
+    # Saving again replaces the snapshot.
+    save_view_snapshot(session=session, view_id=project_view.view_id, triangle=raa)
+    session.commit()
+
+    snapshot = session.query(ProjectViewSnapshot).one()
+    assert snapshot.shape == '1,1,10,10'
+    assert snapshot.origin_grain == 'Y'
+
+    assert fetch_view_snapshot(session=session, view_id=project_view.view_id) == raa
+
+    session.close()
@@ -0,0 +1,48 @@
+import sqlite3
+
+from faslr.constants import SQLITE_PROFILES
+from faslr.utilities.sqlite import (
+    apply_sqlite_pragmas,
+    read_sqlite_pragmas
+)
+
+
+def test_read_sqlite_pragmas(tmp_path):
+    config_path = tmp_path / 'faslr.ini'
+
+    # Missing files fall back to the default profile.
+    assert read_sqlite_pragmas(config_path=str(config_path)) == SQLITE_PROFILES['Performance']
+
+    config_path.write_text(
+        "[DATABASE]\n"
+        "performance_profile = Standard\n"
+        "cache_size = -4000\n"
+    )
+
+    pragmas = read_sqlite_pragmas(config_path=str(config_path))
+
+    assert pragmas['journal_mode'] == 'DELETE'
+    assert pragmas['cache_size'] == '-4000'
+
+
+def test_apply_sqlite_pragmas(tmp_path):
+    connection = sqlite3.connect(str(tmp_path / 'profile.db'))
+
+    apply_sqlite_pragmas(
+        dbapi_connection=connection,
+        pragmas=SQLITE_PROFILES['Performance']
+    )
+
+    assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    # NORMAL
+    assert connection.execute('PRAGMA synchronous').fetchone()[0] == 1
+    assert connection.execute('PRAGMA cache_size').fetchone()[0] == -65536
+
+    apply_sqlite_pragmas(
+        dbapi_connection=connection,
+        pragmas={'cache_size': '1; DROP TABLE x'}
+    )
+
+    assert connection.execute('PRAGMA cache_size').fetchone()[0] == -65536
+
+    connection.close()
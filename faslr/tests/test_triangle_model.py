@@ -0,0 +1,47 @@
+import chainladder as cl
+import os
+
+from faslr.style.triangle import (
+    BLANK_TEXT,
+    LOWER_DIAG_COLOR
+)
+from faslr.triangle_model import TriangleModel
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+# Fonts need an application object, but not a display.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+app = QApplication.instance() or QApplication([])
+
+
+def test_triangle_model_data():
+    raa = cl.load_sample('raa')
+
+    model = TriangleModel(triangle=raa, value_type='value')
+
+    assert model.rowCount() == 10
+    assert model.columnCount() == 10
+    assert model.headerData(0, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole) == '12'
+    assert model.headerData(0, Qt.Orientation.Vertical, Qt.ItemDataRole.DisplayRole) == '1981'
+
+    first = model.index(0, 0)
+    assert first.data() == '5,012'
+    assert first.data(Qt.ItemDataRole.TextAlignmentRole) == Qt.AlignmentFlag.AlignRight
+    assert first.data(Qt.ItemDataRole.BackgroundRole) is None
+
+    # Cells below the latest diagonal are blank and shaded.
+    lower = model.index(9, 1)
+    assert lower.data() == BLANK_TEXT
+    assert lower.data(Qt.ItemDataRole.BackgroundRole) == LOWER_DIAG_COLOR
+
+    # The same display string is returned on every paint.
+    assert model.data(first, Qt.ItemDataRole.DisplayRole) is model.data(first, Qt.ItemDataRole.DisplayRole)
+
+    model = TriangleModel(triangle=raa.link_ratio, value_type='ratio')
+
+    assert model.index(0, 0).data() == '1.650'
+    assert not model.index(0, 0).data(Qt.ItemDataRole.FontRole).strikeOut()
+
+    model.excluded[0, 0] = True
+    assert model.index(0, 0).data(Qt.ItemDataRole.FontRole).strikeOut()
@@ -0,0 +1,35 @@
+import sqlalchemy as sa
+
+from faslr import schema
+from faslr.connection import (
+    dispose_engine,
+    upgrade_db
+)
+
+
+def test_upgrade_db_adds_indexes(tmp_path):
+    db_path = str(tmp_path / 'old.db')
+    engine = sa.create_engine('sqlite:///' + db_path)
+    schema.Base.metadata.create_all(engine)
+
+    # Simulate a database created before the indexes were added to the schema.
+    with engine.begin() as connection:
+        for table in schema.Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(sa.text('DROP INDEX ' + index.name))
+
+    assert sa.inspect(engine).get_indexes('project_view_data') == []
+
+    upgrade_db(db_path=db_path)
+
+    inspector = sa.inspect(engine)
+
+    view_data_indexes = inspector.get_indexes('project_view_data')
+    assert view_data_indexes[0]['column_names'] == ['view_id', 'accident_year', 'calendar_year']
+    assert view_data_indexes[0]['unique']
+
+    state_indexes = [index['column_names'] for index in inspector.get_indexes('state')]
+    assert ['country_id'] in state_indexes
+
+    engine.dispose()
+    dispose_engine(db_path=db_path)
@@ -0,0 +1,49 @@
+import os
+
+from faslr.utilities.workers import (
+    Worker,
+    start_worker
+)
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+app = QApplication.instance() or QApplication([])
+
+
+def wait():
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def test_worker_delivers_result():
+    results = []
+    errors = []
+
+    worker = Worker(sum, [1, 2, 3])
+    worker.signals.finished.connect(results.append) # noqa
+    worker.signals.error.connect(errors.append) # noqa
+    start_worker(worker=worker)
+    wait()
+
+    assert results == [6]
+    assert errors == []
+
+    worker = Worker(int, 'a')
+    worker.signals.error.connect(errors.append) # noqa
+    start_worker(worker=worker)
+    wait()
+
+    assert 'ValueError' in errors[0]
+
+
+def test_cancelled_worker_does_not_run():
+    calls = []
+
+    worker = Worker(calls.append, 1)
+    worker.cancel()
+    start_worker(worker=worker)
+    wait()
+
+    assert calls == []
@@ -3,12 +3,13 @@ from faslr.base_table import (
     FTableView
 )
 
+import numpy as np
+
 from chainladder import Triangle
 
 from PyQt6.QtCore import (
     QSize,
-    Qt,
-    QVariant
+    Qt
 )
 
 from PyQt6.QtGui import (
@@ -34,8 +35,34 @@ from faslr.style.triangle import (
 )
 
 
+def format_values(
+        values: np.ndarray,
+        style: str
+) -> np.ndarray:
+    """
+    Formats each value of an array with a format string, leaving NaN cells blank. Returns an object array of the
+    formatted strings, from which a model can hand out the same string object on every paint.
+    """
+
+    flat = values.ravel()
+    missing = np.isnan(flat)
+
+    strings = [BLANK_TEXT if blank else style.format(value) for value, blank in zip(flat.tolist(), missing.tolist())]
+
+    display = np.empty(flat.shape, dtype=object)
+    display[:] = strings
+
+    return display.reshape(values.shape)
+
+
 class TriangleModel(FAbstractTableModel):
+    """
+    Table model of a single triangle column, shown as origin x development.
 
+    The values are held in a NumPy array and formatted once, when the model is built, so that data() only indexes
+    precomputed arrays and returns shared objects for each role. Link ratios can be excluded from averages, which
+    is tracked in a boolean mask and shown with a struck out font.
+    """
     def __init__(
             self,
             triangle: Triangle,
@@ -50,48 +77,53 @@ class TriangleModel(FAbstractTableModel):
 
         self._data = triangle.to_frame(origin_as_datetime=False)
         self.value_type = value_type
-        self.n_rows = self.rowCount()
-        self.n_columns = self.columnCount()
-        self.excl_frame = self._data.copy()
-        self.excl_frame.loc[:] = False
+        self.n_rows = self._data.shape[0]
+        self.n_columns = self._data.shape[1]
 
-    def data(
-            self,
-            index,
-            role=None
-    ):
+        self.values = self._data.to_numpy(dtype=np.float64)
 
-        if role == Qt.ItemDataRole.DisplayRole:
+        # "value" means stuff like losses and premiums, for "ratio", want to display 3 decimal places.
+        if self.value_type == "value":
+            self.display = format_values(values=self.values, style=VALUE_STYLE)
+        else:
+            self.display = format_values(values=self.values, style=RATIO_STYLE)
 
-            value = self._data.iloc[index.row(), index.column()]
+        self.excluded = np.zeros(self.values.shape, dtype=bool)
 
-            # Display blank when there are nans in the lower-right hand of the triangle.
-            if str(value) == "nan":
+        self.row_headers = [str(label) for label in self._data.index]
+        self.column_headers = [str(label) for label in self._data.columns]
 
-                display_value = BLANK_TEXT
-            else:
-                # "value" means stuff like losses and premiums, should have 2 decimal places.
-                if self.value_type == "value":
+        self.font = QFont()
+        self.excluded_font = QFont()
+        self.excluded_font.setStrikeOut(True)
 
-                    display_value = VALUE_STYLE.format(value)
+    def rowCount(
+            self,
+            parent=None,
+            *args,
+            **kwargs
+    ):
 
-                # for "ratio", want to display 3 decimal places.
-                else:
+        return self.n_rows
 
-                    display_value = RATIO_STYLE.format(value)
+    def columnCount(
+            self,
+            parent=None,
+            *args,
+            **kwargs
+    ):
 
-                display_value = str(display_value)
+        return self.n_columns
 
-            self.setData(
-                self.index(
-                    index.row(),
-                    index.column()
-                ),
-                QVariant(Qt.AlignmentFlag.AlignRight),
-                Qt.ItemDataRole.TextAlignmentRole
-            )
+    def data(
+            self,
+            index,
+            role=None
+    ):
 
-            return display_value
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Blank when there are nans in the lower-right hand of the triangle.
+            return self.display[index.row(), index.column()]
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignRight
@@ -101,13 +133,11 @@ class TriangleModel(FAbstractTableModel):
             return LOWER_DIAG_COLOR
 
         if (role == Qt.ItemDataRole.FontRole) and (self.value_type == "ratio"):
-            font = QFont()
-            exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
-            if exclude:
-                font.setStrikeOut(True)
+
+            if self.excluded[index.row(), index.column()]:
+                return self.excluded_font
             else:
-                font.setStrikeOut(False)
-            return font
+                return self.font
 
     def headerData(
             self,
@@ -119,10 +149,10 @@ class TriangleModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_headers[p_int]
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.row_headers[p_int]
 
 
 class TriangleView(FTableView):
@@ -1,4 +1,7 @@
-from faslr.utilities.gui import open_item_tab
+from faslr.utilities.gui import (
+    LoadingTab,
+    open_item_tab
+)
 
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -16,9 +19,20 @@ from faslr.utilities.sample import (
     load_sample
 )
 
+from faslr.utilities.sqlite import (
+    apply_sqlite_pragmas,
+    get_sqlite_pragmas
+)
+
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
+
+    # Apply the performance profile configured in faslr.ini.
+    apply_sqlite_pragmas(
+        dbapi_connection=dbapi_connection,
+        pragmas=get_sqlite_pragmas()
+    )
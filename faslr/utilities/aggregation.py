@@ -0,0 +1,428 @@
+"""
+Builds loss development triangles from claim-level transactions. Dates are reduced to integer month keys, each
+transaction is assigned a flat origin x development cell index, and the cells are summed with np.bincount, which
+avoids grouping on datetimes and scales to tens of millions of transactions.
+
+Tabular data whose periods are integer keys, i.e., years, YYYYQ quarters or YYYYMM months, goes through the same
+month keys, so that chainladder only has to parse the dates of the summed cells rather than those of every row.
+"""
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from chainladder import Triangle
+
+from faslr.constants import (
+    GRAIN_MONTHS,
+    PERIOD_KEY_GRAINS
+)
+
+from typing import Any
+
+
+def month_keys(
+        dates: Any
+) -> np.ndarray:
+    """
+    Converts an array of dates to the number of months elapsed since January of year 0, e.g., 24000 for
+    January 2000. Missing dates become -1.
+
+    Converting each date to a month is slow, so the months are looked up in a table built for the distinct days
+    between the earliest and the latest date instead.
+    """
+
+    days = np.asarray(dates, dtype='datetime64[D]')
+    missing = np.isnat(days)
+    day_numbers = days.view(np.int64)
+
+    if missing.all():
+        return np.full(day_numbers.shape, -1, dtype=np.int64)
+
+    has_missing = missing.any()
+
+    if has_missing:
+        present = day_numbers[~missing]
+    else:
+        present = day_numbers
+
+    first_day = present.min()
+    last_day = present.max()
+
+    table = np.arange(first_day, last_day + 1).astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    table += 1970 * 12
+
+    if not has_missing:
+        return table[day_numbers - first_day]
+
+    keys = np.full(day_numbers.shape, -1, dtype=np.int64)
+    keys[~missing] = table[present - first_day]
+
+    return keys
+
+
+def month_dates(
+        keys: np.ndarray,
+        end: bool = False
+) -> np.ndarray:
+    """
+    Converts month keys back to the first, or if end is True the last, day of each month.
+    """
+
+    months = (keys - 1970 * 12).astype('datetime64[M]')
+
+    if end:
+        return (months + 1).astype('datetime64[D]') - 1
+
+    return months.astype('datetime64[D]')
+
+
+def first_occurrence(
+        ids: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the position of the first occurrence of each distinct id. Small non-negative integer ids are handled in
+    linear time, other ids are sorted with np.unique.
+    """
+
+    if ids.dtype.kind in 'iu' and ids.size and ids.min() >= 0 and ids.max() < 4 * ids.size:
+        positions = np.arange(ids.size)
+        first = np.full(ids.max() + 1, -1, dtype=np.int64)
+
+        # With repeated ids the last assignment wins, so assign in reverse to keep the first position.
+        first[ids[::-1]] = positions[::-1]
+
+        return first[first >= 0]
+
+    return np.unique(ids, return_index=True)[1]
+
+
+class TransactionTriangle:
+    """
+    Cumulative triangle arrays produced by aggregate_transactions. Each entry of values is an origin x development
+    array, with NaN in the cells that lie beyond the evaluation date.
+    """
+    def __init__(
+            self,
+            origin_grain: str,
+            development_grain: str,
+            origin_keys: np.ndarray,
+            evaluation_key: int,
+            values: dict,
+            n_dropped: int = 0
+    ):
+
+        self.origin_grain = origin_grain
+        self.development_grain = development_grain
+        # Month key of the start of each origin period.
+        self.origin_keys = origin_keys
+        self.evaluation_key = evaluation_key
+        self.values = values
+        # Number of transactions left out because of missing dates or dates outside the triangle.
+        self.n_dropped = n_dropped
+
+    @property
+    def shape(self) -> (int, int):
+        return next(iter(self.values.values())).shape
+
+    def valuation_keys(self) -> np.ndarray:
+        """
+        Month key of the last month of each origin x development cell.
+        """
+
+        n_developments = self.shape[1]
+        development_months = GRAIN_MONTHS[self.development_grain]
+
+        ages = (np.arange(n_developments) + 1) * development_months
+
+        return self.origin_keys[:, np.newaxis] + ages[np.newaxis, :] - 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the observed cells in long format, with the origin period start, the valuation date at the end of
+        the development period, and one column per value.
+        """
+
+        valuations = self.valuation_keys()
+        development_months = GRAIN_MONTHS[self.development_grain]
+        observed = valuations - development_months < self.evaluation_key
+
+        origin_index, development_index = np.nonzero(observed)
+
+        frame = pd.DataFrame({
+            'Origin': month_dates(self.origin_keys[origin_index]),
+            'Valuation': month_dates(valuations[origin_index, development_index], end=True)
+        })
+
+        for name, array in self.values.items():
+            frame[name] = array[origin_index, development_index]
+
+        return frame
+
+    def to_triangle(self) -> Triangle:
+
+        return Triangle(
+            data=self.to_frame(),
+            origin='Origin',
+            development='Valuation',
+            columns=list(self.values.keys()),
+            cumulative=True
+        )
+
+
+def aggregate_transactions(
+        loss_date: Any,
+        transaction_date: Any,
+        paid: Any = None,
+        incurred: Any = None,
+        claim_id: Any = None,
+        report_date: Any = None,
+        origin_grain: str = 'Annual',
+        development_grain: str = 'Annual',
+        evaluation_date: Any = None
+) -> TransactionTriangle:
+    """
+    Bins claim transactions into cumulative origin x development arrays.
+
+    Each transaction has the loss date of its claim, which sets the origin period, and the date it was booked,
+    e.g., the payment date, which sets the development period. Paid and incurred amounts are the incremental
+    changes made by each transaction. If claim ids and report dates are supplied, the number of distinct claims
+    reported is counted as well, developed by report date.
+
+    Dates should be datetime64 arrays or Series. Transactions with missing dates, booked before the start of their
+    origin period, or after the evaluation date are left out. The evaluation date defaults to the latest
+    transaction date.
+    """
+
+    origin_months = GRAIN_MONTHS[origin_grain]
+    development_months = GRAIN_MONTHS[development_grain]
+
+    if development_months > origin_months:
+        raise ValueError("The development grain cannot be coarser than the origin grain.")
+
+    loss_keys = month_keys(loss_date)
+    transaction_keys = month_keys(transaction_date)
+
+    if evaluation_date is None:
+        evaluation_key = transaction_keys.max()
+    else:
+        evaluation_key = month_keys([evaluation_date])[0]
+
+    origin_periods = loss_keys // origin_months
+
+    valid = (loss_keys >= 0) & (transaction_keys >= 0)
+
+    if not valid.any():
+        raise ValueError("There are no transactions with both a loss date and a transaction date.")
+
+    first_period = origin_periods[valid].min()
+    last_period = evaluation_key // origin_months
+
+    n_origins = int(last_period - first_period + 1)
+    n_developments = int((evaluation_key - first_period * origin_months) // development_months + 1)
+
+    def cell_index(
+            periods: np.ndarray,
+            development_keys: np.ndarray,
+            mask: np.ndarray
+    ) -> (np.ndarray, np.ndarray):
+        """
+        Returns the flat cell index of each row and a mask of the rows that fall inside the triangle.
+        """
+
+        ages = development_keys - periods * origin_months
+        mask = mask & (ages >= 0) & (development_keys <= evaluation_key)
+
+        origin_index = periods - first_period
+        development_index = ages // development_months
+
+        return origin_index * n_developments + development_index, mask
+
+    def cumulate(
+            cells: np.ndarray,
+            weights: np.ndarray = None
+    ) -> np.ndarray:
+
+        incremental = np.bincount(
+            cells,
+            weights=weights,
+            minlength=n_origins * n_developments
+        ).reshape(n_origins, n_developments)
+
+        return np.cumsum(incremental, axis=1, dtype=np.float64)
+
+    cells, included = cell_index(
+        periods=origin_periods,
+        development_keys=transaction_keys,
+        mask=valid
+    )
+
+    n_dropped = int(included.size - included.sum())
+
+    values = {}
+
+    for name, amounts in [('Paid Loss', paid), ('Incurred Loss', incurred)]:
+        if amounts is None:
+            continue
+
+        weights = np.nan_to_num(np.asarray(amounts, dtype=np.float64)[included])
+        values[name] = cumulate(cells=cells[included], weights=weights)
+
+    if claim_id is not None and report_date is not None:
+        # Count each claim once, using the dates of its first transaction.
+        first = first_occurrence(ids=np.asarray(claim_id)[valid])
+        first = np.flatnonzero(valid)[first]
+
+        report_keys = month_keys(np.asarray(report_date)[first])
+
+        report_cells, reported = cell_index(
+            periods=origin_periods[first],
+            development_keys=report_keys,
+            mask=report_keys >= 0
+        )
+
+        values['Reported Count'] = cumulate(cells=report_cells[reported])
+
+    # Cells beyond the evaluation date have not been observed yet.
+    origin_keys = (first_period + np.arange(n_origins)) * origin_months
+    ages = np.arange(n_developments) * development_months
+    future = origin_keys[:, np.newaxis] + ages[np.newaxis, :] > evaluation_key
+
+    for array in values.values():
+        array[future] = np.nan
+
+    if n_dropped:
+        logging.warning("Left out %d transactions outside of the triangle." % n_dropped)
+
+    return TransactionTriangle(
+        origin_grain=origin_grain,
+        development_grain=development_grain,
+        origin_keys=origin_keys,
+        evaluation_key=int(evaluation_key),
+        values=values,
+        n_dropped=n_dropped
+    )
+
+
+def period_key_grain(
+        keys: Any
+) -> str | None:
+    """
+    Returns the grain of an array of integer period keys, e.g., 'Quarterly' for keys like 20081, or None if the
+    keys are not all integer periods of the same grain.
+    """
+
+    keys = np.asarray(keys)
+
+    if keys.size == 0:
+        return None
+
+    if keys.dtype.kind == 'f':
+        # Integer columns that had missing values are read as floats.
+        if not np.isfinite(keys).all() or (keys != np.floor(keys)).any():
+            return None
+    elif keys.dtype.kind not in 'iu':
+        return None
+
+    keys = keys.astype(np.int64)
+
+    low = keys.min()
+    high = keys.max()
+
+    if low <= 0 or len(str(low)) != len(str(high)):
+        return None
+
+    grain = PERIOD_KEY_GRAINS.get(len(str(high)))
+
+    if grain == 'Quarterly':
+        quarters = keys % 10
+
+        if quarters.min() < 1 or quarters.max() > 4:
+            return None
+    elif grain == 'Monthly':
+        months = keys % 100
+
+        if months.min() < 1 or months.max() > 12:
+            return None
+
+    return grain
+
+
+def period_month_keys(
+        keys: Any,
+        grain: str
+) -> np.ndarray:
+    """
+    Converts integer period keys to the month key of the first month of each period.
+    """
+
+    keys = np.asarray(keys).astype(np.int64)
+
+    if grain == 'Annual':
+        return keys * 12
+    elif grain == 'Quarterly':
+        return (keys // 10) * 12 + (keys % 10 - 1) * 3
+    else:
+        return (keys // 100) * 12 + keys % 100 - 1
+
+
+def build_triangle(
+        data: pd.DataFrame,
+        origin: str,
+        development: str,
+        columns: list,
+        cumulative: bool
+) -> Triangle:
+    """
+    Builds a Triangle from tabular data, with the same arguments as the Triangle constructor.
+
+    If both the origin and development columns hold integer period keys, the rows are summed into cells on their
+    month keys first, and the Triangle is built from the cells, with the start of each origin period and the end of
+    each development period as dates. Otherwise, the data is passed to the Triangle constructor as is.
+    """
+
+    origin_keys = data[origin].to_numpy()
+    development_keys = data[development].to_numpy()
+
+    origin_grain = period_key_grain(keys=origin_keys)
+    development_grain = period_key_grain(keys=development_keys)
+
+    if origin_grain is None or development_grain is None:
+        return Triangle(
+            data=data,
+            origin=origin,
+            development=development,
+            columns=columns,
+            cumulative=cumulative
+        )
+
+    origin_months = period_month_keys(keys=origin_keys, grain=origin_grain)
+    development_months = period_month_keys(keys=development_keys, grain=development_grain)
+    development_months += GRAIN_MONTHS[development_grain] - 1
+
+    first_origin = origin_months.min()
+    first_development = development_months.min()
+    n_developments = int(development_months.max() - first_development + 1)
+
+    cells = (origin_months - first_origin) * n_developments + (development_months - first_development)
+
+    present = np.flatnonzero(np.bincount(cells))
+
+    frame = pd.DataFrame({
+        origin: month_dates(present // n_developments + first_origin),
+        development: month_dates(present % n_developments + first_development, end=True)
+    })
+
+    for column in columns:
+        values = np.nan_to_num(data[column].to_numpy(dtype=np.float64))
+        frame[column] = np.bincount(cells, weights=values)[present]
+
+    return Triangle(
+        data=frame,
+        origin=origin,
+        development=development,
+        columns=columns,
+        cumulative=cumulative
+    )
@@ -0,0 +1,277 @@
+"""
+Caches built triangles, so that reopening a view or a sample returns the triangle that was built the first time
+instead of building it again.
+
+Triangles are kept in memory in least recently used order, up to a fixed number of entries. The cache can also
+write each triangle to disk as an npz snapshot, which lets triangles outlive the session. The disk cache is off by
+default and is turned on in the CACHE section of faslr.ini.
+
+Keys should change whenever the triangle would, e.g., a view's id together with its modified timestamp, or a file's
+path together with its modification time.
+"""
+from __future__ import annotations
+
+import configparser
+import hashlib
+import logging
+import os
+import threading
+
+from collections import OrderedDict
+
+from faslr.constants import (
+    CONFIG_PATH,
+    TRIANGLE_CACHE_DISK_BYTES,
+    TRIANGLE_CACHE_PATH,
+    TRIANGLE_CACHE_SIZE
+)
+
+from faslr.utilities.snapshot import (
+    snapshot_to_triangle,
+    triangle_to_snapshot
+)
+
+from typing import (
+    Callable,
+    Hashable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+
+
+class TriangleCache:
+    """
+    Least recently used cache of triangles, with an optional disk cache behind it. Safe to use from worker
+    threads. Copies are handed out, so callers may modify the triangles they get.
+    """
+    def __init__(
+            self,
+            max_entries: int = TRIANGLE_CACHE_SIZE,
+            cache_path: str = None,
+            max_disk_bytes: int = TRIANGLE_CACHE_DISK_BYTES
+    ):
+
+        self.max_entries = max_entries
+        # Directory of the disk cache, None if it is not used.
+        self.cache_path = cache_path
+        self.max_disk_bytes = max_disk_bytes
+
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+            self,
+            key: Hashable
+    ) -> Triangle | None:
+        """
+        Returns a copy of the cached triangle, or None if the key is not cached in memory or on disk.
+        """
+
+        with self.lock:
+            triangle = self.entries.get(key)
+
+            if triangle is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return triangle.copy()
+
+        triangle = self.read_file(key=key)
+
+        with self.lock:
+            if triangle is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.remember(key=key, triangle=triangle)
+
+        return triangle.copy()
+
+    def put(
+            self,
+            key: Hashable,
+            triangle: Triangle
+    ) -> None:
+
+        triangle = triangle.copy()
+
+        with self.lock:
+            self.remember(key=key, triangle=triangle)
+
+        self.write_file(key=key, triangle=triangle)
+
+    def get_or_build(
+            self,
+            key: Hashable,
+            build: Callable[[], Triangle]
+    ) -> Triangle:
+        """
+        Returns the cached triangle, calling build() and caching its result on a miss.
+        """
+
+        triangle = self.get(key=key)
+
+        if triangle is None:
+            triangle = build()
+            self.put(key=key, triangle=triangle)
+
+        return triangle
+
+    def remember(
+            self,
+            key: Hashable,
+            triangle: Triangle
+    ) -> None:
+        """
+        Adds a triangle to the in-memory entries, evicting the least recently used ones beyond the limit. Must be
+        called with the lock held.
+        """
+
+        self.entries[key] = triangle
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Empties the in-memory cache. Files in the disk cache are left in place.
+        """
+
+        with self.lock:
+            self.entries.clear()
+
+    def file_path(
+            self,
+            key: Hashable
+    ) -> str:
+
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+        return os.path.join(self.cache_path, digest + '.npz')
+
+    def read_file(
+            self,
+            key: Hashable
+    ) -> Triangle | None:
+
+        if self.cache_path is None:
+            return None
+
+        file_path = self.file_path(key=key)
+
+        try:
+            with open(file_path, 'rb') as file:
+                triangle = snapshot_to_triangle(snapshot=file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logging.warning("Could not read cached triangle %s: %s" % (file_path, error))
+            return None
+
+        # Keep recently used files from being evicted first.
+        os.utime(file_path)
+
+        return triangle
+
+    def write_file(
+            self,
+            key: Hashable,
+            triangle: Triangle
+    ) -> None:
+
+        if self.cache_path is None:
+            return
+
+        file_path = self.file_path(key=key)
+        temp_path = "%s.%d.tmp" % (file_path, threading.get_ident())
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+
+            # Written under a temporary name first, so that readers never see a partial file.
+            with open(temp_path, 'wb') as file:
+                file.write(triangle_to_snapshot(triangle=triangle))
+
+            os.replace(temp_path, file_path)
+        except OSError as error:
+            logging.warning("Could not write cached triangle %s: %s" % (file_path, error))
+            return
+
+        self.evict_files()
+
+    def evict_files(self) -> None:
+        """
+        Removes the least recently used files from the disk cache until it fits within max_disk_bytes.
+        """
+
+        files = []
+
+        for entry in os.scandir(self.cache_path):
+            if entry.name.endswith('.npz'):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            total -= size
+
+
+def read_cache_settings(
+        config_path: str = CONFIG_PATH
+) -> (bool, str):
+    """
+    Returns whether the disk cache is enabled, and its directory, from the CACHE section of the configuration file.
+    """
+
+    config = configparser.ConfigParser()
+
+    if os.path.exists(config_path):
+        config.read(config_path)
+
+    if not config.has_section('CACHE'):
+        return False, TRIANGLE_CACHE_PATH
+
+    section = config['CACHE']
+
+    return section.getboolean('disk_cache', fallback=False), section.get('cache_path', TRIANGLE_CACHE_PATH)
+
+
+# Cache shared by the whole application, created on first use.
+_triangle_cache = None
+
+
+def get_triangle_cache() -> TriangleCache:
+    global _triangle_cache
+
+    if _triangle_cache is None:
+        disk_cache, cache_path = read_cache_settings()
+
+        _triangle_cache = TriangleCache(
+            cache_path=cache_path if disk_cache else None
+        )
+
+    return _triangle_cache
+
+
+def reset_triangle_cache() -> None:
+    """
+    Discards the shared cache, so that it is created again with the current settings.
+    """
+    global _triangle_cache
+
+    _triangle_cache = None
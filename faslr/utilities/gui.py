@@ -1,8 +1,24 @@
+from __future__ import annotations
+
+from faslr.utilities.workers import (
+    Worker,
+    start_worker
+)
+
+from PyQt6.QtCore import Qt
+
 from PyQt6.QtWidgets import (
+    QLabel,
     QTabWidget,
+    QVBoxLayout,
     QWidget
 )
 
+from typing import (
+    Any,
+    Callable
+)
+
 
 def open_item_tab(
         title: str,
@@ -17,3 +33,72 @@ def open_item_tab(
 
     new_index = tab_widget.count()
     tab_widget.setCurrentIndex(new_index - 1)
+
+
+class LoadingTab(QWidget):
+    """
+    Placeholder shown in a tab while its contents are loaded by a background worker. Once the worker finishes, its
+    result is passed to build_widget and the placeholder is replaced by the returned widget, keeping the tab's
+    position and title. Closing the tab first cancels the worker.
+    """
+    def __init__(
+            self,
+            tab_widget: QTabWidget,
+            worker: Worker,
+            build_widget: Callable[[Any], QWidget],
+            message: str = "Loading..."
+    ):
+        super().__init__()
+
+        self.tab_widget = tab_widget
+        self.worker = worker
+        self.build_widget = build_widget
+
+        self.layout = QVBoxLayout()
+        self.label = QLabel(message)
+        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(self.label)
+        self.setLayout(self.layout)
+
+        self.worker.signals.finished.connect(self.replace) # noqa
+        self.worker.signals.error.connect(self.show_error) # noqa
+
+        start_worker(worker=self.worker)
+
+    def cancel(self) -> None:
+        self.worker.cancel()
+
+    def replace(
+            self,
+            result: Any
+    ) -> None:
+
+        index = self.tab_widget.indexOf(self)
+
+        # The tab was closed while loading.
+        if index == -1:
+            return
+
+        title = self.tab_widget.tabText(index)
+        is_current = self.tab_widget.currentIndex() == index
+
+        widget = self.build_widget(result)
+
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(
+            index,
+            widget,
+            title
+        )
+
+        if is_current:
+            self.tab_widget.setCurrentIndex(index)
+
+        self.deleteLater()
+
+    def show_error(
+            self,
+            message: str
+    ) -> None:
+
+        self.label.setText("Unable to load the data.\n\n" + message)
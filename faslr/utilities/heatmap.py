@@ -0,0 +1,87 @@
+"""
+Colors link ratios by their rank within each development column, like chainladder's Triangle.heatmap(), but directly
+on the arrays of the link ratios, rather than by rendering a pandas Styler to HTML and parsing the colors back out of
+its CSS.
+
+The colors are the same as those of Triangle.heatmap(). Excluded link ratios can be left out of the ranking, so that
+the gradient reflects only the link ratios used in the LDF averages.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from matplotlib import colormaps
+from matplotlib.colors import Colormap
+
+
+def heatmap_positions(
+        ratios: np.ndarray,
+        excluded: np.ndarray = None
+) -> np.ndarray:
+    """
+    Returns the position of each link ratio on the color scale, from 0 to 1, according to its rank within its
+    column. Missing and excluded link ratios are placed in the middle of the scale.
+    """
+
+    ratios = np.array(ratios, dtype=np.float64)
+
+    if excluded is not None:
+        ratios[excluded] = np.nan
+
+    n_rows = ratios.shape[0]
+
+    ranks = pd.DataFrame(ratios).rank(axis=0)
+
+    # Ranks are stretched over the number of rows, so that columns with fewer link ratios span the same scale.
+    gradient = ((ranks - 1).div(ranks.max(axis=0) - 1, axis=1) * (n_rows - 1) + 1).to_numpy()
+    gradient[np.isnan(gradient)] = (n_rows + 1) / 2
+
+    low = gradient.min(initial=np.inf)
+    high = gradient.max(initial=-np.inf)
+
+    if high > low:
+        return (gradient - low) / (high - low)
+
+    # Like matplotlib's Normalize, map a scale without any range to its bottom.
+    return np.zeros(gradient.shape)
+
+
+def heatmap_colors(
+        ratios: np.ndarray,
+        excluded: np.ndarray = None,
+        cmap: str | Colormap = 'coolwarm'
+) -> np.ndarray:
+    """
+    Returns the heatmap color of each link ratio as an array of 8-bit RGBA values, with one more axis than ratios.
+    """
+
+    if isinstance(cmap, str):
+        cmap = colormaps[cmap]
+
+    rgba = cmap(heatmap_positions(ratios=ratios, excluded=excluded))
+
+    # Rounded rather than truncated, as when matplotlib converts colors to hex codes.
+    return np.round(rgba * 255).astype(np.uint8)
+
+
+def color_palette(
+        colors: np.ndarray
+) -> (np.ndarray, np.ndarray):
+    """
+    Splits an array of RGBA colors into a palette of its distinct colors and an array of indexes into the palette.
+    """
+
+    codes = colors.astype(np.uint32)
+    codes = (codes[..., 0] << 24) | (codes[..., 1] << 16) | (codes[..., 2] << 8) | codes[..., 3]
+
+    palette, index = np.unique(codes.ravel(), return_inverse=True)
+
+    palette = np.stack([
+        (palette >> 24) & 255,
+        (palette >> 16) & 255,
+        (palette >> 8) & 255,
+        palette & 255
+    ], axis=-1).astype(np.uint8)
+
+    return palette, index.reshape(codes.shape).astype(np.int16)
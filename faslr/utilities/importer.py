@@ -0,0 +1,325 @@
+"""
+Reads external loss data files for the import wizard. Files are streamed in chunks and reduced to one row per
+origin/development cell as they are read, so that memory use does not grow with the size of the file.
+
+CSV files are read with pandas. Parquet and Feather (Arrow IPC) files are read with pyarrow, which is imported only
+when such a file is opened, since it is an optional dependency. Columnar files are memory-mapped and only the
+columns picked in the header mapping are read from them.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+
+import pandas as pd
+
+from faslr.constants import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_FILE_EXTENSIONS,
+    IMPORT_PREVIEW_ROWS
+)
+
+from typing import (
+    Callable,
+    Iterator
+)
+
+
+def pyarrow_available() -> bool:
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def file_format(
+        file_path: str
+) -> str:
+    """
+    Returns the format of a file, i.e., a key of IMPORT_FILE_EXTENSIONS, based on its extension.
+    """
+
+    extension = os.path.splitext(file_path)[1].lower()
+
+    for name, extensions in IMPORT_FILE_EXTENSIONS.items():
+        if extension in extensions:
+            return name
+
+    raise ValueError("Unsupported file type: %s" % extension)
+
+
+def file_dialog_filter() -> str:
+    """
+    Returns the name filter of the file dialog used to pick a file to import.
+    """
+
+    formats = ['CSV']
+
+    if pyarrow_available():
+        formats += ['Parquet', 'Feather']
+
+    filters = [
+        "%s (%s)" % (name, " ".join("*" + extension for extension in IMPORT_FILE_EXTENSIONS[name]))
+        for name in formats
+    ]
+
+    if len(filters) > 1:
+        patterns = [
+            "*" + extension for name in formats for extension in IMPORT_FILE_EXTENSIONS[name]
+        ]
+        filters.insert(0, "Data files (%s)" % " ".join(patterns))
+
+    return ";;".join(filters)
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow on first use, with a clearer message than the default if it is not installed.
+    """
+
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Reading Parquet and Feather files requires pyarrow, which can be installed with pip install pyarrow."
+        ) from error
+
+    return pyarrow
+
+
+def open_feather(
+        file_path: str
+):
+    """
+    Opens a Feather (Arrow IPC) file through a memory map. Record batches are only read, and decompressed, when
+    they are accessed.
+    """
+
+    pa = import_pyarrow()
+    import pyarrow.ipc # noqa
+
+    return pa.ipc.open_file(pa.memory_map(file_path, 'r'))
+
+
+def read_preview(
+        file_path: str,
+        n_rows: int = IMPORT_PREVIEW_ROWS
+) -> pd.DataFrame:
+    """
+    Reads only the first rows of a file, to show its headers and a sample of its contents.
+    """
+
+    file_type = file_format(file_path=file_path)
+
+    if file_type == 'CSV':
+        return pd.read_csv(
+            file_path,
+            nrows=n_rows
+        )
+
+    if file_type == 'Parquet':
+        import_pyarrow()
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        batch = next(parquet_file.iter_batches(batch_size=n_rows), None)
+
+        if batch is None:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+
+        return batch.to_pandas()
+
+    reader = open_feather(file_path=file_path)
+
+    if reader.num_record_batches == 0:
+        return reader.schema.empty_table().to_pandas()
+
+    return reader.get_batch(0).slice(0, n_rows).to_pandas()
+
+
+def iter_csv_chunks(
+        file_path: str,
+        columns: list,
+        chunk_size: int
+) -> Iterator[(pd.DataFrame, int, int)]:
+    """
+    Yields chunks of the selected columns of a csv file, along with the bytes read so far and the size of the file.
+    """
+
+    file_size = os.path.getsize(file_path)
+
+    with open(file_path, 'rb') as file:
+
+        reader = pd.read_csv(
+            file,
+            usecols=columns,
+            chunksize=chunk_size
+        )
+
+        for chunk in reader:
+            yield chunk, file.tell(), file_size
+
+
+def iter_parquet_chunks(
+        file_path: str,
+        columns: list,
+        chunk_size: int
+) -> Iterator[(pd.DataFrame, int, int)]:
+    """
+    Yields chunks of the selected columns of a Parquet file, along with the rows read so far and the number of rows
+    in the file. The column chunks of unselected columns are never read.
+    """
+
+    import_pyarrow()
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(file_path, memory_map=True)
+    n_rows = parquet_file.metadata.num_rows
+    rows_read = 0
+
+    for batch in parquet_file.iter_batches(
+            batch_size=chunk_size,
+            columns=columns
+    ):
+        rows_read += batch.num_rows
+        yield batch.to_pandas(), rows_read, n_rows
+
+
+def iter_feather_chunks(
+        file_path: str,
+        columns: list,
+        chunk_size: int
+) -> Iterator[(pd.DataFrame, int, int)]:
+    """
+    Yields chunks of the selected columns of a Feather file, along with the record batches read so far and the
+    number of record batches in the file. Batches longer than chunk_size rows are split further.
+    """
+
+    reader = open_feather(file_path=file_path)
+    n_batches = reader.num_record_batches
+
+    for i in range(n_batches):
+        batch = reader.get_batch(i).select(columns)
+
+        for offset in range(0, batch.num_rows, chunk_size):
+            chunk = batch.slice(offset, chunk_size)
+            yield chunk.to_pandas(), i + 1, n_batches
+
+
+CHUNK_READERS = {
+    'CSV': iter_csv_chunks,
+    'Parquet': iter_parquet_chunks,
+    'Feather': iter_feather_chunks
+}
+
+
+def aggregate_chunk(
+        chunk: pd.DataFrame,
+        keys: list,
+        values: list
+) -> (pd.DataFrame, int):
+    """
+    Validates a chunk of rows and sums its values by cell. Rows without an origin or development period are
+    dropped, and values that are not numbers are treated as missing.
+
+    Returns the summed cells and the number of rows dropped.
+    """
+
+    n_rows = chunk.shape[0]
+    chunk = chunk.dropna(subset=keys)
+    n_dropped = n_rows - chunk.shape[0]
+
+    chunk = chunk.assign(**{
+        column: pd.to_numeric(chunk[column], errors='coerce') for column in values
+    })
+
+    cells = chunk.groupby(
+        keys,
+        as_index=False,
+        sort=False
+    )[values].sum(min_count=1)
+
+    return cells, n_dropped
+
+
+def aggregate_file(
+        file_path: str,
+        origin: str,
+        development: str,
+        values: list,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress_callback: Callable[[int, int], None] = None,
+        cancelled: Callable[[], bool] = None
+) -> (pd.DataFrame, int, int):
+    """
+    Streams a csv, Parquet or Feather file in chunks of chunk_size rows, reading only the mapped columns, and sums
+    the values of rows that fall in the same origin/development cell. chainladder sums such rows when building a
+    triangle anyway, so the result builds the same triangle as the raw file, and it holds one row per cell, as the
+    project_view_data table expects.
+
+    The progress callback, if supplied, receives the amount of the file read so far and the total amount, counted
+    in bytes for csv files, rows for Parquet files and record batches for Feather files. If the cancelled callable
+    returns True between chunks, the import stops and None is returned in place of the cells.
+
+    Returns the cells, with the columns named as in the file, the number of rows read, and the number of rows
+    dropped because they had no origin or development period.
+    """
+
+    keys = [origin, development]
+    values = [column for column in dict.fromkeys(values) if column not in keys]
+    columns = keys + values
+
+    chunks = CHUNK_READERS[file_format(file_path=file_path)](
+        file_path=file_path,
+        columns=columns,
+        chunk_size=chunk_size
+    )
+
+    cells = None
+    n_rows = 0
+    n_dropped = 0
+
+    for chunk, done, total in chunks:
+
+        if cancelled and cancelled():
+            logging.info("Import of %s cancelled after %d rows." % (file_path, n_rows))
+            chunks.close()
+            return None, n_rows, n_dropped
+
+        n_rows += chunk.shape[0]
+
+        chunk_cells, chunk_dropped = aggregate_chunk(
+            chunk=chunk,
+            keys=keys,
+            values=values
+        )
+
+        n_dropped += chunk_dropped
+
+        # Fold the chunk into the running totals, which never hold more than one row per cell.
+        if cells is None:
+            cells = chunk_cells
+        else:
+            cells = pd.concat(
+                [cells, chunk_cells],
+                ignore_index=True
+            ).groupby(
+                keys,
+                as_index=False,
+                sort=False
+            )[values].sum(min_count=1)
+
+        if progress_callback:
+            progress_callback(done, total)
+
+    if cells is None:
+        cells = pd.DataFrame(columns=columns)
+
+    if n_dropped:
+        logging.warning(
+            "Dropped %d of %d rows of %s without an origin or development period." % (n_dropped, n_rows, file_path)
+        )
+
+    cells = cells[columns].sort_values(keys, ignore_index=True)
+
+    logging.info("Read %d rows of %s into %d cells." % (n_rows, file_path, cells.shape[0]))
+
+    return cells, n_rows, n_dropped
@@ -0,0 +1,242 @@
+"""
+Computes link ratio averages directly on the arrays of a triangle, for any subset of development columns, so that
+striking out a link ratio only requires the averages of its own column to be recalculated. Volume-weighted, straight
+and regression averages are the same as those fitted by chainladder's Development estimator. Geometric and medial
+averages, which chainladder does not offer, are calculated as well.
+
+Within a development column, the link ratios of the latest n periods are always its last rows. Every average type is
+therefore computed from running sums taken from the bottom of each column, and the average over any number of
+periods is a lookup into them, so that all requested averages come out of one pass over the link ratios.
+
+CDFs and ultimate losses follow from the selected LDFs by a cumulative product, rather than by fitting
+DevelopmentConstant and Chainladder estimators.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from typing import (
+    Sequence,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+
+# Types of link ratio averages, as named in LDF_AVERAGES.
+AVERAGE_TYPES = (
+    'geometric',
+    'medial',
+    'regression',
+    'simple',
+    'volume'
+)
+
+# Number of development periods per origin period, by development grain and then origin grain.
+VALUATION_OFFSETS = {
+    'Y': {'Y': 1},
+    'Q': {'Y': 4, 'Q': 1},
+    'M': {'Y': 12, 'Q': 3, 'M': 1}
+}
+
+
+def link_arrays(
+        triangle: Triangle
+) -> (np.ndarray, np.ndarray):
+    """
+    Returns the origin x development arrays of the values at the start and at the end of each link ratio, for the
+    first index and column of the triangle. Zeros are treated as missing values, like chainladder does.
+    """
+
+    values = np.array(triangle.values[0, 0], dtype=np.float64)
+    values[values == 0] = np.nan
+
+    return values[:, :-1], values[:, 1:]
+
+
+def latest_diagonal(
+        triangle: Triangle
+) -> (np.ndarray, np.ndarray):
+    """
+    Returns the latest value of each origin period, and the development index at which it was observed.
+    """
+
+    latest = np.array(triangle.latest_diagonal.values[0, 0, :, 0], dtype=np.float64)
+    observed = np.asarray(triangle.nan_triangle).reshape(triangle.shape[2], triangle.shape[3])
+
+    return latest, np.maximum(np.nansum(observed, axis=1).astype(np.int64) - 1, 0)
+
+
+def n_periods_mask(
+        triangle: Triangle,
+        n_periods: int
+) -> np.ndarray:
+    """
+    Returns a boolean mask of the link ratios that fall within the latest n_periods diagonals, where the whole
+    triangle is used if n_periods is less than 1 or not less than the number of origins less one.
+    """
+
+    n_origins = triangle.shape[2]
+    n_developments = triangle.shape[3]
+
+    if n_periods < 1 or n_periods >= n_origins - 1:
+        return np.ones((n_origins, n_developments - 1), dtype=bool)
+
+    # Month of the valuation of each cell, from the start of its origin period and its age in months.
+    origin_months = np.asarray(triangle.odims, dtype='datetime64[M]').astype(np.int64)
+    ages = np.asarray(triangle.ddims, dtype=np.int64)
+
+    valuations = origin_months[:, np.newaxis] + ages[np.newaxis, :] - 1
+    valuation_date = np.datetime64(triangle.valuation_date, 'M').astype(np.int64)
+
+    distinct = np.unique(valuations[valuations <= valuation_date])
+    offset = VALUATION_OFFSETS[triangle.development_grain][triangle.origin_grain]
+    threshold = distinct[-n_periods * offset - 1]
+
+    return (valuations >= threshold)[:, :-1]
+
+
+def window_starts(
+        mask: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the first row of each column of a mask returned by n_periods_mask, i.e., the row where the link ratios
+    of the latest n periods begin.
+    """
+
+    return np.where(mask.any(axis=0), mask.argmax(axis=0), mask.shape[0])
+
+
+def suffix_sums(
+        values: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the sums of each column from each row down to the bottom, with a row of zeros appended for empty windows.
+    """
+
+    sums = np.zeros((values.shape[0] + 1, values.shape[1]))
+    sums[-2::-1] = np.cumsum(values[::-1], axis=0)
+
+    return sums
+
+
+def ldf_averages(
+        x: np.ndarray,
+        y: np.ndarray,
+        included: np.ndarray,
+        windows: list
+) -> np.ndarray:
+    """
+    Returns one row of average link ratios for each window, given as (average type, window starts), where the window
+    starts are the first row of each column to average, see window_starts. x and y are the values at the start and
+    end of each link ratio, and link ratios where included is False are left out.
+
+    A medial average is the straight average excluding the highest and lowest link ratio, or of all link ratios if
+    there are two or fewer. Geometric averages are nan where there are link ratios that are not positive. Columns
+    without any link ratio to average are nan.
+    """
+
+    n_columns = x.shape[1]
+    columns = np.arange(n_columns)
+
+    valid = included & np.isfinite(x) & np.isfinite(y)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(valid, y / x, 0.0)
+
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+
+    types = {average for average, _ in windows}
+
+    # Running sums of the terms of each average type, computed only for the types requested.
+    sums = {'count': suffix_sums(values=valid.astype(np.float64))}
+
+    if 'volume' in types:
+        sums['x'] = suffix_sums(values=x)
+        sums['y'] = suffix_sums(values=y)
+
+    if types & {'simple', 'medial'}:
+        sums['ratio'] = suffix_sums(values=ratios)
+
+    if 'regression' in types:
+        sums['xy'] = suffix_sums(values=x * y)
+        sums['xx'] = suffix_sums(values=x * x)
+
+    if 'geometric' in types:
+        positive = ratios > 0
+
+        with np.errstate(divide='ignore'):
+            sums['log'] = suffix_sums(values=np.where(positive, np.log(np.where(positive, ratios, 1.0)), 0.0))
+
+        sums['non_positive'] = suffix_sums(values=(valid & ~positive).astype(np.float64))
+
+    if 'medial' in types:
+        # Running extremes from the bottom of each column, with the identity of min/max above the last row.
+        sums['high'] = np.vstack([
+            np.maximum.accumulate(np.where(valid, ratios, -np.inf)[::-1], axis=0)[::-1],
+            np.full(n_columns, -np.inf)
+        ])
+        sums['low'] = np.vstack([
+            np.minimum.accumulate(np.where(valid, ratios, np.inf)[::-1], axis=0)[::-1],
+            np.full(n_columns, np.inf)
+        ])
+
+    averages = np.full((len(windows), n_columns), np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for row, (average, starts) in enumerate(windows):
+
+            def window(name: str) -> np.ndarray:
+                return sums[name][starts, columns]
+
+            count = window('count')
+
+            if average == 'volume':
+                numerator, denominator = window('y'), window('x')
+            elif average == 'simple':
+                numerator, denominator = window('ratio'), count
+            elif average == 'regression':
+                numerator, denominator = window('xy'), window('xx')
+            elif average == 'geometric':
+                numerator, denominator = np.exp(window('log') / count), np.ones(n_columns)
+                numerator[window('non_positive') > 0] = np.nan
+            elif average == 'medial':
+                trimmed = count > 2
+                numerator = window('ratio') - np.where(trimmed, window('high') + window('low'), 0.0)
+                denominator = count - np.where(trimmed, 2.0, 0.0)
+            else:
+                raise ValueError("Unknown LDF average type %s." % average)
+
+            result = numerator / denominator
+            result[(count == 0) | (denominator == 0)] = np.nan
+
+            averages[row] = result
+
+    return averages
+
+
+def cdf_from_ldfs(
+        ldfs: Sequence
+) -> np.ndarray:
+    """
+    Returns the cumulative development factor to ultimate at each age, treating missing LDFs as 1.
+    """
+
+    factors = np.asarray(ldfs, dtype=np.float64)
+    factors = np.where(np.isnan(factors), 1.0, factors)
+
+    return np.cumprod(factors[::-1])[::-1]
+
+
+def ultimate_losses(
+        latest: np.ndarray,
+        latest_index: np.ndarray,
+        cdfs: np.ndarray
+) -> np.ndarray:
+    """
+    Develops the latest value of each origin period to ultimate with the CDF at its age. Origins at the last age
+    are already at ultimate.
+    """
+
+    return latest * np.append(cdfs, 1.0)[latest_index]
@@ -0,0 +1,219 @@
+"""
+Caches fitted chainladder estimators, so that fitting the same estimator to the same triangle again, e.g., when a
+chart is redrawn or a pane is reopened, returns the earlier result instead of refitting.
+
+Entries are keyed by a fingerprint of the triangle's contents together with the class and parameters of the
+estimator, such as its drop list, n_periods, average or tail settings. They are kept in least recently used order up
+to a fixed number of entries, which can be set with model_cache_size in the CACHE section of faslr.ini.
+
+Cached results are shared between callers, who should treat them as read only.
+"""
+from __future__ import annotations
+
+import configparser
+import hashlib
+import os
+import threading
+
+import numpy as np
+
+from collections import OrderedDict
+
+from faslr.constants import (
+    CONFIG_PATH,
+    MODEL_CACHE_SIZE
+)
+
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+
+# Attributes set on a triangle by the estimators it was transformed by, e.g., the LDFs and drop weights of a
+# Development, which the tail estimators fitted to it read.
+FITTED_ATTRIBUTES = [
+    'average_',
+    'ldf_',
+    'sigma_',
+    'std_err_',
+    'tail_',
+    'w_'
+]
+
+
+def triangle_fingerprint(
+        triangle: Triangle
+) -> str:
+    """
+    Returns a digest of the values, axes and properties of a triangle, along with any fitted attributes it carries,
+    which changes whenever its contents do.
+    """
+
+    triangle = triangle.set_backend('numpy')
+
+    digest = hashlib.sha1()
+
+    digest.update(np.ascontiguousarray(triangle.values, dtype=np.float64).tobytes())
+
+    digest.update(repr((
+        triangle.values.shape,
+        triangle.kdims.tolist(),
+        list(triangle.vdims),
+        np.asarray(triangle.odims).astype(str).tolist(),
+        np.asarray(triangle.ddims).tolist(),
+        triangle.origin_grain,
+        triangle.development_grain,
+        triangle.is_cumulative,
+        triangle.is_pattern,
+        str(triangle.valuation_date)
+    )).encode('utf-8'))
+
+    for attribute in FITTED_ATTRIBUTES:
+        fitted = getattr(triangle, attribute, None)
+
+        if fitted is None:
+            continue
+
+        digest.update(attribute.encode('utf-8'))
+
+        if hasattr(fitted, 'set_backend'):
+            digest.update(triangle_fingerprint(triangle=fitted).encode('utf-8'))
+        elif hasattr(fitted, 'to_numpy'):
+            digest.update(repr(fitted.to_numpy().tolist()).encode('utf-8'))
+        else:
+            fitted = np.asarray(fitted)
+
+            if fitted.dtype == object or fitted.dtype.kind in 'SU':
+                digest.update(repr(fitted.tolist()).encode('utf-8'))
+            else:
+                digest.update(np.ascontiguousarray(fitted, dtype=np.float64).tobytes())
+
+    return digest.hexdigest()
+
+
+def estimator_key(
+        estimator: Any
+) -> tuple:
+    """
+    Identifies an estimator by its class and parameters, including those of any estimators nested in it.
+    """
+
+    params = sorted(estimator.get_params().items())
+
+    return type(estimator).__module__, type(estimator).__name__, repr(params)
+
+
+class ModelCache:
+    """
+    Least recently used cache of fitted estimators and the triangles they transform. Safe to use from worker
+    threads.
+    """
+    def __init__(
+            self,
+            max_entries: int = MODEL_CACHE_SIZE
+    ):
+
+        self.max_entries = max_entries
+
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def fit(
+            self,
+            estimator: Any,
+            triangle: Triangle
+    ) -> Any:
+        """
+        Returns the estimator fitted to the triangle, fitting it on a miss.
+        """
+
+        return self.get_or_fit(
+            key=('fit', estimator_key(estimator=estimator), triangle_fingerprint(triangle=triangle)),
+            fit=lambda: estimator.fit(triangle)
+        )
+
+    def fit_transform(
+            self,
+            estimator: Any,
+            triangle: Triangle
+    ) -> Triangle:
+        """
+        Returns the triangle transformed by the estimator fitted to it, fitting it on a miss.
+        """
+
+        return self.get_or_fit(
+            key=('fit_transform', estimator_key(estimator=estimator), triangle_fingerprint(triangle=triangle)),
+            fit=lambda: estimator.fit_transform(triangle)
+        )
+
+    def get_or_fit(
+            self,
+            key: Hashable,
+            fit: Callable[[], Any]
+    ) -> Any:
+
+        with self.lock:
+            result = self.entries.get(key)
+
+            if result is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+            self.misses += 1
+
+        # Fitted outside the lock, so that other threads are not held up by a slow fit.
+        result = fit()
+
+        with self.lock:
+            self.entries[key] = result
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+
+        with self.lock:
+            self.entries.clear()
+
+
+def read_model_cache_size(
+        config_path: str = CONFIG_PATH
+) -> int:
+    """
+    Returns the number of fitted models to keep, from the CACHE section of the configuration file.
+    """
+
+    config = configparser.ConfigParser()
+
+    if os.path.exists(config_path):
+        config.read(config_path)
+
+    if not config.has_section('CACHE'):
+        return MODEL_CACHE_SIZE
+
+    return config['CACHE'].getint('model_cache_size', fallback=MODEL_CACHE_SIZE)
+
+
+# Cache shared by the whole application, created on first use.
+_model_cache = None
+
+
+def get_model_cache() -> ModelCache:
+    global _model_cache
+
+    if _model_cache is None:
+        _model_cache = ModelCache(max_entries=read_model_cache_size())
+
+    return _model_cache
@@ -1,9 +1,58 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import time
+
+from faslr.constants import (
+    BULK_INSERT_BATCH_SIZE,
+    CELL_KEY_COLUMNS,
+    GRAIN_MONTHS,
+    PERIOD_KEY_GRAINS,
+    PROJECT_VIEW_COLUMNS,
+    PROJECT_VIEW_PAGE_SIZE,
+    SNAPSHOT_FORMAT_VERSION,
+    VIEW_DATA_COLUMNS
+)
+
 from faslr.schema import (
-    LocationTable
+    CountryTable,
+    LOBTable,
+    LocationTable,
+    ProjectTable,
+    ProjectViewData,
+    ProjectViewSnapshot,
+    ProjectViewTable,
+    StateTable
 )
 
+from faslr.utilities.snapshot import (
+    snapshot_to_triangle,
+    triangle_to_snapshot
+)
+
+from sqlalchemy import (
+    and_,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    union,
+    update
+)
 from sqlalchemy.orm import Session
 
+from typing import (
+    Callable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+    from pandas import DataFrame
+    from sqlalchemy.engine.base import Connection
+
 
 def delete_country(
         country_id: int,
@@ -13,3 +62,514 @@ def delete_country(
     country = session.query(LocationTable).filter(LocationTable.location_id == country_id).one()
     session.delete(country)
     session.commit()
+
+
+def delete_project_node(
+        session: Session,
+        project_id: str
+) -> list:
+    """
+    Deletes a country, state or LOB together with everything beneath it in the project hierarchy. Countries and
+    states are removed with a single DELETE on their locations, and the country, state and LOB rows that hang off
+    them are removed by the ON DELETE CASCADE foreign keys. LOBs have no location of their own, so they are deleted
+    directly. The project rows of the deleted nodes are then removed, detaching any views that pointed to them.
+
+    Returns the project ids that were deleted. The caller owns the transaction.
+    """
+
+    # Locations of the node, if it is a country or a state, and of the states of a country.
+    country_locations = select(CountryTable.location_id).where(CountryTable.project_id == project_id)
+    country_ids = select(CountryTable.country_id).where(CountryTable.project_id == project_id)
+    state_locations = select(StateTable.location_id).where(
+        or_(
+            StateTable.project_id == project_id,
+            StateTable.country_id.in_(country_ids)
+        )
+    )
+    locations = union(country_locations, state_locations)
+
+    # Collect the project ids up front, since the cascade removes the rows that hold them.
+    project_ids = session.execute(
+        union(
+            select(CountryTable.project_id).where(CountryTable.project_id == project_id),
+            select(StateTable.project_id).where(StateTable.location_id.in_(state_locations)),
+            select(LOBTable.project_id).where(
+                or_(
+                    LOBTable.project_id == project_id,
+                    LOBTable.location_id.in_(state_locations)
+                )
+            )
+        )
+    ).scalars().all()
+
+    if not project_ids:
+        return []
+
+    session.execute(
+        delete(LocationTable).where(LocationTable.location_id.in_(locations))
+    )
+
+    session.execute(
+        delete(LOBTable).where(LOBTable.project_id == project_id)
+    )
+
+    session.execute(
+        update(ProjectViewTable).where(
+            ProjectViewTable.project_id.in_(project_ids)
+        ).values(project_id=None)
+    )
+
+    session.execute(
+        delete(ProjectTable).where(ProjectTable.project_id.in_(project_ids))
+    )
+
+    return project_ids
+
+
+def fetch_countries(
+        session: Session
+) -> list:
+    """
+    Fetches the id, name and project uuid of each country, in insertion order.
+    """
+
+    countries = session.query(
+        CountryTable.country_id,
+        CountryTable.country_name,
+        CountryTable.project_id
+    ).order_by(
+        CountryTable.country_id
+    ).all()
+
+    return countries
+
+
+def fetch_states(
+        session: Session,
+        country_id: int
+) -> list:
+    """
+    Fetches the location id, name and project uuid of each state of a country, in insertion order. The location id
+    is returned instead of the state id because that is what the LOBs of the state refer to.
+    """
+
+    states = session.query(
+        StateTable.location_id,
+        StateTable.state_name,
+        StateTable.project_id
+    ).filter(
+        StateTable.country_id == country_id
+    ).order_by(
+        StateTable.state_id
+    ).all()
+
+    return states
+
+
+def fetch_lobs(
+        session: Session,
+        location_id: int
+) -> list:
+    """
+    Fetches the id, type and project uuid of each LOB at a state location, in insertion order.
+    """
+
+    lobs = session.query(
+        LOBTable.lob_id,
+        LOBTable.lob_type,
+        LOBTable.project_id
+    ).filter(
+        LOBTable.location_id == location_id
+    ).order_by(
+        LOBTable.lob_id
+    ).all()
+
+    return lobs
+
+
+def date_range_filter(
+        column,
+        date_range: tuple
+):
+    """
+    Returns the conditions that keep a datetime column within a (start, end) range of dates, both inclusive. Either
+    end may be None to leave the range open on that side.
+    """
+
+    start, end = date_range
+    conditions = []
+
+    if start is not None:
+        conditions.append(column >= dt.datetime.combine(start, dt.time.min))
+
+    if end is not None:
+        # Times on the end date are within the range.
+        conditions.append(column < dt.datetime.combine(end + dt.timedelta(days=1), dt.time.min))
+
+    return conditions
+
+
+def filter_project_views(
+        query,
+        project_id: str,
+        name_filter: str = None,
+        created_range: tuple = None,
+        modified_range: tuple = None
+):
+    """
+    Restricts a query on the project_view table to the views of one project, optionally keeping only those whose
+    name or description contains name_filter, and those created or modified within a (start, end) range of dates.
+    """
+
+    query = query.filter(ProjectViewTable.project_id == project_id)
+
+    if name_filter:
+        # Wildcards typed by the user are matched literally.
+        escaped = name_filter.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        pattern = "%" + escaped + "%"
+        query = query.filter(
+            or_(
+                ProjectViewTable.name.like(pattern, escape='\\'),
+                ProjectViewTable.description.like(pattern, escape='\\')
+            )
+        )
+
+    if created_range is not None:
+        query = query.filter(*date_range_filter(column=ProjectViewTable.created, date_range=created_range))
+
+    if modified_range is not None:
+        query = query.filter(*date_range_filter(column=ProjectViewTable.modified, date_range=modified_range))
+
+    return query
+
+
+def count_project_views(
+        session: Session,
+        project_id: str,
+        name_filter: str = None,
+        created_range: tuple = None,
+        modified_range: tuple = None
+) -> int:
+    """
+    Counts the views of a project that match the filter.
+    """
+
+    query = filter_project_views(
+        query=session.query(func.count(ProjectViewTable.view_id)),
+        project_id=project_id,
+        name_filter=name_filter,
+        created_range=created_range,
+        modified_range=modified_range
+    )
+
+    return query.scalar()
+
+
+def fetch_project_views(
+        session: Session,
+        project_id: str,
+        sort_column: str = 'view_id',
+        descending: bool = False,
+        name_filter: str = None,
+        created_range: tuple = None,
+        modified_range: tuple = None,
+        limit: int = PROJECT_VIEW_PAGE_SIZE,
+        offset: int = 0
+) -> list:
+    """
+    Fetches one page of the views of a project, sorted and filtered in the database. Each row holds the
+    PROJECT_VIEW_COLUMNS of a view. The view id breaks ties, so that pages do not overlap when sorting on a column
+    with repeated values.
+    """
+
+    if sort_column not in PROJECT_VIEW_COLUMNS:
+        raise ValueError("Cannot sort project views on %s." % sort_column)
+
+    columns = [getattr(ProjectViewTable, column) for column in PROJECT_VIEW_COLUMNS]
+    order = getattr(ProjectViewTable, sort_column)
+    tie_breaker = ProjectViewTable.view_id
+
+    if descending:
+        order = order.desc()
+        tie_breaker = tie_breaker.desc()
+
+    query = filter_project_views(
+        query=session.query(*columns),
+        project_id=project_id,
+        name_filter=name_filter,
+        created_range=created_range,
+        modified_range=modified_range
+    ).order_by(
+        order,
+        tie_breaker
+    ).limit(
+        limit
+    ).offset(
+        offset
+    )
+
+    return query.all()
+
+
+def view_period_grains(
+        session: Session,
+        view_id: int
+) -> (str, str) | None:
+    """
+    Infers the grain of the origin and calendar periods stored for a view from the number of digits of their
+    integer keys, see PERIOD_KEY_GRAINS. Returns None if the view is keyed by something else, such as date strings.
+    """
+
+    origin, calendar = session.query(
+        func.max(ProjectViewData.accident_year),
+        func.max(ProjectViewData.calendar_year)
+    ).filter(
+        ProjectViewData.view_id == view_id
+    ).one()
+
+    if origin is None or calendar is None:
+        raise ValueError("View %s has no data." % view_id)
+
+    grains = []
+
+    # SQLite sorts text after integers, so the maximum is text if any key is.
+    for key in [origin, calendar]:
+        if not isinstance(key, int) or len(str(key)) not in PERIOD_KEY_GRAINS:
+            return None
+
+        grains.append(PERIOD_KEY_GRAINS[len(str(key))])
+
+    return grains[0], grains[1]
+
+
+def fetch_view_rows(
+        session: Session,
+        view_id: int
+) -> list:
+    """
+    Fetches the stored rows of a view as they are, for views whose periods are not integer period keys and are
+    parsed by chainladder instead.
+    """
+
+    rows = session.query(
+        ProjectViewData.accident_year,
+        ProjectViewData.calendar_year,
+        ProjectViewData.paid_loss,
+        ProjectViewData.reported_loss
+    ).filter(
+        ProjectViewData.view_id == view_id
+    ).all()
+
+    return rows
+
+
+def period_start_month(
+        column,
+        grain: str
+):
+    """
+    SQL expression for the month key, i.e., year * 12 + month - 1, of the first month of an integer period key.
+    """
+
+    if grain == 'Annual':
+        return column * 12
+    elif grain == 'Quarterly':
+        return (column // 10) * 12 + (column % 10 - 1) * 3
+    else:
+        return (column // 100) * 12 + column % 100 - 1
+
+
+def fetch_view_cells(
+        session: Session,
+        view_id: int,
+        origin_grain: str = None,
+        development_grain: str = None,
+        cumulative: bool = True
+) -> list:
+    """
+    Fetches the paid and reported losses of a view summed into origin x calendar period cells at the requested
+    grains, which default to the grains the view was stored at. The grain conversion and summing are done by the
+    database with integer period math, so only the aggregated cells are returned.
+
+    Each row holds the month key of the first month of the origin period, the month key of the last month of the
+    calendar period, and the summed values. Cumulative values are taken at the last stored calendar period within
+    each requested calendar period, rather than summed across it.
+    """
+
+    grains = view_period_grains(
+        session=session,
+        view_id=view_id
+    )
+
+    if grains is None:
+        raise ValueError("View %s is not keyed by integer periods." % view_id)
+
+    stored_origin_grain, stored_development_grain = grains
+
+    origin_grain = origin_grain or stored_origin_grain
+    development_grain = development_grain or stored_development_grain
+
+    if GRAIN_MONTHS[origin_grain] < GRAIN_MONTHS[stored_origin_grain] or \
+            GRAIN_MONTHS[development_grain] < GRAIN_MONTHS[stored_development_grain]:
+        raise ValueError("A view cannot be opened at a finer grain than it was stored at.")
+
+    if GRAIN_MONTHS[development_grain] > GRAIN_MONTHS[origin_grain]:
+        raise ValueError("The development grain cannot be coarser than the origin grain.")
+
+    origin_months = GRAIN_MONTHS[origin_grain]
+    development_months = GRAIN_MONTHS[development_grain]
+
+    origin_period = period_start_month(
+        column=ProjectViewData.accident_year,
+        grain=stored_origin_grain
+    ) // origin_months
+
+    # Calendar periods are placed by their last month.
+    calendar_end = period_start_month(
+        column=ProjectViewData.calendar_year,
+        grain=stored_development_grain
+    ) + GRAIN_MONTHS[stored_development_grain] - 1
+
+    development_period = calendar_end // development_months
+
+    query = select(
+        (origin_period * origin_months).label('origin'),
+        (development_period * development_months + development_months - 1).label('valuation'),
+        func.sum(ProjectViewData.paid_loss).label('paid_loss'),
+        func.sum(ProjectViewData.reported_loss).label('reported_loss')
+    ).where(
+        ProjectViewData.view_id == view_id
+    )
+
+    if cumulative:
+        # Last stored calendar period of each origin period within each requested calendar period.
+        latest = select(
+            ProjectViewData.accident_year,
+            func.max(ProjectViewData.calendar_year).label('calendar_year')
+        ).where(
+            ProjectViewData.view_id == view_id
+        ).group_by(
+            ProjectViewData.accident_year,
+            development_period
+        ).subquery()
+
+        query = query.join(
+            latest,
+            and_(
+                ProjectViewData.accident_year == latest.c.accident_year,
+                ProjectViewData.calendar_year == latest.c.calendar_year
+            )
+        )
+
+    query = query.group_by(
+        origin_period,
+        development_period
+    ).order_by(
+        origin_period,
+        development_period
+    )
+
+    return session.execute(query).all()
+
+
+def fetch_view_snapshot(
+        session: Session,
+        view_id: int
+) -> Triangle | None:
+    """
+    Returns the triangle stored in the snapshot of a view, or None if the view has no snapshot in the current
+    format.
+    """
+
+    snapshot = session.query(
+        ProjectViewSnapshot.data
+    ).filter(
+        ProjectViewSnapshot.view_id == view_id,
+        ProjectViewSnapshot.format_version == SNAPSHOT_FORMAT_VERSION
+    ).scalar()
+
+    if snapshot is None:
+        return None
+
+    return snapshot_to_triangle(snapshot=snapshot)
+
+
+def save_view_snapshot(
+        session: Session,
+        view_id: int,
+        triangle: Triangle
+) -> None:
+    """
+    Stores the finished triangle of a view, replacing any earlier snapshot. Does not commit.
+    """
+
+    session.merge(
+        ProjectViewSnapshot(
+            view_id=view_id,
+            origin_grain=triangle.origin_grain,
+            development_grain=triangle.development_grain,
+            shape=','.join(str(n) for n in triangle.shape),
+            format_version=SNAPSHOT_FORMAT_VERSION,
+            data=triangle_to_snapshot(triangle=triangle)
+        )
+    )
+
+
+def bulk_insert_view_data(
+        connection: Connection,
+        data: DataFrame,
+        view_id: int,
+        batch_size: int = BULK_INSERT_BATCH_SIZE,
+        progress_callback: Callable[[int, int], None] = None
+) -> (int, float):
+    """
+    Writes long-format triangle data straight into the project_view_data table. Rows are sent in batches
+    through a Core insert (executemany) instead of being turned into ProjectViewData objects. The caller
+    owns the transaction, so the whole import commits or rolls back as one unit.
+
+    The columns of data should already be named after the project_view_data columns. Rows that fall in the same
+    origin/calendar cell are summed first, the same way chainladder aggregates them when building a triangle, since
+    a view holds one row per cell. The progress callback, if supplied, receives the number of rows written so far
+    and the total number of rows.
+
+    Returns the number of rows written and the throughput in rows per second.
+    """
+
+    columns = [column for column in VIEW_DATA_COLUMNS if column in data.columns]
+    keys = [column for column in CELL_KEY_COLUMNS if column in columns]
+
+    if keys and data.duplicated(subset=keys).any():
+        data = data.groupby(
+            keys,
+            as_index=False,
+            sort=False
+        )[[column for column in columns if column not in keys]].sum(min_count=1)
+
+    n_rows = data.shape[0]
+    statement = insert(ProjectViewData.__table__)
+
+    start = time.perf_counter()
+
+    for batch_start in range(0, n_rows, batch_size):
+        batch = data.iloc[batch_start:batch_start + batch_size]
+
+        # tolist() converts numpy scalars to native Python types, which the sqlite3 driver can bind.
+        values = zip(*[batch[column].tolist() for column in columns])
+        records = [dict(zip(columns, row), view_id=view_id) for row in values]
+
+        connection.execute(
+            statement,
+            records
+        )
+
+        if progress_callback:
+            progress_callback(batch_start + batch.shape[0], n_rows)
+
+    elapsed = time.perf_counter() - start
+    rows_per_second = n_rows / elapsed if elapsed > 0 else float(n_rows)
+
+    logging.info(
+        "Inserted %d rows into project_view_data for view %s (%.0f rows/s)." % (n_rows, view_id, rows_per_second)
+    )
+
+    return n_rows, rows_per_second
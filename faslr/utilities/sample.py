@@ -1,8 +1,10 @@
-import chainladder as cl
 import pandas as pd
 import os
 from chainladder import Triangle
 
+from faslr.utilities.aggregation import build_triangle
+from faslr.utilities.cache import get_triangle_cache
+
 
 samples = {
     'mack97': 'mack_1997.csv',
@@ -29,6 +31,10 @@ auto_bi_olep = [
 def load_sample(
         sample_name: str
 ) -> Triangle:
+    """
+    Loads one of the sample triangles shipped in faslr/samples. Triangles are cached by file path and modification
+    time, so each csv file is only parsed once.
+    """
 
     path = os.path.dirname(os.path.abspath(__file__))
 
@@ -40,27 +46,34 @@ def load_sample(
         return joined
 
     try:
-        df_csv = pd.read_csv(
-            join_path(samples[sample_name])
-        )
+        file_path = os.path.normpath(join_path(samples[sample_name]))
     except KeyError:
         raise Exception("Invalid sample name.")
 
-    if sample_name != "mack97":
-        triangle = cl.Triangle(
-            data=df_csv,
-            origin='Accident Year',
-            development='Calendar Year',
-            columns=['Paid Claims', 'Reported Claims'],
-            cumulative=True
-        )
-    else:
-        triangle = cl.Triangle(
-            data=df_csv,
-            origin='Accident Year',
-            development='Calendar Year',
-            columns=['Case Incurred'],
-            cumulative=True
-        )
+    def build() -> Triangle:
+
+        df_csv = pd.read_csv(file_path)
+
+        if sample_name != "mack97":
+            triangle = build_triangle(
+                data=df_csv,
+                origin='Accident Year',
+                development='Calendar Year',
+                columns=['Paid Claims', 'Reported Claims'],
+                cumulative=True
+            )
+        else:
+            triangle = build_triangle(
+                data=df_csv,
+                origin='Accident Year',
+                development='Calendar Year',
+                columns=['Case Incurred'],
+                cumulative=True
+            )
+
+        return triangle
 
-    return triangle
+    return get_triangle_cache().get_or_build(
+        key=('sample', file_path, os.path.getmtime(file_path)),
+        build=build
+    )
@@ -0,0 +1,85 @@
+"""
+Serializes finished triangles into compressed npz blobs for the project_view_snapshot table, so that a view can be
+opened by decompressing its arrays instead of rebuilding the triangle from its long-format rows.
+
+A snapshot holds the index x columns x origin x development values array along with the labels of each axis and
+the properties needed to restore the Triangle, such as its grains and valuation date. Everything is stored as plain
+numpy arrays, so the blobs are read without unpickling, and index and column labels are stored as strings.
+"""
+from __future__ import annotations
+
+import io
+
+import numpy as np
+import pandas as pd
+
+from chainladder import Triangle
+from chainladder.core.slice import VirtualColumns
+
+from faslr.constants import SNAPSHOT_FORMAT_VERSION
+
+
+def triangle_to_snapshot(
+        triangle: Triangle
+) -> bytes:
+    """
+    Compresses the values and metadata of a development triangle into an npz blob.
+    """
+
+    triangle = triangle.set_backend('numpy')
+
+    buffer = io.BytesIO()
+
+    np.savez_compressed(
+        buffer,
+        version=np.array(SNAPSHOT_FORMAT_VERSION),
+        values=np.asarray(triangle.values, dtype=np.float64),
+        kdims=np.asarray(triangle.kdims, dtype=str),
+        vdims=np.asarray(triangle.vdims, dtype=str),
+        odims=np.asarray(triangle.odims, dtype='datetime64[ns]'),
+        ddims=np.asarray(triangle.ddims),
+        key_labels=np.asarray(triangle.key_labels, dtype=str),
+        origin_grain=np.array(triangle.origin_grain),
+        development_grain=np.array(triangle.development_grain),
+        origin_close=np.array(triangle.origin_close),
+        valuation_date=np.array(triangle.valuation_date.to_datetime64(), dtype='datetime64[ns]'),
+        is_cumulative=np.array(bool(triangle.is_cumulative)),
+        is_pattern=np.array(bool(triangle.is_pattern))
+    )
+
+    return buffer.getvalue()
+
+
+def snapshot_to_triangle(
+        snapshot: bytes
+) -> Triangle:
+    """
+    Restores a Triangle from an npz blob written by triangle_to_snapshot, assigning the decompressed arrays
+    directly instead of passing long-format data through the Triangle constructor.
+    """
+
+    with np.load(io.BytesIO(snapshot), allow_pickle=False) as arrays:
+
+        if int(arrays['version']) != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError("Unsupported triangle snapshot version %s." % arrays['version'])
+
+        triangle = Triangle()
+
+        triangle.values = arrays['values']
+        triangle.kdims = arrays['kdims'].astype(object)
+        triangle.vdims = arrays['vdims'].astype(object)
+        triangle.odims = arrays['odims']
+        triangle.ddims = arrays['ddims']
+        triangle.key_labels = arrays['key_labels'].tolist()
+        triangle.origin_grain = str(arrays['origin_grain'])
+        triangle.development_grain = str(arrays['development_grain'])
+        triangle.origin_close = str(arrays['origin_close'])
+        triangle.valuation_date = pd.Timestamp(arrays['valuation_date'][()])
+        triangle.is_cumulative = bool(arrays['is_cumulative'])
+        triangle.is_pattern = bool(arrays['is_pattern'])
+
+    triangle.array_backend = 'numpy'
+    triangle.virtual_columns = VirtualColumns(triangle)
+    triangle._set_slicers() # noqa
+
+    return triangle
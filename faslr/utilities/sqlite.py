@@ -0,0 +1,91 @@
+"""
+Reads the SQLite performance profile from the configuration file and applies its pragmas to new connections.
+"""
+import configparser
+import logging
+import os
+
+from faslr.constants import (
+    CONFIG_PATH,
+    DEFAULT_SQLITE_PROFILE,
+    SQLITE_PROFILES
+)
+
+# Cached result of read_sqlite_pragmas(), so that the configuration file is not parsed on every new connection.
+_pragmas = None
+
+
+def read_sqlite_pragmas(
+        config_path: str = CONFIG_PATH
+) -> dict:
+    """
+    Returns the pragmas of the profile named in the DATABASE section of the configuration file. Keys in that
+    section that match a pragma name override the value of the profile. Falls back to the default profile if the
+    file or section does not exist.
+    """
+    config = configparser.ConfigParser()
+
+    if os.path.exists(config_path):
+        config.read(config_path)
+
+    if config.has_section('DATABASE'):
+        section = config['DATABASE']
+    else:
+        section = {}
+
+    profile_name = section.get('performance_profile', DEFAULT_SQLITE_PROFILE)
+
+    if profile_name not in SQLITE_PROFILES:
+        logging.warning("Unknown SQLite profile %s, using %s instead." % (profile_name, DEFAULT_SQLITE_PROFILE))
+        profile_name = DEFAULT_SQLITE_PROFILE
+
+    pragmas = dict(SQLITE_PROFILES[profile_name])
+
+    for pragma in pragmas.keys():
+        if pragma in section:
+            pragmas[pragma] = section[pragma]
+
+    return pragmas
+
+
+def get_sqlite_pragmas() -> dict:
+    """
+    Returns the pragmas of the active profile, reading the configuration file on first use.
+    """
+    global _pragmas
+
+    if _pragmas is None:
+        _pragmas = read_sqlite_pragmas()
+
+    return _pragmas
+
+
+def reset_sqlite_pragmas() -> None:
+    """
+    Discards the cached pragmas, so that connections opened afterwards pick up changes to the configuration file.
+    """
+    global _pragmas
+
+    _pragmas = None
+
+
+def apply_sqlite_pragmas(
+        dbapi_connection,
+        pragmas: dict
+) -> None:
+    """
+    Executes each pragma on a raw DBAPI connection.
+    """
+    cursor = dbapi_connection.cursor()
+
+    for pragma, value in pragmas.items():
+        value = str(value)
+
+        # Values come from a user-editable file, only allow plain words and integers through.
+        if not value.lstrip('-').isalnum():
+            logging.warning("Ignoring invalid value %s for PRAGMA %s." % (value, pragma))
+            continue
+
+        cursor.execute("PRAGMA %s=%s" % (pragma, value))
+
+    cursor.close()
@@ -0,0 +1,106 @@
+"""
+Runs slow work, such as reading from the database or building triangles, on the global thread pool so that the
+main window stays responsive. Results are delivered back to the GUI thread by signal.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import traceback
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal
+)
+
+from typing import Callable
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker. Since the signals object lives on the GUI thread, connected slots run there too.
+    """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    # Amount of work done and total amount of work, e.g., bytes of a file read so far and the size of the file.
+    progress = pyqtSignal('qint64', 'qint64')
+
+
+class Worker(QRunnable):
+    """
+    Calls fn(*args, **kwargs) on a pool thread and emits its return value through signals.finished, or the
+    formatted exception through signals.error. A cancelled worker does not call fn if it has not started yet and
+    never emits, so its receivers can be deleted safely once cancel() has been called.
+
+    If report_progress is True, fn is also passed a progress_callback, which emits signals.progress, and a cancelled
+    callable, which fn can poll to stop early.
+    """
+    def __init__(
+            self,
+            fn: Callable,
+            *args,
+            report_progress: bool = False,
+            **kwargs
+    ):
+        super().__init__()
+
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+        if report_progress:
+            self.kwargs['progress_callback'] = self.emit_progress
+            self.kwargs['cancelled'] = self.is_cancelled
+
+        self.signals = WorkerSignals()
+
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def emit_progress(
+            self,
+            done: int,
+            total: int
+    ) -> None:
+
+        if not self.is_cancelled():
+            self.signals.progress.emit(done, total) # noqa
+
+    def run(self) -> None:
+
+        if self.is_cancelled():
+            return
+
+        try:
+            result = self.fn(
+                *self.args,
+                **self.kwargs
+            )
+        except Exception: # noqa
+            message = traceback.format_exc()
+            logging.error(message)
+
+            if not self.is_cancelled():
+                self.signals.error.emit(message) # noqa
+        else:
+            if not self.is_cancelled():
+                self.signals.finished.emit(result) # noqa
+
+
+def start_worker(
+        worker: Worker
+) -> Worker:
+    """
+    Queues a worker on the global thread pool and returns it, so that the caller can keep a reference and cancel it.
+    """
+
+    QThreadPool.globalInstance().start(worker)
+
+    return worker